@@ -0,0 +1,286 @@
+"""
+Asyncio front end to the task manager, for use inside agent tools.
+"""
+
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Callable, Iterable, List, Optional, Tuple
+from events import EventType, Subscription, TaskEvent
+from task import Task, TaskStatus, TaskPriority
+from task_manager import TaskManager
+
+# Storage hooks TaskManager may call to persist a change
+_WRITE_HOOKS = ("add_task", "update_task", "delete_task", "write_batch")
+
+
+class _QueuedStorage:
+    """
+    Storage front that queues writes instead of performing them.
+    
+    TaskManager changes its in-memory state and then calls the storage;
+    this front turns that call into a queue entry and returns at once, so
+    the change is visible to reads before it reaches the disk. Only the
+    write hooks the real storage has are exposed, and none of its lazy
+    loading or SQL query hooks, so every read is answered from memory and
+    the storage itself is only ever touched by the I/O thread.
+    """
+    
+    def __init__(self, storage, queue: asyncio.Queue):
+        """
+        Initialize the front.
+        
+        Args:
+            storage: The real storage
+            queue: Queue receiving ``(method name, args, future)`` entries
+        """
+        self.storage = storage
+        self._queue = queue
+        # Future of the latest queued write, resolved once it is on disk
+        self.pending: Optional[asyncio.Future] = None
+    
+    def load_tasks(self) -> List[Task]:
+        """Load tasks from the real storage (called on the I/O thread)."""
+        return self.storage.load_tasks()
+    
+    def save_tasks(self, tasks: List[Task]):
+        """
+        Queue a full save.
+        
+        The tasks are not copied: a save that races a later change may
+        write part of it, but that change queues its own save behind it.
+        """
+        self._enqueue("save_tasks", list(tasks))
+    
+    def __getattr__(self, name: str):
+        if name in _WRITE_HOOKS and hasattr(self.storage, name):
+            return partial(self._queue_change, name)
+        raise AttributeError(name)
+    
+    def _queue_change(self, name: str, arg):
+        """Queue a single-task or batch change, copying the tasks as they are now."""
+        if name == "write_batch":
+            arg = [(op, copy.copy(task)) for op, task in arg]
+        elif name != "delete_task":
+            arg = copy.copy(arg)
+        self._enqueue(name, arg)
+    
+    def _enqueue(self, name: str, arg):
+        self.pending = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((name, arg, self.pending))
+
+
+class AsyncTaskManager:
+    """
+    Awaitable task manager that keeps disk I/O off the event loop.
+    
+    Tasks live in memory as in TaskManager. Reads are answered from memory
+    straight away and never wait for disk. Writes update memory first and
+    then queue the storage call. A single writer coroutine drains the queue
+    in order and runs the calls on a dedicated one-thread executor, which is
+    the only thread that touches the storage. Consecutive full saves still
+    queued are collapsed into the last one. A write returns once its change
+    is on disk.
+    
+    Create instances with ``await AsyncTaskManager.open(storage)`` and
+    ``await manager.close()`` them when done.
+    """
+    
+    def __init__(self, manager: TaskManager, storage: _QueuedStorage,
+                 executor: ThreadPoolExecutor, owns_executor: bool):
+        """Use AsyncTaskManager.open instead."""
+        self._manager = manager
+        self._storage = storage
+        self._queue = storage._queue
+        self._executor = executor
+        self._owns_executor = owns_executor
+        # Serializes mutations so that an open batch never picks up
+        # changes made by other coroutines
+        self._write_lock = asyncio.Lock()
+        self._writer = asyncio.ensure_future(self._drain())
+    
+    @classmethod
+    async def open(cls, storage, columnar: bool = False,
+                   executor: Optional[ThreadPoolExecutor] = None) -> "AsyncTaskManager":
+        """
+        Load tasks and start the writer.
+        
+        Args:
+            storage: Storage implementation (FileStorage, DatabaseStorage, etc.)
+            columnar: Use the NumPy-backed TaskTable (see TaskManager)
+            executor: Executor for storage I/O. It must run one call at a
+                time; by default a dedicated single-thread executor is used.
+        
+        Returns:
+            The ready manager
+        """
+        owns_executor = executor is None
+        if owns_executor:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-io")
+        queued = _QueuedStorage(storage, asyncio.Queue())
+        loop = asyncio.get_running_loop()
+        manager = await loop.run_in_executor(executor, partial(TaskManager, queued, columnar=columnar))
+        return cls(manager, queued, executor, owns_executor)
+    
+    async def close(self):
+        """Wait for queued writes, stop the writer and close the storage."""
+        self._queue.put_nowait(None)
+        await self._writer
+        close = getattr(self._storage.storage, "close", None)
+        if close is not None:
+            await asyncio.get_running_loop().run_in_executor(self._executor, close)
+        if self._owns_executor:
+            self._executor.shutdown()
+    
+    async def flush(self):
+        """Wait until every write queued so far is on disk."""
+        if self._storage.pending is not None:
+            await asyncio.shield(self._storage.pending)
+    
+    async def _drain(self):
+        """Run queued writes in order on the I/O executor."""
+        loop = asyncio.get_running_loop()
+        while True:
+            entries = [await self._queue.get()]
+            while not self._queue.empty():
+                entries.append(self._queue.get_nowait())
+            stopping = entries[-1] is None
+            entries = [entry for entry in entries if entry is not None]
+            
+            for index, (name, arg, future) in enumerate(entries):
+                later = entries[index + 1] if index + 1 < len(entries) else None
+                if name == "save_tasks" and later is not None and later[0] == "save_tasks":
+                    # Superseded by the next full save, which also settles this future
+                    later[2].add_done_callback(partial(_copy_outcome, future))
+                    continue
+                try:
+                    await loop.run_in_executor(self._executor, getattr(self._storage.storage, name), arg)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(None)
+            if stopping:
+                return
+    
+    async def _write(self, method, *args, **kwargs):
+        """Apply a TaskManager mutation in memory, then wait for it to be saved."""
+        async with self._write_lock:
+            await self._wait_for_subscribers()
+            before = self._storage.pending
+            result = method(*args, **kwargs)
+            pending = self._storage.pending
+        if pending is not before:
+            await asyncio.shield(pending)
+        return result
+    
+    async def add_task(self, title: str, description: str = "",
+                       priority: TaskPriority = TaskPriority.MEDIUM,
+                       due_date: Optional[str] = None) -> Task:
+        """Create and save a new task (see TaskManager.add_task)."""
+        return await self._write(self._manager.add_task, title, description, priority, due_date)
+    
+    async def add_tasks(self, tasks: Iterable[dict]) -> List[Task]:
+        """Create several tasks with a single write (see TaskManager.add_tasks)."""
+        return await self._write(self._manager.add_tasks, list(tasks))
+    
+    async def update_task(self, task_id: str, **kwargs) -> Optional[Task]:
+        """Update and save a task (see TaskManager.update_task)."""
+        return await self._write(self._manager.update_task, task_id, **kwargs)
+    
+    async def update_many(self, task_ids: Iterable[str], **kwargs) -> List[Task]:
+        """Update several tasks with a single write (see TaskManager.update_many)."""
+        return await self._write(self._manager.update_many, list(task_ids), **kwargs)
+    
+    async def delete_task(self, task_id: str) -> bool:
+        """Delete a task (see TaskManager.delete_task)."""
+        return await self._write(self._manager.delete_task, task_id)
+    
+    async def delete_many(self, task_ids: Iterable[str]) -> int:
+        """Delete several tasks with a single write (see TaskManager.delete_many)."""
+        return await self._write(self._manager.delete_many, list(task_ids))
+    
+    @asynccontextmanager
+    async def batch(self):
+        """
+        Group changes into one all-or-nothing write.
+        
+        The body makes its changes through the yielded TaskManager, whose
+        mutations are synchronous and only touch memory; they are saved
+        together when the block exits, and undone if it raises. Other
+        coroutines' writes wait until the batch is over, but reads don't.
+        
+        Yields:
+            The underlying TaskManager
+        """
+        async with self._write_lock:
+            await self._wait_for_subscribers()
+            before = self._storage.pending
+            with self._manager.batch():
+                yield self._manager
+            pending = self._storage.pending
+        if pending is not before:
+            await asyncio.shield(pending)
+    
+    def subscribe(self, callback: Optional[Callable[[TaskEvent], None]] = None,
+                  types: Optional[Iterable[EventType]] = None,
+                  maxsize: int = 1000, overflow: str = "drop_oldest") -> Subscription:
+        """
+        Subscribe to task changes (see TaskManager.subscribe).
+        
+        Events are published as soon as a change is made in memory, before
+        it reaches the disk. Writes wait for room in subscriptions with the
+        "block" overflow policy, so a slow consumer slows writers down
+        instead of losing events.
+        """
+        return self._manager.subscribe(callback, types, maxsize, overflow)
+    
+    async def _wait_for_subscribers(self):
+        """Wait until every blocking subscription has room for more events."""
+        for subscription in list(self._manager._subscriptions):
+            if subscription.overflow == "block":
+                await subscription.wait_for_room()
+    
+    async def get_task(self, task_id: str) -> Optional[Task]:
+        """Get a task by ID (see TaskManager.get_task)."""
+        return self._manager.get_task(task_id)
+    
+    async def resolve_task_id(self, prefix: str) -> Optional[str]:
+        """Resolve a shortened task ID (see TaskManager.resolve_task_id)."""
+        return self._manager.resolve_task_id(prefix)
+    
+    async def list_tasks(self, status: Optional[TaskStatus] = None,
+                         priority: Optional[TaskPriority] = None,
+                         sort_by: str = "created_at",
+                         limit: Optional[int] = None,
+                         offset: int = 0,
+                         cursor: Optional[str] = None) -> List[Task]:
+        """List tasks (see TaskManager.list_tasks)."""
+        return self._manager.list_tasks(status=status, priority=priority, sort_by=sort_by,
+                                        limit=limit, offset=offset, cursor=cursor)
+    
+    async def list_page(self, status: Optional[TaskStatus] = None,
+                        priority: Optional[TaskPriority] = None,
+                        sort_by: str = "created_at",
+                        limit: int = 20,
+                        cursor: Optional[str] = None) -> Tuple[List[Task], Optional[str]]:
+        """Get one page of a listing (see TaskManager.list_page)."""
+        return self._manager.list_page(status=status, priority=priority, sort_by=sort_by,
+                                       limit=limit, cursor=cursor)
+    
+    async def search_tasks(self, query: str, limit: int = 20) -> List[Task]:
+        """Find tasks by words (see TaskManager.search_tasks)."""
+        return self._manager.search_tasks(query, limit=limit)
+    
+    async def get_statistics(self) -> dict:
+        """Get task statistics (see TaskManager.get_statistics)."""
+        return self._manager.get_statistics()
+
+
+def _copy_outcome(target: asyncio.Future, source: asyncio.Future):
+    """Settle a future the way another one was settled."""
+    if source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(None)
@@ -0,0 +1,110 @@
+"""
+Benchmark event-loop stalls: TaskManager versus AsyncTaskManager.
+
+A heartbeat coroutine ticks every millisecond while updates are written to
+a tasks.json holding many tasks, first by calling TaskManager directly from
+the loop (as a FunctionTool would) and then through AsyncTaskManager. The
+longest gap between ticks is how long every other coroutine was blocked.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_async --tasks 20000 --writes 20
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from async_task_manager import AsyncTaskManager
+from benchmarks.common import generate_tasks
+from storage import FileStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+async def heartbeat(gaps: list, stop: asyncio.Event):
+    """Record the time between ticks of a 1ms timer."""
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def measure(write, read, writes: int):
+    """
+    Run writes concurrently with the heartbeat and reads.
+
+    Returns:
+        Tuple of (total seconds, longest loop stall, slowest read)
+    """
+    # Build the indexes first, so that only writes are measured
+    await read()
+    gaps, stop = [], asyncio.Event()
+    ticker = asyncio.ensure_future(heartbeat(gaps, stop))
+    await asyncio.sleep(0.01)
+    reads = []
+
+    async def reader():
+        while not stop.is_set():
+            start = time.perf_counter()
+            await read()
+            reads.append(time.perf_counter() - start)
+            await asyncio.sleep(0.001)
+
+    reading = asyncio.ensure_future(reader())
+    start = time.perf_counter()
+    await asyncio.gather(*(write(i) for i in range(writes)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await asyncio.gather(ticker, reading)
+    return elapsed, max(gaps), max(reads)
+
+
+async def run(path: str, writes: int):
+    """Measure both managers over the same file."""
+    manager = TaskManager(FileStorage(path))
+    ids = [task.id for task in manager.tasks[:writes]]
+
+    async def sync_write(i):
+        manager.update_task(ids[i], status=TaskStatus.IN_PROGRESS)
+
+    async def sync_read():
+        manager.get_statistics()
+
+    results = {"TaskManager": await measure(sync_write, sync_read, writes)}
+
+    async_manager = await AsyncTaskManager.open(FileStorage(path))
+
+    async def async_write(i):
+        await async_manager.update_task(ids[i], status=TaskStatus.COMPLETED)
+
+    async def async_read():
+        await async_manager.get_statistics()
+
+    results["AsyncTaskManager"] = await measure(async_write, async_read, writes)
+    await async_manager.close()
+    return results
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=20_000, help="number of tasks in the file")
+    parser.add_argument("--writes", type=int, default=20, help="concurrent updates")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        print(f"Writing {args.tasks:,} tasks...")
+        FileStorage(path).save_tasks(generate_tasks(args.tasks))
+        results = asyncio.run(run(path, args.writes))
+
+    print(f"\n{'manager':<20}{'writes':>10}{'max loop stall':>18}{'slowest read':>16}")
+    for label, (elapsed, stall, read) in results.items():
+        print(f"{label:<20}{elapsed * 1000:>8.0f}ms{stall * 1000:>16.1f}ms{read * 1000:>14.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
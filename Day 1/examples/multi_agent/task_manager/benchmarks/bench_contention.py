@@ -0,0 +1,120 @@
+"""
+Benchmark concurrent writer processes sharing one tasks.json.
+
+Runs N processes against the same file, first with the old unlocked
+load-and-overwrite storage and then with FileStorage, and reports
+throughput and how many writes were lost. Two workloads are measured:
+
+- add: each operation starts a fresh TaskManager and adds one task, like
+  separate main.py invocations (a cron job next to a human).
+- update: each process keeps one TaskManager and repeatedly updates its
+  own task, like a long-running session.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_contention --processes 8 --ops 50
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from storage import FileStorage
+from task import Task
+from task_manager import TaskManager
+
+
+class UnsafeFileStorage:
+    """FileStorage as it was before locking: load everything, overwrite in place."""
+    
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+    
+    def load_tasks(self):
+        """Read the file, treating a torn write as an empty store."""
+        try:
+            with open(self.filepath, 'r') as f:
+                return [Task.from_dict(task_dict) for task_dict in json.load(f)]
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+    
+    def save_tasks(self, tasks):
+        """Overwrite the file in place, without locking."""
+        with open(self.filepath, 'w') as f:
+            json.dump([task.to_dict() for task in tasks], f, indent=2)
+
+
+STORAGES = {"unsafe": UnsafeFileStorage, "locked": FileStorage}
+
+
+def add_worker(storage_name: str, path: str, worker: int, ops: int):
+    """Add tasks, each from a freshly loaded manager."""
+    for op in range(ops):
+        TaskManager(STORAGES[storage_name](path)).add_task(f"w{worker}-{op}")
+
+
+def update_worker(storage_name: str, path: str, worker: int, ops: int):
+    """Repeatedly update this worker's own task from one long-lived manager."""
+    manager = TaskManager(STORAGES[storage_name](path))
+    task = next((t for t in manager.tasks if t.title == f"w{worker}"), None)
+    if task is None:
+        # Loaded a half-written file; every update of this worker is lost
+        return
+    for op in range(ops):
+        manager.update_task(task.id, description=str(op))
+
+
+def run(workload: str, storage_name: str, processes: int, ops: int):
+    """
+    Run one workload and count the writes missing from the final file.
+    
+    Returns:
+        Tuple of (operations per second, lost updates)
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        seed = FileStorage(path)
+        if workload == "update":
+            seed.save_tasks([Task(f"w{worker}") for worker in range(processes)])
+        target = add_worker if workload == "add" else update_worker
+        
+        workers = [
+            multiprocessing.Process(target=target, args=(storage_name, path, worker, ops))
+            for worker in range(processes)
+        ]
+        start = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+        
+        tasks = FileStorage(path).load_tasks()
+        if workload == "add":
+            lost = processes * ops - len(tasks)
+        else:
+            # Every task should end up with its worker's last description
+            lost = sum(task.description != str(ops - 1) for task in tasks) + processes - len(tasks)
+    return processes * ops / elapsed, lost
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=8, help="concurrent writer processes")
+    parser.add_argument("--ops", type=int, default=50, help="writes per process")
+    args = parser.parse_args()
+    
+    total = args.processes * args.ops
+    print(f"{args.processes} processes x {args.ops} writes\n")
+    print(f"{'workload':<10}{'storage':<10}{'ops/s':>10}{'lost':>16}")
+    for workload in ["add", "update"]:
+        expected = total if workload == "add" else args.processes
+        for storage_name in STORAGES:
+            throughput, lost = run(workload, storage_name, args.processes, args.ops)
+            print(f"{workload:<10}{storage_name:<10}{throughput:>10.0f}{f'{lost}/{expected}':>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark commands per second: one process per command versus the daemon.
+
+A tasks.json holding many tasks receives the same mix of add and show
+commands four ways: one main.py process per command with no daemon
+running (each one loads the store), one main.py process per command
+acting as a thin client of a running daemon, and commands sent straight
+from this process to the daemon, one at a time and from many concurrent
+clients. The daemon's group commits are counted from its exit message.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_daemon --tasks 10000 --commands 200 --clients 16
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from benchmarks.bench_startup import ENV, MAIN, run_cli
+from benchmarks.common import generate_tasks
+from daemon import DaemonClient
+from storage import FileStorage
+
+
+def command_mix(task_ids, count: int):
+    """Alternate adds with shows of existing tasks."""
+    return [["add", f"Task {i}", "Added by the benchmark"] if i % 2 == 0
+            else ["show", task_ids[i % len(task_ids)]]
+            for i in range(count)]
+
+
+def per_process(directory: str, commands) -> float:
+    """Run each command as its own main.py process, returning commands per second."""
+    start = time.perf_counter()
+    for command in commands:
+        run_cli(directory, command)
+    return len(commands) / (time.perf_counter() - start)
+
+
+def in_process(client: DaemonClient, commands, clients: int) -> float:
+    """Send commands to the daemon from a pool of threads, returning commands per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(clients) as pool:
+        list(pool.map(client.send, commands))
+    return len(commands) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=10_000, help="number of tasks in the store")
+    parser.add_argument("--commands", type=int, default=200, help="commands per measurement")
+    parser.add_argument("--clients", type=int, default=16, help="concurrent clients in the last measurement")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        FileStorage(path).save_tasks(generate_tasks(args.tasks))
+        with open(path) as f:
+            task_ids = [task["id"] for task in json.load(f)]
+        commands = command_mix(task_ids, args.commands)
+
+        results = {"process per command": per_process(directory, commands)}
+
+        daemon = subprocess.Popen([sys.executable, MAIN, "daemon"], cwd=directory, env=ENV,
+                                  stdout=subprocess.PIPE, text=True)
+        socket_path = os.path.join(directory, "tasks.sock")
+        client = None
+        while client is None:
+            time.sleep(0.05)
+            client = DaemonClient.connect(socket_path)
+
+        results["process per command, daemon"] = per_process(directory, commands)
+        results["daemon, 1 client"] = in_process(client, commands, 1)
+        results[f"daemon, {args.clients} clients"] = in_process(client, commands, args.clients)
+        client.stop()
+        summary = daemon.communicate()[0].strip().splitlines()[-1]
+
+    print(f"{args.tasks:,} tasks, {args.commands} commands (half add, half show)\n")
+    print(f"{'method':<36}{'commands/s':>12}")
+    for label, rate in results.items():
+        print(f"{label:<36}{rate:>12,.0f}")
+    print(f"\nDaemon: {summary}")
+
+
+if __name__ == "__main__":
+    main()
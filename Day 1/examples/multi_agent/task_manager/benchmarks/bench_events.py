@@ -0,0 +1,88 @@
+"""
+Benchmark keeping a derived view current: polling listings versus the change feed.
+
+The view is a dashboard's count of tasks per status. The polling consumer
+rebuilds it from list_tasks after every change, as consumers had to
+before the change feed; the subscribed one adjusts it from each event.
+The cost of publishing itself is measured as update throughput with and
+without a subscriber.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_events --tasks 100000 --changes 200
+"""
+
+import argparse
+import random
+import time
+from collections import Counter
+from benchmarks.common import MemoryStorage, generate_tasks
+from events import EventType
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+def status_counts(manager: TaskManager) -> Counter:
+    """Count tasks per status from a full listing."""
+    return Counter(task.status for task in manager.list_tasks())
+
+
+def apply_event(view: Counter, event):
+    """Adjust per-status counts for one event."""
+    if event.type is EventType.CREATED:
+        view[event.task.status] += 1
+    elif event.type is EventType.DELETED:
+        view[event.task.status] -= 1
+    elif "status" in event.changes:
+        old, new = event.changes["status"]
+        view[old] -= 1
+        view[new] += 1
+
+
+def make_changes(manager: TaskManager, task_ids, count: int, after_each):
+    """Update random tasks' statuses, calling after_each after every change; returns seconds."""
+    rng = random.Random(7)
+    statuses = list(TaskStatus)
+    start = time.perf_counter()
+    for _ in range(count):
+        manager.update_task(rng.choice(task_ids), status=rng.choice(statuses))
+        after_each()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000, help="number of synthetic tasks")
+    parser.add_argument("--changes", type=int, default=200, help="changes per measurement")
+    args = parser.parse_args()
+    
+    print(f"Generating {args.tasks:,} tasks...")
+    tasks = generate_tasks(args.tasks)
+    task_ids = [task.id for task in tasks]
+    
+    manager = TaskManager(MemoryStorage(tasks))
+    polled = make_changes(manager, task_ids, args.changes, lambda: status_counts(manager))
+    
+    manager = TaskManager(MemoryStorage(generate_tasks(args.tasks)))
+    view = status_counts(manager)
+    subscription = manager.subscribe(lambda event: apply_event(view, event))
+    incremental = make_changes(manager, task_ids, args.changes, lambda: None)
+    subscription.close()
+    assert view == status_counts(manager), "incremental view diverged from a fresh listing"
+    
+    writes = args.changes * 50
+    unsubscribed = make_changes(manager, task_ids, writes, lambda: None)
+    manager.subscribe(lambda event: None)
+    subscribed = make_changes(manager, task_ids, writes, lambda: None)
+    
+    print(f"\n{args.changes} status changes, view kept current after each:")
+    print(f"  polling list_tasks:   {polled * 1000:10.1f} ms ({polled / args.changes * 1e6:,.0f} us/change)")
+    print(f"  change feed:          {incremental * 1000:10.1f} ms ({incremental / args.changes * 1e6:,.0f} us/change)")
+    print(f"  speedup:              {polled / incremental:10.0f}x")
+    print(f"\n{writes:,} updates, publishing cost:")
+    print(f"  no subscriber:        {unsubscribed / writes * 1e6:10.1f} us/update")
+    print(f"  one subscriber:       {subscribed / writes * 1e6:10.1f} us/update")
+
+
+if __name__ == "__main__":
+    main()
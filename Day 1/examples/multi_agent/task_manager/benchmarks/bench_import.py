@@ -0,0 +1,74 @@
+"""
+Benchmark bulk import: chunked import_tasks versus one add per invocation.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_import --tasks 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.common import generate_tasks
+from storage import FileStorage, NDJSONStorage
+from task_manager import TaskManager
+from transfer import read_tasks, write_tasks
+
+
+def single_adds(path: str, source: str, count: int) -> float:
+    """Add tasks one per fresh manager, as separate `add` invocations would."""
+    start = time.perf_counter()
+    for task in read_tasks(source):
+        if count == 0:
+            break
+        TaskManager(FileStorage(path)).add_task(task.title, task.description, task.priority, task.due_date)
+        count -= 1
+    return time.perf_counter() - start
+
+
+def chunked_import(storage, source: str, chunk_size: int) -> float:
+    """Import a whole file through import_tasks."""
+    start = time.perf_counter()
+    for _ in TaskManager(storage).import_tasks(read_tasks(source), chunk_size=chunk_size):
+        pass
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000, help="number of tasks in the import file")
+    parser.add_argument("--single", type=int, default=1_000, help="tasks added one invocation at a time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = {name: os.path.join(directory, f"import.{name}") for name in ["csv", "ndjson"]}
+        print(f"Writing {args.tasks:,} tasks...")
+        tasks = generate_tasks(args.tasks)
+        for source in sources.values():
+            write_tasks(source, tasks)
+        del tasks
+
+        # The reader alone holds one record at a time, whatever the file size
+        tracemalloc.start()
+        for _ in read_tasks(sources["csv"]):
+            pass
+        reader_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"Peak memory streaming the CSV file: {reader_peak / 1024:.0f} KiB")
+
+        print(f"\n{'method':<44}{'rows/s':>12}")
+        elapsed = single_adds(os.path.join(directory, "single.json"), sources["csv"], args.single)
+        print(f"{f'add per invocation (first {args.single:,})':<44}{args.single / elapsed:>12,.0f}")
+        for label, source in sources.items():
+            for name, storage_class in [("tasks.json", FileStorage), ("tasks.ndjson", NDJSONStorage)]:
+                for chunk_size in [1_000, 10_000]:
+                    path = os.path.join(directory, f"{label}-{chunk_size}-{name}")
+                    elapsed = chunked_import(storage_class(path), source, chunk_size)
+                    method = f"import {label} into {name} (chunk={chunk_size:,})"
+                    print(f"{method:<44}{args.tasks / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark paged listings: one page via list_page versus sorting everything.
+
+Measures the first page and a page resumed from a cursor halfway through
+the listing, for both the object indexes and the columnar TaskTable.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_pagination --tasks 1000000
+"""
+
+import argparse
+from benchmarks.bench_list_tasks import scan_list_tasks
+from benchmarks.common import MemoryStorage, best_of, generate_tasks
+from task import TaskStatus
+from task_manager import TaskManager
+from task_table import NUMPY_AVAILABLE
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    parser.add_argument("--page-size", type=int, default=20, help="tasks per page")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+    
+    print(f"Generating {args.tasks:,} tasks...")
+    tasks = generate_tasks(args.tasks)
+    
+    managers = {"objects": TaskManager(MemoryStorage(tasks))}
+    if NUMPY_AVAILABLE:
+        managers["columnar"] = TaskManager(MemoryStorage(tasks), columnar=True)
+    for manager in managers.values():
+        manager.get_statistics()
+    
+    queries = [
+        ("list sort=created_at", dict(sort_by="created_at")),
+        ("list status=pending sort=due_date", dict(status=TaskStatus.PENDING, sort_by="due_date")),
+        ("list sort=priority", dict(sort_by="priority")),
+    ]
+    
+    size = args.page_size
+    print(f"\n{'query':<36}{'scan+slice':>12}" + "".join(f"{label + ' p1':>16}{label + ' mid':>16}" for label in managers))
+    for label, kwargs in queries:
+        scan = best_of(lambda: scan_list_tasks(tasks, **kwargs)[:size], args.repeat)
+        line = f"{label:<36}{scan * 1000:>10.1f}ms"
+        for manager in managers.values():
+            # The cursor a reader paging through half of the listing would hold
+            rows = len(manager.list_tasks(**kwargs))
+            _, cursor = manager.list_page(limit=max(1, rows // 2), **kwargs)
+            first = best_of(lambda: manager.list_page(limit=size, **kwargs), args.repeat)
+            resumed = best_of(lambda: manager.list_page(limit=size, cursor=cursor, **kwargs), args.repeat)
+            line += f"{first * 1000:>14.2f}ms{resumed * 1000:>14.2f}ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark a mostly finished store: one JSON file versus hot/cold partitions.
+
+The same tasks, most of them completed or cancelled, are stored once in
+a FileStorage and once in a PartitionedStorage. For each, the benchmark
+times opening a manager and listing pending tasks (what an agent checking
+its queue does), an update_task, and opening a manager for full
+statistics, which reads cold segments back.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_partitioned --tasks 100000 --finished 0.9
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from benchmarks.common import generate_tasks
+from storage import FileStorage, PartitionedStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+def measure(storage_factory) -> dict:
+    """Time the workload, each measurement starting from a freshly opened store."""
+    start = time.perf_counter()
+    manager = TaskManager(storage_factory())
+    pending = manager.list_tasks(status=TaskStatus.PENDING, limit=20)
+    results = {"open + list pending": time.perf_counter() - start}
+    
+    start = time.perf_counter()
+    manager.update_task(pending[0].id, status=TaskStatus.IN_PROGRESS)
+    results["update_task"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    TaskManager(storage_factory()).get_statistics()
+    results["open + full statistics"] = time.perf_counter() - start
+    return results
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=100_000, help="number of synthetic tasks")
+    parser.add_argument("--finished", type=float, default=0.9, help="fraction of completed or cancelled tasks")
+    args = parser.parse_args()
+    
+    print(f"Generating {args.tasks:,} tasks...")
+    tasks = generate_tasks(args.tasks)
+    rng = random.Random(3)
+    for task in tasks:
+        finished = rng.random() < args.finished
+        task.status = (rng.choice([TaskStatus.COMPLETED, TaskStatus.CANCELLED]) if finished
+                       else rng.choice([TaskStatus.PENDING, TaskStatus.IN_PROGRESS]))
+    
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "tasks.json")
+        partitioned_path = os.path.join(directory, "tasks.partitioned")
+        FileStorage(json_path).save_tasks(tasks)
+        PartitionedStorage(partitioned_path).save_tasks(tasks)
+        results = {
+            "json": measure(lambda: FileStorage(json_path)),
+            "partitioned": measure(lambda: PartitionedStorage(partitioned_path)),
+        }
+        hot_size = os.path.getsize(os.path.join(partitioned_path, "hot.json"))
+        cold_size = sum(os.path.getsize(os.path.join(partitioned_path, name))
+                        for name in os.listdir(partitioned_path) if name.endswith(".seg"))
+        json_size = os.path.getsize(json_path)
+    
+    print(f"\n{args.tasks:,} tasks, {args.finished:.0%} finished")
+    print(f"{'operation':<24}{'json':>12}{'partitioned':>14}{'speedup':>10}")
+    for operation in results["json"]:
+        before, after = results["json"][operation], results["partitioned"][operation]
+        print(f"{operation:<24}{before * 1000:>10.1f}ms{after * 1000:>12.1f}ms{before / after:>9.1f}x")
+    print(f"\nOn disk: json {json_size / 1e6:.1f} MB; partitioned hot {hot_size / 1e6:.1f} MB "
+          f"+ cold {cold_size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark full-text search: inverted index versus a substring scan.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_search --tasks 1000000
+"""
+
+import argparse
+import time
+from benchmarks.common import MemoryStorage, best_of, generate_tasks
+from task_manager import TaskManager
+
+
+def scan_search(tasks, query, limit=20):
+    """Find tasks containing every query word by scanning, without an index."""
+    words = query.casefold().split()
+    matches = [
+        t for t in tasks
+        if all(word in t.title.casefold() or word in t.description.casefold() for word in words)
+    ]
+    return matches[:limit]
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+    
+    print(f"Generating {args.tasks:,} tasks...")
+    tasks = generate_tasks(args.tasks)
+    manager = TaskManager(MemoryStorage(tasks))
+    
+    start = time.perf_counter()
+    manager.search_tasks("warm up")
+    print(f"Index build: {time.perf_counter() - start:.2f}s")
+    
+    middle = args.tasks // 2
+    queries = [
+        f"task {middle}",
+        f"{middle}",
+        "synthetic task number",
+        f"{str(middle)[:3]}*",
+    ]
+    
+    print(f"\n{'query':<28}{'hits':>8}{'scan':>12}{'indexed':>12}{'speedup':>10}")
+    for query in queries:
+        hits = len(manager.search_tasks(query))
+        indexed = best_of(lambda: manager.search_tasks(query), args.repeat)
+        if query.endswith("*"):
+            print(f"{query:<28}{hits:>8}{'-':>12}{indexed * 1000:>10.2f}ms{'-':>10}")
+            continue
+        scan = best_of(lambda: scan_search(tasks, query), 1)
+        print(f"{query:<28}{hits:>8}{scan * 1000:>10.1f}ms{indexed * 1000:>10.2f}ms{scan / indexed:>9.0f}x")
+    
+    task = tasks[middle]
+    update = best_of(lambda: manager.update_task(task.id, title=f"Renamed {middle}"), args.repeat)
+    print(f"\nupdate_task with search index maintenance: {update * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
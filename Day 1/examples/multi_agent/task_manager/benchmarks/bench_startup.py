@@ -0,0 +1,107 @@
+"""
+Benchmark CLI startup: wall clock and import time of one-shot commands.
+
+Every command runs main.py in a fresh interpreter, as a shell invocation
+would, against a tasks.json holding the given number of tasks. Wall-clock
+times are the best of several runs. Import times come from
+``python -X importtime`` and are reported per command together with the
+modules that took longest to import.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_startup --tasks 1000 100000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+from benchmarks.common import generate_tasks
+from storage import FileStorage
+
+MAIN = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+# Let the interpreter cache bytecode as an installed CLI would; without it
+# every run recompiles every module and import times are mostly compilation
+ENV = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+
+
+def run_cli(directory: str, args: List[str], importtime: bool = False) -> Tuple[float, str]:
+    """
+    Run main.py once in a fresh interpreter.
+
+    Args:
+        directory: Working directory holding the task store
+        args: Command-line arguments for main.py
+        importtime: Run with ``-X importtime``
+
+    Returns:
+        Tuple of (wall-clock seconds, captured stderr)
+    """
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + [MAIN] + args
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=directory, capture_output=True, text=True,
+                            check=True, env=ENV)
+    return time.perf_counter() - start, result.stderr
+
+
+def wall_clock(directory: str, args: List[str], repeat: int) -> float:
+    """Fastest of several runs of a command, in seconds."""
+    return min(run_cli(directory, args)[0] for _ in range(repeat))
+
+
+def import_times(directory: str, args: List[str]) -> Tuple[float, List[Tuple[float, str]]]:
+    """
+    Measure module imports of a command.
+
+    Returns:
+        Tuple of (total import seconds, ``(seconds, module)`` for each
+        module, slowest first), counting each module's own time only
+    """
+    _, stderr = run_cli(directory, args, importtime=True)
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:"):].split("|")
+        modules.append((int(own) / 1e6, name.strip()))
+    modules.sort(reverse=True)
+    return sum(own for own, _ in modules), modules
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, nargs="+", default=[1_000, 100_000], help="store sizes")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per command, best kept")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports listed per command")
+    args = parser.parse_args()
+
+    for size in args.tasks:
+        with tempfile.TemporaryDirectory() as directory:
+            FileStorage(os.path.join(directory, "tasks.json")).save_tasks(generate_tasks(size))
+            with open(os.path.join(directory, "tasks.json")) as f:
+                task_id = json.load(f)[size // 2]["id"]
+            commands = {
+                "help": ["help"],
+                "add": ["add", "Benchmark task", "Added by the benchmark"],
+                "show <id>": ["show", task_id],
+                "show <prefix>": ["show", task_id[:8]],
+                "list limit=20": ["list", "limit=20"],
+                "stats": ["stats"],
+            }
+
+            print(f"\n{size:,} tasks")
+            print(f"{'command':<16}{'wall clock':>12}{'imports':>10}  slowest imports")
+            for label, command in commands.items():
+                elapsed = wall_clock(directory, command, args.repeat)
+                total, modules = import_times(directory, command)
+                slowest = ", ".join(f"{name} {own * 1000:.1f}" for own, name in modules[:args.top])
+                print(f"{label:<16}{elapsed * 1000:>10.0f}ms{total * 1000:>8.1f}ms  {slowest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark CLI commands on the JSON array, NDJSON and binary formats.
+
+Times what `main.py show <id>`, `main.py add` and `main.py list` do
+against each format: open the store, then look up, append or list.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_storage_formats --tasks 1000000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from benchmarks.common import generate_tasks
+from storage import BinaryFileStorage, FileStorage, NDJSONStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+def timed(func) -> float:
+    """Run a callable once and return the elapsed seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        print(f"Writing {args.tasks:,} tasks in each format...")
+        tasks = generate_tasks(args.tasks)
+        target = tasks[len(tasks) // 2].id
+        formats = {
+            "json": (FileStorage, os.path.join(temp_dir, "tasks.json")),
+            "ndjson": (NDJSONStorage, os.path.join(temp_dir, "tasks.ndjson")),
+            "binary": (BinaryFileStorage, os.path.join(temp_dir, "tasks.bin")),
+        }
+        for storage_class, path in formats.values():
+            storage_class(path).save_tasks(tasks)
+        del tasks
+        
+        def show(storage_class, path):
+            manager = TaskManager(storage_class(path))
+            manager.get_task(manager.resolve_task_id(target[:8]))
+        
+        def add(storage_class, path):
+            TaskManager(storage_class(path)).add_task("Benchmark task")
+        
+        def list_pending(storage_class, path):
+            for _ in TaskManager(storage_class(path)).iter_tasks(status=TaskStatus.PENDING):
+                pass
+        
+        commands = [("show <id>", show), ("add", add), ("list status=pending", list_pending)]
+        print("\n" + f"{'command':<24}" + "".join(f"{name:>10}" for name in formats))
+        for label, command in commands:
+            times = [timed(lambda: command(*formats[name])) for name in formats]
+            print(f"{label:<24}" + "".join(f"{seconds:>9.2f}s" for seconds in times))
+
+
+if __name__ == "__main__":
+    main()
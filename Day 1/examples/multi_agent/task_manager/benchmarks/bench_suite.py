@@ -0,0 +1,204 @@
+"""
+Scaling benchmark suite: core operations from 1k to 1M tasks.
+
+Each store size runs in a fresh process, so its peak memory is its own.
+For every size the suite times FileStorage.save_tasks and load_tasks,
+TaskManager startup, the first index build, add_task and update_task
+(which rewrite the file), list_tasks with each sort key and
+get_statistics. Results are printed, optionally written to JSON, and
+compared against a stored baseline: any metric slower (or larger) than
+the baseline by more than the threshold is reported as a regression and
+makes the run exit with status 1.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_suite --sizes 1000 10000 100000 1000000
+    python -m benchmarks.bench_suite --output results.json --baseline benchmarks/baseline.json
+    python -m benchmarks.bench_suite --sizes 1000 10000 --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.common import generate_tasks
+from storage import FileStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SORT_KEYS = ["created_at", "updated_at", "priority", "due_date"]
+
+# Operations faster than this are repeated and the best run is kept
+_REPEAT_BELOW = 0.2
+
+# Timing differences below this many seconds are noise, whatever the ratio
+_NOISE_FLOOR = 0.001
+
+
+def timed(func, repeat: int = 5) -> float:
+    """
+    Time a callable, repeating it only if a single run is quick.
+
+    Args:
+        func: Zero-argument callable
+        repeat: Runs for quick callables
+
+    Returns:
+        Fastest wall-clock time in seconds
+    """
+    start = time.perf_counter()
+    func()
+    best = time.perf_counter() - start
+    if best < _REPEAT_BELOW:
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MiB, or None where unsupported."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def measure_size(size: int) -> dict:
+    """
+    Run every measurement against one store size.
+
+    Args:
+        size: Number of synthetic tasks
+
+    Returns:
+        Metric name to seconds, plus ``peak_rss_mb``
+    """
+    results = {}
+    tasks = generate_tasks(size)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tasks.json")
+        storage = FileStorage(path)
+        results["save_tasks"] = timed(lambda: storage.save_tasks(tasks))
+        results["file_mb"] = os.path.getsize(path) / (1024 * 1024)
+        del tasks
+        results["load_tasks"] = timed(lambda: FileStorage(path).load_tasks())
+
+        start = time.perf_counter()
+        manager = TaskManager(FileStorage(path))
+        results["startup"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager.get_statistics()
+        results["index_build"] = time.perf_counter() - start
+
+        results["add_task"] = timed(lambda: manager.add_task("Benchmark task", "Added by the suite"))
+        task_id = manager.tasks[size // 2].id
+        statuses = iter(list(TaskStatus) * 10)
+        results["update_task"] = timed(lambda: manager.update_task(task_id, status=next(statuses)))
+
+        for sort_by in SORT_KEYS:
+            results[f"list_tasks[{sort_by}]"] = timed(lambda: manager.list_tasks(sort_by=sort_by))
+        results["list_page[created_at]"] = timed(lambda: manager.list_page(limit=20))
+        results["get_statistics"] = timed(manager.get_statistics)
+
+    results["peak_rss_mb"] = peak_rss_mb()
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Find metrics that regressed against a baseline.
+
+    Args:
+        results: Results by size, as produced by this suite
+        baseline: Stored results in the same format
+        threshold: Allowed ratio of result to baseline (1.25 allows 25% slower)
+
+    Returns:
+        ``(size, metric, baseline value, result value)`` for each regression
+    """
+    regressions = []
+    for size, metrics in results.items():
+        for metric, value in metrics.items():
+            reference = baseline.get(size, {}).get(metric)
+            if value is None or not reference:
+                continue
+            if metric.endswith("_mb"):
+                slower = value > reference * threshold
+            else:
+                slower = value > reference * threshold and value - reference > _NOISE_FLOOR
+            if slower:
+                regressions.append((size, metric, reference, value))
+    return regressions
+
+
+def main():
+    """Run the suite."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="store sizes to measure")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results stored in this JSON file")
+    parser.add_argument("--save-baseline", help="store the results as a new baseline in this JSON file")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="ratio to the baseline above which a metric counts as a regression")
+    args = parser.parse_args()
+
+    # A fresh interpreter per size keeps peak memory figures independent
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for size in args.sizes:
+        print(f"Measuring {size:,} tasks...", flush=True)
+        with context.Pool(1) as pool:
+            results[str(size)] = pool.apply(measure_size, (size,))
+
+    metrics = list(next(iter(results.values())))
+    print(f"\n{'metric':<26}" + "".join(f"{int(size):>14,}" for size in results))
+    for metric in metrics:
+        values = [results[size][metric] for size in results]
+        if metric.endswith("_mb"):
+            cells = ["-" if value is None else f"{value:.1f}MB" for value in values]
+        else:
+            cells = [f"{value * 1000:.2f}ms" for value in values]
+        print(f"{metric:<26}" + "".join(f"{cell:>14}" for cell in cells))
+
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"\nResults written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.threshold)
+        print(f"\nCompared with {args.baseline} ({baseline['meta']['date']}, Python {baseline['meta']['python']})")
+        for size, metric, reference, value in regressions:
+            print(f"  ❌ {int(size):,} tasks, {metric}: {reference:.4g} -> {value:.4g} ({value / reference:.2f}x)")
+        if regressions:
+            sys.exit(1)
+        print(f"  ✅ No metric above {args.threshold:.2f}x the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Benchmark the memory footprint and load time of the Task layout.
+
+Compares the compact slotted Task against the previous dict-backed layout
+with ISO string timestamps. Each measurement runs in a fresh interpreter
+so peak resident sizes do not contaminate each other.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_task_memory --tasks 1000000
+"""
+
+import argparse
+import gc
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Optional
+from benchmarks.common import generate_tasks
+from storage import FileStorage
+from task import Task, TaskStatus, TaskPriority
+
+
+class LegacyTask:
+    """The dict-backed Task layout used before tasks were slotted."""
+    
+    def __init__(self, title: str, description: str = "",
+                 status: TaskStatus = TaskStatus.PENDING,
+                 priority: TaskPriority = TaskPriority.MEDIUM,
+                 due_date: Optional[str] = None,
+                 task_id: Optional[str] = None,
+                 created_at: Optional[str] = None,
+                 updated_at: Optional[str] = None):
+        self.id = task_id or str(uuid.uuid4())
+        self.title = title
+        self.description = description
+        self.status = status if isinstance(status, TaskStatus) else TaskStatus(status)
+        self.priority = priority if isinstance(priority, TaskPriority) else TaskPriority(priority)
+        self.due_date = due_date
+        self.created_at = created_at or datetime.now().isoformat()
+        self.updated_at = updated_at or datetime.now().isoformat()
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LegacyTask':
+        return cls(
+            task_id=data.get("id"),
+            title=data.get("title", ""),
+            description=data.get("description", ""),
+            status=TaskStatus(data.get("status", "pending")),
+            priority=TaskPriority(data.get("priority", "medium")),
+            due_date=data.get("due_date"),
+            created_at=data.get("created_at"),
+            updated_at=data.get("updated_at")
+        )
+
+
+LAYOUTS = {"legacy": LegacyTask, "compact": Task}
+
+
+def rss_mb(field: str = "VmHWM") -> Optional[float]:
+    """
+    Resident set size of this process in MB.
+    
+    Args:
+        field: "VmHWM" for the peak or "VmRSS" for the current size
+    
+    Returns:
+        Size in MB, or None if it cannot be determined on this platform
+    """
+    # ru_maxrss survives exec on Linux and would report the parent's peak,
+    # so prefer the per-address-space figures when they are available
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if field != "VmHWM":
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def measure(layout: str, filepath: str, trace: bool) -> dict:
+    """
+    Load a task file with one layout.
+    
+    Args:
+        layout: Key into LAYOUTS
+        filepath: JSON file in FileStorage format
+        trace: Measure retained heap with tracemalloc instead of timing
+    
+    Returns:
+        Dictionary of measurements
+    """
+    cls = LAYOUTS[layout]
+    if trace:
+        tracemalloc.start()
+    
+    start = time.perf_counter()
+    with open(filepath) as f:
+        data = json.load(f)
+    parsed = time.perf_counter()
+    tasks = [cls.from_dict(task_dict) for task_dict in data]
+    hydrated = time.perf_counter()
+    
+    del data
+    gc.collect()
+    result = {"tasks": len(tasks)}
+    if trace:
+        result["retained_mb"] = tracemalloc.get_traced_memory()[0] / (1024 * 1024)
+    else:
+        result.update(parse_s=parsed - start, hydrate_s=hydrated - parsed,
+                      peak_rss_mb=rss_mb("VmHWM"), rss_mb=rss_mb("VmRSS"))
+    return result
+
+
+def run_child(layout: str, filepath: str, trace: bool) -> dict:
+    """Run one measurement in a fresh interpreter."""
+    command = [sys.executable, "-m", "benchmarks.bench_task_memory",
+               "--measure", layout, "--file", filepath]
+    if trace:
+        command.append("--trace")
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    parser.add_argument("--measure", choices=LAYOUTS, help=argparse.SUPPRESS)
+    parser.add_argument("--file", help=argparse.SUPPRESS)
+    parser.add_argument("--trace", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.file, args.trace)))
+        return
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filepath = os.path.join(temp_dir, "tasks.json")
+        print(f"Writing {args.tasks:,} tasks to a temporary tasks.json...")
+        FileStorage(filepath).save_tasks(generate_tasks(args.tasks))
+        print(f"File size: {os.path.getsize(filepath) / (1024 * 1024):.0f} MB")
+        
+        # Peak RSS is set by json.load in both layouts; the resident size
+        # after the parsed JSON is dropped and the retained Python heap show
+        # what the task objects themselves cost.
+        print(f"\n{'layout':<10}{'json.load':>11}{'from_dict':>11}{'peak RSS':>11}"
+              f"{'RSS after':>11}{'retained':>11}{'per task':>10}")
+        for layout in LAYOUTS:
+            timing = run_child(layout, filepath, trace=False)
+            memory = run_child(layout, filepath, trace=True)
+            per_task = memory["retained_mb"] * 1024 * 1024 / memory["tasks"]
+            rss_after = f"{timing['rss_mb']:.0f} MB" if timing["rss_mb"] is not None else "n/a"
+            print(f"{layout:<10}{timing['parse_s']:>10.2f}s{timing['hydrate_s']:>10.2f}s"
+                  f"{timing['peak_rss_mb']:>8.0f} MB{rss_after:>11}"
+                  f"{memory['retained_mb']:>8.0f} MB{per_task:>9.0f}B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark the columnar TaskTable against the list-of-objects paths.
+
+Compares three ways to answer listings and statistics over the same
+tasks: scanning the task list, the per-object TaskIndex/StatisticsIndex,
+and the NumPy-backed TaskTable.
+
+Usage (from the task_manager directory):
+    python -m benchmarks.bench_task_table --tasks 1000000
+"""
+
+import argparse
+import time
+from datetime import datetime
+from benchmarks.bench_list_tasks import scan_list_tasks
+from benchmarks.common import MemoryStorage, best_of, generate_tasks
+from task import TaskStatus, TaskPriority
+from task_manager import TaskManager
+from task_table import NUMPY_AVAILABLE
+
+
+def scan_statistics(tasks):
+    """Count statistics by scanning every task, as get_statistics did before indexing."""
+    completed = len([t for t in tasks if t.status == TaskStatus.COMPLETED])
+    pending = len([t for t in tasks if t.status == TaskStatus.PENDING])
+    in_progress = len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS])
+    high_priority = len([t for t in tasks if t.priority == TaskPriority.HIGH])
+    overdue = len([t for t in tasks if t.is_overdue()])
+    return completed, pending, in_progress, high_priority, overdue
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="number of synthetic tasks")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is reported)")
+    args = parser.parse_args()
+    if not NUMPY_AVAILABLE:
+        parser.error("NumPy is not installed")
+    
+    print(f"Generating {args.tasks:,} tasks...")
+    tasks = generate_tasks(args.tasks)
+    
+    managers = {}
+    for label, columnar in [("objects", False), ("columnar", True)]:
+        start = time.perf_counter()
+        managers[label] = TaskManager(MemoryStorage(tasks), columnar=columnar)
+        managers[label].get_statistics()
+        print(f"Index build ({label}): {time.perf_counter() - start:.2f}s")
+    objects, columnar = managers["objects"], managers["columnar"]
+    
+    queries = [
+        ("list status=pending sort=due_date", dict(status=TaskStatus.PENDING, sort_by="due_date")),
+        ("list status=pending priority=high", dict(status=TaskStatus.PENDING, priority=TaskPriority.HIGH)),
+        ("list sort=priority", dict(sort_by="priority")),
+        ("list sort=updated_at", dict(sort_by="updated_at")),
+    ]
+    
+    print(f"\n{'query':<38}{'rows':>10}{'scan':>12}{'objects':>12}{'columnar':>12}")
+    for label, kwargs in queries:
+        rows = len(columnar.list_tasks(**kwargs))
+        scan = best_of(lambda: scan_list_tasks(tasks, **kwargs), args.repeat)
+        indexed = best_of(lambda: objects.list_tasks(**kwargs), args.repeat)
+        vectorized = best_of(lambda: columnar.list_tasks(**kwargs), args.repeat)
+        print(f"{label:<38}{rows:>10,}{scan * 1000:>10.1f}ms{indexed * 1000:>10.1f}ms{vectorized * 1000:>10.1f}ms")
+    
+    label = "statistics"
+    scan = best_of(lambda: scan_statistics(tasks), args.repeat)
+    indexed = best_of(objects.get_statistics, args.repeat)
+    vectorized = best_of(columnar.get_statistics, args.repeat)
+    print(f"{label:<38}{'':>10}{scan * 1000:>10.1f}ms{indexed * 1000:>10.1f}ms{vectorized * 1000:>10.1f}ms")
+    
+    task = tasks[len(tasks) // 2]
+    print()
+    for label, manager in managers.items():
+        update = best_of(lambda: manager.update_task(task.id, status=TaskStatus.IN_PROGRESS), args.repeat)
+        print(f"update_task with index maintenance ({label}): {update * 1000:.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Shared helpers for the task manager benchmarks.
+"""
+
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List
+from task import Task, TaskStatus, TaskPriority
+
+
+class MemoryStorage:
+    """Storage stub that serves pre-generated tasks and discards writes."""
+    
+    def __init__(self, tasks: List[Task]):
+        """
+        Initialize the stub.
+        
+        Args:
+            tasks: Tasks returned by load_tasks
+        """
+        self._tasks = tasks
+    
+    def load_tasks(self) -> List[Task]:
+        """Return the pre-generated tasks."""
+        return self._tasks
+    
+    def save_tasks(self, tasks: List[Task]):
+        """Discard the tasks."""
+    
+    def add_task(self, task: Task):
+        """Discard the change."""
+    
+    def update_task(self, task: Task):
+        """Discard the change."""
+    
+    def delete_task(self, task_id: str):
+        """Discard the change."""
+
+
+def generate_tasks(count: int, seed: int = 42) -> List[Task]:
+    """
+    Generate a reproducible synthetic task store.
+    
+    Args:
+        count: Number of tasks to generate
+        seed: Random seed
+    
+    Returns:
+        List of Task objects with spread-out dates, statuses and priorities
+    """
+    rng = random.Random(seed)
+    statuses = list(TaskStatus)
+    priorities = list(TaskPriority)
+    start = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(count):
+        created = start + timedelta(seconds=i * 30)
+        updated = created + timedelta(seconds=rng.randint(0, 86400 * 30))
+        due = None
+        if rng.random() < 0.7:
+            due = (created + timedelta(days=rng.randint(-30, 90))).strftime("%Y-%m-%d")
+        tasks.append(Task(
+            title=f"Task {i}",
+            description=f"Synthetic task number {i}",
+            status=rng.choice(statuses),
+            priority=rng.choice(priorities),
+            due_date=due,
+            task_id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            created_at=created.isoformat(),
+            updated_at=updated.isoformat()
+        ))
+    return tasks
+
+
+def best_of(func, repeat: int = 5) -> float:
+    """
+    Time a callable.
+    
+    Args:
+        func: Zero-argument callable
+        repeat: Number of runs
+    
+    Returns:
+        Fastest wall-clock time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
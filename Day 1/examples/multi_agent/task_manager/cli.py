@@ -3,22 +3,47 @@ Command-line interface for the task management system.
 """
 
 import sys
-from typing import List
-from task_manager import TaskManager
-from task import TaskStatus, TaskPriority
+import time
+from typing import TYPE_CHECKING, List, Optional
+from task import Task, TaskStatus, TaskPriority
+
+if TYPE_CHECKING:
+    from task_manager import TaskManager
 
 
 class TaskCLI:
     """Command-line interface handler."""
     
-    def __init__(self, manager: TaskManager):
+    # Tasks per page when paging through a listing without limit=<n>
+    PAGE_SIZE = 20
+    
+    def __init__(self, manager: Optional["TaskManager"] = None, storage=None):
         """
-        Initialize the CLI with a task manager.
+        Initialize the CLI with a task manager, or the storage to open one on.
         
         Args:
             manager: TaskManager instance
+            storage: Storage to load a TaskManager from when a command first
+                needs one. Until then, adding a task goes straight to
+                storages that can append one, without loading the others.
+        
+        Raises:
+            ValueError: If neither a manager nor a storage is given
         """
-        self.manager = manager
+        if manager is None and storage is None:
+            raise ValueError("TaskCLI needs a manager or a storage")
+        self._manager = manager
+        self.storage = storage if storage is not None else manager.storage
+    
+    @property
+    def manager(self) -> "TaskManager":
+        """The task manager, loaded on first use."""
+        if self._manager is None:
+            # Imported here so that commands that never load tasks don't
+            # import the indexing code either
+            from task_manager import TaskManager
+            self._manager = TaskManager(self.storage)
+        return self._manager
     
     def run(self):
         """Run the interactive CLI loop."""
@@ -27,10 +52,14 @@ class TaskCLI:
         print("=" * 60)
         print("\nAvailable commands:")
         print("  add <title> [description] [priority] [due_date]")
-        print("  list [status] [priority] [sort_by]")
+        print("  list [status] [priority] [sort_by] [limit] [page]")
         print("  update <id> [field=value ...]")
         print("  delete <id>")
+        print("  batch <command> ; <command> ; ...")
         print("  show <id>")
+        print("  search <words> [limit=<n>]")
+        print("  import <file> [format] [chunk]")
+        print("  export <file> [format] [status] [priority]")
         print("  stats")
         print("  help")
         print("  exit")
@@ -75,8 +104,16 @@ class TaskCLI:
             self._handle_update(args[1:])
         elif command == "delete":
             self._handle_delete(args[1:])
+        elif command == "batch":
+            self._handle_batch(args[1:])
         elif command == "show":
             self._handle_show(args[1:])
+        elif command == "search":
+            self._handle_search(args[1:])
+        elif command == "import":
+            self._handle_import(args[1:])
+        elif command == "export":
+            self._handle_export(args[1:])
         elif command == "stats":
             self._handle_stats()
         elif command == "help":
@@ -84,28 +121,60 @@ class TaskCLI:
         else:
             print(f"Unknown command: {command}. Type 'help' for available commands.")
     
+    def _resolve_id(self, prefix: str) -> Optional[str]:
+        """
+        Resolve a full or shortened task ID, reporting failures.
+        
+        Args:
+            prefix: Task ID or unambiguous leading part of one
+        
+        Returns:
+            Full task ID, or None if it could not be resolved
+        """
+        try:
+            task_id = self.manager.resolve_task_id(prefix)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return None
+        if task_id is None:
+            print(f"❌ Task not found: {prefix}")
+        return task_id
+    
     def _handle_add(self, args: List[str]):
         """Handle add command."""
         if not args:
             print("Usage: add <title> [description] [priority] [due_date]")
             return
         
-        title = args[0]
-        description = args[1] if len(args) > 1 else ""
-        priority = TaskPriority(args[2]) if len(args) > 2 else TaskPriority.MEDIUM
-        due_date = args[3] if len(args) > 3 else None
-        
         try:
-            task = self.manager.add_task(title, description, priority, due_date)
+            fields = self._parse_add(args)
+            add_task = getattr(self.storage, "add_task", None)
+            if self._manager is None and add_task is not None:
+                task = Task(**fields)
+                add_task(task)
+            else:
+                task = self.manager.add_task(**fields)
             print(f"✅ Task added: {task}")
         except Exception as e:
             print(f"Error adding task: {e}")
     
+    @staticmethod
+    def _parse_add(args: List[str]) -> dict:
+        """Turn add arguments into add_task keyword arguments."""
+        return {
+            "title": args[0],
+            "description": args[1] if len(args) > 1 else "",
+            "priority": TaskPriority(args[2]) if len(args) > 2 else TaskPriority.MEDIUM,
+            "due_date": args[3] if len(args) > 3 else None,
+        }
+    
     def _handle_list(self, args: List[str]):
         """Handle list command."""
         status = None
         priority = None
         sort_by = "created_at"
+        limit = None
+        page = None
         
         for arg in args:
             if arg.startswith("status="):
@@ -114,31 +183,85 @@ class TaskCLI:
                 priority = TaskPriority(arg.split("=")[1])
             elif arg.startswith("sort="):
                 sort_by = arg.split("=")[1]
+            elif arg.startswith("limit="):
+                try:
+                    limit = int(arg.split("=")[1])
+                except ValueError:
+                    limit = 0
+                if limit < 1:
+                    print("Usage: list [status=<status>] [priority=<priority>] [sort=<field>] "
+                          "[limit=<n>] [page=<cursor>] (n a positive number)")
+                    return
+            elif arg.startswith("page="):
+                page = arg.split("=", 1)[1]
         
-        tasks = self.manager.list_tasks(status=status, priority=priority, sort_by=sort_by)
+        if limit is None and page is None:
+            # Print as tasks stream out of the index instead of building a list first
+            count = 0
+            for task in self.manager.iter_tasks(status=status, priority=priority, sort_by=sort_by):
+                if count == 0:
+                    print("\n📋 Tasks:")
+                    print("-" * 60)
+                count += 1
+                self._print_task(task)
+            
+            if count == 0:
+                print("No tasks found.")
+                return
+            print(f"\n  Total: {count}")
+            print()
+            return
         
+        try:
+            tasks, next_page = self.manager.list_page(status=status, priority=priority, sort_by=sort_by,
+                                                      limit=limit or self.PAGE_SIZE, cursor=page)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
         if not tasks:
             print("No tasks found.")
             return
         
-        print(f"\n📋 Tasks ({len(tasks)}):")
+        print("\n📋 Tasks:")
         print("-" * 60)
         for task in tasks:
-            print(f"  {task}")
-            if task.description:
-                print(f"    └─ {task.description[:50]}...")
+            self._print_task(task)
+        if next_page:
+            options = [arg for arg in args if not arg.startswith("page=")]
+            print(f"\n  Next page: list {' '.join(options + [f'page={next_page}'])}")
+        else:
+            print("\n  End of list")
         print()
     
+    @staticmethod
+    def _print_task(task: Task):
+        """Print a task as a line of a listing."""
+        print(f"  {task}")
+        if task.description:
+            print(f"    └─ {task.description[:50]}...")
+    
     def _handle_update(self, args: List[str]):
         """Handle update command."""
         if not args:
             print("Usage: update <id> [field=value ...]")
             return
         
-        task_id = args[0]
-        updates = {}
+        task_id = self._resolve_id(args[0])
+        if task_id is None:
+            return
+        updates = self._parse_updates(args[1:])
         
-        for arg in args[1:]:
+        task = self.manager.update_task(task_id, **updates)
+        if task:
+            print(f"✅ Task updated: {task}")
+        else:
+            print(f"❌ Task not found: {task_id}")
+    
+    @staticmethod
+    def _parse_updates(args: List[str]) -> dict:
+        """Turn field=value arguments into update_task keyword arguments."""
+        updates = {}
+        for arg in args:
             if "=" in arg:
                 key, value = arg.split("=", 1)
                 if key == "status":
@@ -147,12 +270,61 @@ class TaskCLI:
                     updates["priority"] = TaskPriority(value)
                 else:
                     updates[key] = value
+        return updates
+    
+    def _handle_batch(self, args: List[str]):
+        """
+        Handle batch command.
         
-        task = self.manager.update_task(task_id, **updates)
-        if task:
-            print(f"✅ Task updated: {task}")
+        Runs several add, update and delete commands separated by ";" as
+        one transaction: they are saved with a single write, and if any of
+        them fails none is applied.
+        """
+        commands: List[List[str]] = [[]]
+        for arg in args:
+            if arg == ";":
+                commands.append([])
+            elif arg.endswith(";"):
+                commands[-1].append(arg[:-1])
+                commands.append([])
+            else:
+                commands[-1].append(arg)
+        commands = [command for command in commands if command]
+        if not commands:
+            print("Usage: batch <command> ; <command> ; ...")
+            return
+        
+        try:
+            with self.manager.batch():
+                for command in commands:
+                    self._apply_batch_command(command[0].lower(), command[1:])
+        except ValueError as e:
+            print(f"❌ Batch rolled back, nothing was saved: {e}")
+            return
+        print(f"✅ Batch applied: {len(commands)} commands")
+    
+    def _apply_batch_command(self, command: str, args: List[str]):
+        """
+        Apply one command of a batch, raising instead of printing errors.
+        
+        Raises:
+            ValueError: If the command is unsupported, malformed or refers to a missing task
+        """
+        if command not in ("add", "update", "delete"):
+            raise ValueError(f"unsupported command in batch: {command}")
+        if not args:
+            raise ValueError(f"{command} needs an argument")
+        if command == "add":
+            self.manager.add_task(**self._parse_add(args))
+            return
+        
+        task_id = self.manager.resolve_task_id(args[0])
+        if task_id is None:
+            raise ValueError(f"task not found: {args[0]}")
+        if command == "update":
+            self.manager.update_task(task_id, **self._parse_updates(args[1:]))
         else:
-            print(f"❌ Task not found: {task_id}")
+            self.manager.delete_task(task_id)
     
     def _handle_delete(self, args: List[str]):
         """Handle delete command."""
@@ -160,7 +332,9 @@ class TaskCLI:
             print("Usage: delete <id>")
             return
         
-        task_id = args[0]
+        task_id = self._resolve_id(args[0])
+        if task_id is None:
+            return
         if self.manager.delete_task(task_id):
             print(f"✅ Task deleted: {task_id}")
         else:
@@ -172,7 +346,10 @@ class TaskCLI:
             print("Usage: show <id>")
             return
         
-        task = self.manager.get_task(args[0])
+        task_id = self._resolve_id(args[0])
+        if task_id is None:
+            return
+        task = self.manager.get_task(task_id)
         if task:
             print(f"\n📝 Task Details:")
             print(f"  ID: {task.id}")
@@ -188,6 +365,109 @@ class TaskCLI:
         else:
             print(f"❌ Task not found: {args[0]}")
     
+    def _handle_search(self, args: List[str]):
+        """Handle search command."""
+        limit = 20
+        words = []
+        for arg in args:
+            if arg.startswith("limit="):
+                try:
+                    limit = int(arg.split("=")[1])
+                except ValueError:
+                    limit = 0
+                if limit < 1:
+                    print("Usage: search <words> [limit=<n>] (n a positive number)")
+                    return
+            else:
+                words.append(arg)
+        if not words:
+            print("Usage: search <words> [limit=<n>]")
+            return
+        
+        tasks = self.manager.search_tasks(" ".join(words), limit=limit)
+        if not tasks:
+            print("No matching tasks.")
+            return
+        
+        print(f"\n🔎 Results for '{' '.join(words)}' ({len(tasks)}):")
+        print("-" * 60)
+        for rank, task in enumerate(tasks, 1):
+            print(f"  {rank:>2}. {task}")
+            if task.description:
+                print(f"      └─ {task.description[:50]}...")
+        print()
+    
+    def _handle_import(self, args: List[str]):
+        """
+        Handle import command.
+        
+        Streams tasks from a CSV or NDJSON file and saves them in chunks,
+        so memory use does not grow with the file.
+        """
+        if not args:
+            print("Usage: import <file> [format=csv|ndjson] [chunk=<n>]")
+            return
+        
+        file_format = None
+        # Large enough that a full-rewrite store like tasks.json is rewritten
+        # rarely, small enough to keep the pending chunk's memory modest
+        chunk_size = 10000
+        for arg in args[1:]:
+            if arg.startswith("format="):
+                file_format = arg.split("=")[1]
+            elif arg.startswith("chunk="):
+                try:
+                    chunk_size = int(arg.split("=")[1])
+                except ValueError:
+                    chunk_size = 0
+                if chunk_size < 1:
+                    print("Usage: import <file> [format=csv|ndjson] [chunk=<n>] (n a positive number)")
+                    return
+        
+        # Imported here: only import and export need the csv module
+        from transfer import read_tasks
+        count = 0
+        start = time.perf_counter()
+        try:
+            for saved in self.manager.import_tasks(read_tasks(args[0], file_format), chunk_size=chunk_size):
+                count += saved
+        except (OSError, ValueError) as e:
+            print(f"❌ Import stopped after {count} tasks: {e}")
+            return
+        elapsed = time.perf_counter() - start
+        print(f"✅ Imported {count:,} tasks in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)")
+    
+    def _handle_export(self, args: List[str]):
+        """Handle export command."""
+        if not args:
+            print("Usage: export <file> [format=csv|ndjson] [status=<status>] [priority=<priority>]")
+            return
+        
+        file_format = None
+        status = None
+        priority = None
+        for arg in args[1:]:
+            if arg.startswith("format="):
+                file_format = arg.split("=")[1]
+            elif arg.startswith("status="):
+                status = TaskStatus(arg.split("=")[1])
+            elif arg.startswith("priority="):
+                priority = TaskPriority(arg.split("=")[1])
+        
+        from transfer import write_tasks
+        # Stored order, so that exporting and importing again round-trips
+        tasks = (task for task in self.manager.tasks
+                 if (status is None or task.status == status)
+                 and (priority is None or task.priority == priority))
+        start = time.perf_counter()
+        try:
+            count = write_tasks(args[0], tasks, file_format)
+        except (OSError, ValueError) as e:
+            print(f"❌ Export failed: {e}")
+            return
+        elapsed = time.perf_counter() - start
+        print(f"✅ Exported {count:,} tasks to {args[0]} in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} rows/s)")
+    
     def _handle_stats(self):
         """Handle stats command."""
         stats = self.manager.get_statistics()
@@ -209,21 +489,64 @@ class TaskCLI:
         print("     - Priority: low, medium, high")
         print("     - Due date format: YYYY-MM-DD")
         print()
-        print("  list [status=<status>] [priority=<priority>] [sort=<field>]")
+        print("  list [status=<status>] [priority=<priority>] [sort=<field>] [limit=<n>] [page=<cursor>]")
         print("     - List tasks with optional filters")
         print("     - Status: pending, in_progress, completed, cancelled")
         print("     - Sort: created_at, updated_at, priority, due_date")
+        print("     - limit=<n> shows one page and prints the command for the next")
         print()
         print("  update <id> [field=value ...]")
+        print("     - <id> may be shortened to any unambiguous prefix")
         print("     - Update task fields (title, description, status, priority, due_date)")
         print()
         print("  delete <id>")
         print("     - Delete a task")
         print()
+        print("  batch <command> ; <command> ; ...")
+        print("     - Run add, update and delete commands as one transaction")
+        print("     - Saved with a single write; if one fails, none is applied")
+        print("     - Quote ';' in the shell: batch add A \\; add B")
+        print()
         print("  show <id>")
         print("     - Show detailed task information")
         print()
+        print("  search <words> [limit=<n>]")
+        print("     - Find tasks containing all words in title or description")
+        print("     - End a word with * to match it as a prefix (e.g. rep*)")
+        print()
+        print("  import <file> [format=csv|ndjson] [chunk=<n>]")
+        print("     - Add tasks from a CSV or NDJSON file, saving once per chunk (default 10000)")
+        print("     - Records use the fields id, title, description, status, priority,")
+        print("       due_date, created_at, updated_at; only title is required")
+        print("     - A record with the ID of a stored task replaces it")
+        print()
+        print("  export <file> [format=csv|ndjson] [status=<status>] [priority=<priority>]")
+        print("     - Write tasks to a CSV or NDJSON file")
+        print("     - The format defaults to the file extension (.csv, .ndjson, .jsonl)")
+        print()
         print("  stats")
         print("     - Show task statistics")
         print()
 
+
+class RemoteTaskCLI(TaskCLI):
+    """Interactive CLI whose commands run in the task daemon (see daemon.py)."""
+    
+    def __init__(self, client):
+        """
+        Initialize the CLI with a daemon client.
+        
+        Args:
+            client: DaemonClient connected to the running daemon
+        """
+        self.client = client
+    
+    def handle_command(self, args: List[str]):
+        """
+        Send a command to the daemon and print its output.
+        
+        Args:
+            args: List of command arguments
+        """
+        if args:
+            print(self.client.send(args), end="")
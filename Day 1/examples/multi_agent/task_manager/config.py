@@ -24,9 +24,5 @@ MAX_DESCRIPTION_LENGTH = 1000
 DATE_FORMAT = "%Y-%m-%d"
 DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# Ensure storage directory exists
-STORAGE_DIR.mkdir(exist_ok=True)
-
 # Get storage file path
 STORAGE_FILE = STORAGE_DIR / DEFAULT_STORAGE_FILE
-
@@ -0,0 +1,239 @@
+"""
+Resident task daemon serving CLI commands over a Unix socket.
+
+Scripts that run main.py many times pay for starting Python and loading
+the task store on every call. A daemon started with ``main.py daemon``
+keeps one TaskManager in memory and runs commands sent by main.py, which
+switches to being a thin client whenever the daemon's socket is up.
+"""
+
+import io
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+from contextlib import redirect_stdout
+from typing import List, Optional, Tuple
+
+# Commands that open their own TaskManager.batch, and so must not run
+# inside a group commit: nested batches join the outer one, which would
+# keep a failed batch command from rolling back on its own, and would hold
+# a whole import in one write instead of one per chunk
+_STANDALONE = frozenset(["batch", "import"])
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves one client connection: a JSON request line, a JSON reply line."""
+    
+    def handle(self):
+        daemon: TaskDaemon = self.server.daemon
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        if request.get("ping"):
+            reply = ""
+        elif request.get("stop"):
+            reply = "Task daemon stopped\n"
+            # shutdown waits for serve_forever, so it cannot run on the serving thread
+            threading.Thread(target=daemon.stop).start()
+        else:
+            reply = daemon.execute([str(arg) for arg in request.get("args", [])])
+        self.wfile.write(json.dumps({"output": reply}).encode() + b"\n")
+
+
+class TaskDaemon:
+    """
+    Long-lived server running TaskCLI commands against one in-memory TaskManager.
+    
+    Client connections are accepted on their own threads, but all commands
+    run on a single worker thread, so the TaskManager is never used
+    concurrently. Writes are group-committed: the worker takes every
+    command that queued up while it was busy, runs them inside one
+    TaskManager.batch, and answers them only once that batch is saved
+    with a single storage write. A client therefore never hears back about
+    a change that is not on disk. If the write fails, the batch rolls back
+    and every command in the group is told nothing was saved.
+    """
+    
+    def __init__(self, cli, socket_path: str):
+        """
+        Initialize the daemon.
+        
+        Args:
+            cli: TaskCLI whose manager is already loaded
+            socket_path: Path of the Unix socket to listen on
+        """
+        self.cli = cli
+        self.socket_path = socket_path
+        self.commands = 0
+        self.commits = 0
+        self._requests: "queue.Queue[Optional[Tuple[List[str], queue.SimpleQueue]]]" = queue.Queue()
+        self._server: Optional[socketserver.UnixStreamServer] = None
+        self._worker = threading.Thread(target=self._work, name="task-daemon", daemon=True)
+    
+    def serve_forever(self):
+        """
+        Listen on the socket until stopped.
+        
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if DaemonClient.connect(self.socket_path) is not None:
+            raise RuntimeError(f"A task daemon is already listening on {self.socket_path}")
+        if os.path.exists(self.socket_path):
+            # Left behind by a daemon that did not shut down cleanly
+            os.unlink(self.socket_path)
+        
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _Handler)
+        self._server.daemon_threads = True
+        self._server.daemon = self
+        self._worker.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self._requests.put(None)
+            self._worker.join()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            close = getattr(self.cli.manager.storage, "close", None)
+            if close is not None:
+                close()
+    
+    def stop(self):
+        """Stop serving; serve_forever returns once queued commands are answered."""
+        if self._server is not None:
+            self._server.shutdown()
+    
+    def execute(self, args: List[str]) -> str:
+        """
+        Run a command on the worker and wait for it.
+        
+        Args:
+            args: Command-line arguments, as passed to TaskCLI.handle_command
+        
+        Returns:
+            What the command printed, once its changes are saved
+        """
+        reply: queue.SimpleQueue = queue.SimpleQueue()
+        self._requests.put((args, reply))
+        return reply.get()
+    
+    def _work(self):
+        """Run queued commands in groups until told to stop."""
+        while True:
+            group = [self._requests.get()]
+            while True:
+                try:
+                    group.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = group[-1] is None
+            group = [request for request in group if request is not None]
+            
+            # Consecutive ordinary commands share a commit; the others run alone
+            ordinary = []
+            for request in group:
+                args = request[0]
+                if args and args[0].lower() in _STANDALONE:
+                    self._commit(ordinary)
+                    ordinary = []
+                    self._commit([request], batched=False)
+                else:
+                    ordinary.append(request)
+            self._commit(ordinary)
+            if stopping:
+                return
+    
+    def _commit(self, group: List[Tuple[List[str], queue.SimpleQueue]], batched: bool = True):
+        """Run a group of commands, save their changes and answer them."""
+        if not group:
+            return
+        outputs = []
+        try:
+            if batched:
+                with self.cli.manager.batch():
+                    outputs = [self._run(args) for args, _ in group]
+            else:
+                outputs = [self._run(args) for args, _ in group]
+        except Exception as e:
+            outputs = [output + f"❌ Changes not saved: {e}\n"
+                       for output in outputs or [""] * len(group)]
+        self.commands += len(group)
+        self.commits += 1
+        for (_, reply), output in zip(group, outputs):
+            reply.put(output)
+    
+    def _run(self, args: List[str]) -> str:
+        """Run one command, returning what it printed."""
+        output = io.StringIO()
+        with redirect_stdout(output):
+            try:
+                self.cli.handle_command(args)
+            except Exception as e:
+                print(f"Error: {e}")
+        return output.getvalue()
+
+
+class DaemonClient:
+    """Sends CLI commands to a running TaskDaemon."""
+    
+    def __init__(self, socket_path: str):
+        """
+        Initialize the client.
+        
+        Args:
+            socket_path: Path of the daemon's Unix socket
+        """
+        self.socket_path = socket_path
+    
+    @classmethod
+    def connect(cls, socket_path: str) -> Optional["DaemonClient"]:
+        """
+        Get a client if a daemon is listening on the socket.
+        
+        Args:
+            socket_path: Path of the daemon's Unix socket
+        
+        Returns:
+            A client, or None if no daemon is running (or the platform
+            has no Unix sockets)
+        """
+        if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+            return None
+        client = cls(socket_path)
+        try:
+            client._request({"ping": True})
+        except OSError:
+            return None
+        return client
+    
+    def send(self, args: List[str]) -> str:
+        """
+        Run a command in the daemon.
+        
+        Args:
+            args: Command-line arguments, as passed to TaskCLI.handle_command
+        
+        Returns:
+            What the command printed
+        """
+        return self._request({"args": args})
+    
+    def stop(self) -> str:
+        """Ask the daemon to shut down."""
+        return self._request({"stop": True})
+    
+    def _request(self, request: dict) -> str:
+        """Send one request and wait for its reply."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(self.socket_path)
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            with connection.makefile("rb") as reply:
+                line = reply.readline()
+        if not line:
+            raise ConnectionError(f"No reply from the task daemon on {self.socket_path}")
+        return json.loads(line)["output"]
@@ -0,0 +1,278 @@
+"""
+Change feed: typed events describing task mutations, and subscriptions to them.
+"""
+
+import sys
+import threading
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from task import Task
+
+# Fields compared to describe an update, as exposed by Task
+FIELDS = ("title", "description", "status", "priority", "due_date", "created_at", "updated_at")
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "error", "block")
+
+
+class EventType(Enum):
+    """Kind of change an event describes."""
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+
+
+class TaskEvent:
+    """
+    One saved change to one task.
+    
+    Attributes:
+        sequence: Position in the manager's feed, increasing by one per event
+        type: Whether the task was created, updated or deleted
+        task_id: ID of the task
+        task: Copy of the task after the change (before it, for deletions)
+        changes: For updates, ``{field: (old value, new value)}`` for every
+            field that changed; empty for creations and deletions
+    """
+    
+    __slots__ = ("sequence", "type", "task_id", "task", "changes")
+    
+    def __init__(self, sequence: int, event_type: EventType, task: Task,
+                 changes: Optional[Dict[str, Tuple[Any, Any]]] = None):
+        self.sequence = sequence
+        self.type = event_type
+        self.task_id = task.id
+        self.task = task
+        self.changes = changes or {}
+    
+    @staticmethod
+    def diff(old: Task, new: Task) -> Dict[str, Tuple[Any, Any]]:
+        """Fields that differ between two states of a task, with both values."""
+        changes = {}
+        for field in FIELDS:
+            before, after = getattr(old, field), getattr(new, field)
+            if before != after:
+                changes[field] = (before, after)
+        return changes
+    
+    def __repr__(self) -> str:
+        return f"TaskEvent({self.sequence}, {self.type.value}, {self.task_id}, {sorted(self.changes)})"
+
+
+class EventOverflow(Exception):
+    """Raised to a consumer whose subscription overflowed under the "error" policy."""
+
+
+class Subscription:
+    """
+    One consumer's view of the change feed.
+    
+    With a callback, every event is passed to it synchronously, in order,
+    right after the change is saved; there is no buffer, so a slow
+    callback slows the writer down. A callback that raises is
+    unsubscribed, keeping the exception in ``error``, and the change it was
+    told about stays saved.
+    
+    Without a callback, events are buffered (at most ``maxsize`` of them)
+    for the consumer to read with ``async for`` or, from another thread,
+    with get(). When the buffer is full the overflow policy decides:
+    
+    - ``drop_oldest``: discard the oldest buffered event
+    - ``drop_newest``: discard the new event
+    - ``error``: close the subscription; the consumer gets the buffered
+      events and then EventOverflow, telling it to rebuild its view from
+      a fresh listing
+    - ``block``: make the writer wait for room. This works for writers
+      that can wait: other threads, and AsyncTaskManager, which waits
+      before each write. A writer running on the consumer's own event loop
+      cannot wait without deadlocking; its events are still buffered,
+      exceeding ``maxsize`` until the consumer catches up.
+    
+    Dropped events are counted in ``dropped``; a consumer that sees the
+    count grow knows its view is incomplete.
+    """
+    
+    def __init__(self, unsubscribe: Callable[["Subscription"], None],
+                 callback: Optional[Callable[[TaskEvent], None]] = None,
+                 types: Optional[Iterable[EventType]] = None,
+                 maxsize: int = 1000, overflow: str = "drop_oldest"):
+        """
+        Initialize a subscription (use TaskManager.subscribe).
+        
+        Args:
+            unsubscribe: Detaches the subscription from its feed
+            callback: Called with each event instead of buffering it
+            types: Event types to receive (all if None)
+            maxsize: Most events buffered at once
+            overflow: What to do when the buffer is full (see the class docstring)
+        
+        Raises:
+            ValueError: If maxsize is not positive or the policy is unknown
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow} (expected one of {', '.join(OVERFLOW_POLICIES)})")
+        self.callback = callback
+        self.types = frozenset(types) if types is not None else None
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.dropped = 0
+        self.error: Optional[BaseException] = None
+        self.closed = False
+        self._unsubscribe = unsubscribe
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        # Loop of the async consumer (assumed to be the subscriber's, until
+        # one starts iterating), the future it is waiting on, and futures
+        # of writers waiting for room
+        self._loop = _running_loop()
+        self._waiter = None
+        self._room_waiters: list = []
+    
+    def publish(self, event: TaskEvent):
+        """Deliver an event according to the subscription's settings (called by the feed)."""
+        if self.closed or (self.types is not None and event.type not in self.types):
+            return
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                self.error = e
+                self.close()
+            return
+        
+        with self._lock:
+            while len(self._buffer) >= self.maxsize and not self.closed:
+                if self.overflow == "drop_oldest":
+                    self._buffer.popleft()
+                    self.dropped += 1
+                elif self.overflow == "drop_newest":
+                    self.dropped += 1
+                    return
+                elif self.overflow == "error":
+                    self.error = EventOverflow(f"More than {self.maxsize} events were waiting to be read")
+                    self._close()
+                    return
+                elif self._on_consumer_loop():
+                    break
+                else:
+                    self._changed.wait()
+            if self.closed:
+                return
+            self._buffer.append(event)
+            self._wake()
+    
+    def get(self, timeout: Optional[float] = None) -> Optional[TaskEvent]:
+        """
+        Wait for the next buffered event, for consumers on another thread.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait until an event arrives
+        
+        Returns:
+            The event, or None on timeout or once the subscription is closed
+            and drained
+        
+        Raises:
+            EventOverflow: If the subscription overflowed under the "error" policy
+        """
+        with self._lock:
+            if not self._changed.wait_for(lambda: self._buffer or self.closed, timeout):
+                return None
+            return self._next()
+    
+    def close(self):
+        """Stop receiving events; buffered events can still be read."""
+        with self._lock:
+            self._close()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> TaskEvent:
+        # Imported here so that loading the manager never imports asyncio
+        import asyncio
+        while True:
+            with self._lock:
+                if self._buffer or self.closed:
+                    event = self._next()
+                    if event is None:
+                        raise StopAsyncIteration
+                    return event
+                self._loop = asyncio.get_running_loop()
+                self._waiter = waiter = self._loop.create_future()
+            await waiter
+    
+    async def wait_for_room(self):
+        """Wait until the buffer has room for another event, or the subscription is closed."""
+        import asyncio
+        while True:
+            with self._lock:
+                if self.callback is not None or len(self._buffer) < self.maxsize or self.closed:
+                    return
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._room_waiters.append((loop, waiter))
+            await waiter
+    
+    def _next(self) -> Optional[TaskEvent]:
+        """Pop the next event (lock held), raising a pending overflow once drained."""
+        if self._buffer:
+            event = self._buffer.popleft()
+            self._changed.notify_all()
+            self._wake_writers()
+            return event
+        if isinstance(self.error, EventOverflow):
+            error, self.error = self.error, None
+            raise error
+        return None
+    
+    def _close(self):
+        """Close with the lock held."""
+        if not self.closed:
+            self.closed = True
+            self._unsubscribe(self)
+        self._changed.notify_all()
+        self._wake()
+        self._wake_writers()
+    
+    def _wake(self):
+        """Wake the waiting async consumer, if any (lock held)."""
+        self._changed.notify_all()
+        waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            _resolve(self._loop, waiter)
+    
+    def _wake_writers(self):
+        """Wake async writers waiting for room (lock held)."""
+        waiters, self._room_waiters = self._room_waiters, []
+        for loop, waiter in waiters:
+            _resolve(loop, waiter)
+    
+    def _on_consumer_loop(self) -> bool:
+        """Whether the calling thread is running the async consumer's event loop."""
+        return self._loop is not None and _running_loop() is self._loop
+
+
+def _running_loop():
+    """The event loop running in the calling thread, if any."""
+    # No loop can be running before asyncio is imported, and importing it
+    # just to find that out would slow down every CLI command
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return None
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _resolve(loop, waiter):
+    """Resolve a future from any thread, unless it is already done."""
+    if _running_loop() is loop:
+        if not waiter.done():
+            waiter.set_result(None)
+    elif not loop.is_closed():
+        loop.call_soon_threadsafe(_resolve, loop, waiter)
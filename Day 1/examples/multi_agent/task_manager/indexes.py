@@ -0,0 +1,618 @@
+"""
+In-memory indexes maintained by the task manager.
+"""
+
+import gc
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import datetime
+from itertools import chain, count, islice
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from task import Task, TaskStatus, TaskPriority, to_timestamp
+
+# Tasks without a (parseable) due date sort as if due on 9999-12-31
+NO_DUE_DATE = to_timestamp(datetime(9999, 12, 31))
+
+# Sortable fields: key function and whether listings run in descending order.
+# Keys are the tasks' integer timestamps, which compare without parsing.
+SORT_KEYS: Dict[str, Tuple[Callable[[Task], Any], bool]] = {
+    "created_at": (lambda t: t.created_ts or 0, True),
+    "updated_at": (lambda t: t.updated_ts or 0, True),
+    "due_date": (lambda t: NO_DUE_DATE if t.due_ts is None else t.due_ts, False),
+}
+
+PRIORITY_ORDER = [TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW]
+
+# Extracts the task from a SortedView entry
+_task_of = itemgetter(2)
+
+
+def listing_key(task: Task, sort_by: str) -> int:
+    """
+    Get a task's position key in a listing.
+    
+    Listings run in ascending order of this key (descending fields are
+    negated), so it is what a pagination cursor records.
+    
+    Args:
+        task: Task to get the key of
+        sort_by: Sort field (created_at, updated_at, priority, due_date)
+    
+    Returns:
+        Integer key; equal keys list in insertion order
+    """
+    if sort_by == "priority":
+        return PRIORITY_ORDER.index(task.priority)
+    key, descending = SORT_KEYS.get(sort_by, SORT_KEYS["created_at"])
+    return -key(task) if descending else key(task)
+
+
+class PrefixIndex:
+    """Sorted index of task IDs for resolving short ID prefixes."""
+    
+    def __init__(self, task_ids: Iterable[str] = ()):
+        """
+        Initialize the index.
+        
+        Args:
+            task_ids: Initial task IDs (sorted once, in bulk)
+        """
+        self._ids = sorted(task_ids)
+    
+    def add(self, task_id: str):
+        """Add a task ID to the index."""
+        insort(self._ids, task_id)
+    
+    def remove(self, task_id: str):
+        """Remove a task ID from the index."""
+        position = bisect_left(self._ids, task_id)
+        if position < len(self._ids) and self._ids[position] == task_id:
+            del self._ids[position]
+    
+    def match(self, prefix: str, limit: int = 2) -> List[str]:
+        """
+        Find task IDs starting with a prefix.
+        
+        Args:
+            prefix: Leading characters of a task ID
+            limit: Maximum number of matches to return
+        
+        Returns:
+            Up to ``limit`` matching task IDs in sorted order
+        """
+        matches = []
+        position = bisect_left(self._ids, prefix)
+        while position < len(self._ids) and len(matches) < limit:
+            if not self._ids[position].startswith(prefix):
+                break
+            matches.append(self._ids[position])
+            position += 1
+        return matches
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class SortedView:
+    """
+    Tasks kept sorted by one key.
+    
+    Entries are ``(key, tiebreak, task)`` tuples. The tiebreak is the
+    task's insertion sequence (negated for descending views), so iteration
+    reproduces the order a stable sort of the insertion-ordered list gives,
+    and since it is unique, tuple comparison never reaches the task itself.
+    """
+    
+    def __init__(self, key: Callable[[Task], Any], descending: bool = False):
+        """
+        Initialize an empty view.
+        
+        Args:
+            key: Function extracting the sort key from a task
+            descending: Whether the view is iterated from the largest key
+        """
+        self.key = key
+        self.descending = descending
+        self._entries: List[tuple] = []
+    
+    def _entry(self, task: Task, seq: int) -> tuple:
+        return (self.key(task), -seq if self.descending else seq, task)
+    
+    def build(self, tasks: List[Tuple[Task, int]]):
+        """
+        Bulk-load tasks with a single sort.
+        
+        Args:
+            tasks: ``(task, seq)`` pairs in ascending seq order
+        """
+        key = self.key
+        if self.descending:
+            self._entries = [(key(task), -seq, task) for task, seq in reversed(tasks)]
+        else:
+            self._entries = [(key(task), seq, task) for task, seq in tasks]
+        # The input is already in tiebreak order, so a stable sort on the
+        # key alone gives the full (key, tiebreak) order without comparing tuples
+        self._entries.sort(key=itemgetter(0))
+    
+    def add(self, task: Task, seq: int):
+        """Insert a task."""
+        insort(self._entries, self._entry(task, seq))
+    
+    def remove(self, task: Task, seq: int):
+        """Remove a task, given the field values it was inserted with."""
+        probe = self._entry(task, seq)[:2]
+        position = bisect_left(self._entries, probe)
+        if position < len(self._entries) and self._entries[position][:2] == probe:
+            del self._entries[position]
+    
+    def __iter__(self) -> Iterator[tuple]:
+        """Yield entries in listing order."""
+        return reversed(self._entries) if self.descending else iter(self._entries)
+    
+    def after(self, key: Any, seq: Optional[int] = None) -> Iterator[tuple]:
+        """
+        Yield the entries that follow a position, in listing order.
+        
+        Args:
+            key: Sort key of the position
+            seq: Insertion sequence of the task at the position, or None to
+                start at the first entry with that key instead
+        
+        Returns:
+            Iterator of entries, found by bisection rather than by skipping
+        """
+        entries = self._entries
+        if self.descending:
+            end = bisect_left(entries, (key, math.inf if seq is None else -seq))
+            return map(entries.__getitem__, range(end - 1, -1, -1))
+        start = bisect_left(entries, (key,) if seq is None else (key, seq + 1))
+        return map(entries.__getitem__, range(start, len(entries)))
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TaskIndex:
+    """
+    Secondary indexes over tasks for filtered, sorted listings.
+    
+    Tasks are partitioned by (status, priority), and again by status alone.
+    Each partition keeps a SortedView per sortable field, and the
+    (status, priority) partitions also keep one in insertion order for
+    sorting by priority. A listing filtered by status reads a single
+    partition directly; other listings merge a few pre-sorted partitions.
+    Either way, tasks outside the result are never touched.
+    """
+    
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initialize the index.
+        
+        Args:
+            tasks: Initial tasks (indexed in bulk)
+        """
+        self._next_seq = count()
+        self._seq: Dict[str, int] = {}
+        self._partitions: Dict[Tuple[TaskStatus, Optional[TaskPriority]], Dict[str, SortedView]] = {}
+        
+        # The bulk build allocates millions of acyclic tuples; pausing the
+        # cyclic garbage collector avoids repeated full-heap traversals.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            groups: Dict[Tuple[TaskStatus, Optional[TaskPriority]], List[Tuple[Task, int]]] = {}
+            for task in tasks:
+                seq = self._seq[task.id] = next(self._next_seq)
+                for partition_key in self._partition_keys(task):
+                    groups.setdefault(partition_key, []).append((task, seq))
+            for partition_key, members in groups.items():
+                for view in self._partition(partition_key).values():
+                    view.build(members)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    
+    @staticmethod
+    def _partition_keys(task: Task) -> Tuple[tuple, tuple]:
+        return (task.status, task.priority), (task.status, None)
+    
+    def _partition(self, partition_key: Tuple[TaskStatus, Optional[TaskPriority]]) -> Dict[str, SortedView]:
+        partition = self._partitions.get(partition_key)
+        if partition is None:
+            partition = {name: SortedView(key, descending) for name, (key, descending) in SORT_KEYS.items()}
+            if partition_key[1] is not None:
+                partition["insertion"] = SortedView(lambda t: 0)
+            self._partitions[partition_key] = partition
+        return partition
+    
+    def add(self, task: Task):
+        """Index a new task."""
+        seq = self._seq[task.id] = next(self._next_seq)
+        for partition_key in self._partition_keys(task):
+            for view in self._partition(partition_key).values():
+                view.add(task, seq)
+    
+    def remove(self, task: Task):
+        """Drop a task from the index (a task it does not hold is ignored)."""
+        seq = self._seq.pop(task.id, None)
+        if seq is None:
+            return
+        for partition_key in self._partition_keys(task):
+            for view in self._partition(partition_key).values():
+                view.remove(task, seq)
+    
+    def update(self, old: Task, new: Task):
+        """
+        Re-index a task after a change, adding it if the index did not hold it.
+        
+        Args:
+            old: Copy of the task taken before the change
+            new: The task after the change
+        """
+        seq = self._seq.get(new.id)
+        if seq is None:
+            self.add(new)
+            return
+        for partition_key in self._partition_keys(old):
+            for view in self._partition(partition_key).values():
+                view.remove(old, seq)
+        for partition_key in self._partition_keys(new):
+            for view in self._partition(partition_key).values():
+                view.add(new, seq)
+    
+    def query(self, status: Optional[TaskStatus] = None,
+              priority: Optional[TaskPriority] = None,
+              sort_by: str = "created_at",
+              after: Optional[Tuple[int, str]] = None,
+              limit: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterate over matching tasks in sort order.
+        
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            sort_by: Sort field (created_at, updated_at, priority, due_date)
+            after: ``(listing_key, task_id)`` of the task to resume after.
+                If that task is gone, resume at the first task with its key.
+            limit: Most tasks the caller will read. Partitions are then
+                merged lazily instead of being sorted together up front.
+        
+        Returns:
+            Iterator of tasks from the matching partitions
+        """
+        seq = self._seq.get(after[1]) if after else None
+        
+        if sort_by == "priority":
+            levels = [priority] if priority else PRIORITY_ORDER
+            if after is not None:
+                levels = [level for level in levels if PRIORITY_ORDER.index(level) >= after[0]]
+            
+            def level_entries(level):
+                views = self._views("insertion", status, level)
+                if after is not None and PRIORITY_ORDER.index(level) == after[0]:
+                    return _merge_after(views, False, 0, seq)
+                return _merge(views, descending=False, lazy=limit is not None)
+            
+            return map(_task_of, chain.from_iterable(map(level_entries, levels)))
+        
+        if sort_by not in SORT_KEYS:
+            sort_by = "created_at"
+        descending = SORT_KEYS[sort_by][1]
+        views = self._views(sort_by, status, priority)
+        if after is None:
+            return map(_task_of, _merge(views, descending, lazy=limit is not None))
+        key = -after[0] if descending else after[0]
+        return map(_task_of, _merge_after(views, descending, key, seq))
+    
+    def _views(self, name: str, status: Optional[TaskStatus],
+               priority: Optional[TaskPriority]) -> List[SortedView]:
+        """Collect the views that together hold exactly the matching tasks."""
+        return [
+            partition[name]
+            for (partition_status, partition_priority), partition in self._partitions.items()
+            if (status is None or partition_status == status) and partition_priority == priority
+        ]
+    
+    def __len__(self) -> int:
+        return len(self._seq)
+
+
+class StatisticsIndex:
+    """
+    Running task counts for statistics without rescanning.
+    
+    Status and priority buckets are plain counters adjusted on every
+    change. Overdue tracking works on the tasks' integer due timestamps:
+    tasks that are not yet overdue wait in a min-heap ordered by due date, and asking for the
+    count pops whatever has fallen due since the last call, so the count
+    moves forward with the clock at amortized O(1) cost.
+    """
+    
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initialize the counters.
+        
+        Args:
+            tasks: Initial tasks
+        """
+        self.by_status: Counter = Counter()
+        self.by_priority: Counter = Counter()
+        self._due: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+        self._overdue = set()
+        for task in tasks:
+            self.by_status[task.status] += 1
+            self.by_priority[task.priority] += 1
+            due = self._due_timestamp(task)
+            if due is not None:
+                self._due[task.id] = due
+                self._heap.append((due, task.id))
+        heapq.heapify(self._heap)
+    
+    @staticmethod
+    def _due_timestamp(task: Task) -> Optional[int]:
+        """Get the due timestamp of a task that can become overdue."""
+        if task.status == TaskStatus.COMPLETED:
+            return None
+        return task.due_ts
+    
+    def add(self, task: Task):
+        """Count a new task."""
+        self.by_status[task.status] += 1
+        self.by_priority[task.priority] += 1
+        due = self._due_timestamp(task)
+        if due is not None:
+            self._due[task.id] = due
+            heapq.heappush(self._heap, (due, task.id))
+    
+    def remove(self, task: Task):
+        """Stop counting a task."""
+        self.by_status[task.status] -= 1
+        self.by_priority[task.priority] -= 1
+        # Heap entries are invalidated lazily: an entry only counts while
+        # it still matches the task's current due date in self._due
+        self._due.pop(task.id, None)
+        self._overdue.discard(task.id)
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(due, task_id) for task_id, due in self._due.items()]
+            heapq.heapify(self._heap)
+    
+    def update(self, old: Task, new: Task):
+        """
+        Recount a task after a change.
+        
+        Args:
+            old: Copy of the task taken before the change
+            new: The task after the change
+        """
+        self.remove(old)
+        self.add(new)
+    
+    def overdue_count(self, now: Optional[datetime] = None) -> int:
+        """
+        Count overdue tasks.
+        
+        Args:
+            now: Point in time to evaluate against (defaults to now)
+        
+        Returns:
+            Number of non-completed tasks whose due date has passed
+        """
+        now = to_timestamp(now or datetime.now())
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            due, task_id = heapq.heappop(heap)
+            if self._due.get(task_id) == due:
+                del self._due[task_id]
+                self._overdue.add(task_id)
+        return len(self._overdue)
+    
+    def __len__(self) -> int:
+        return sum(self.by_status.values())
+
+
+_WORD = re.compile(r"\w+")
+_QUERY_TERM = re.compile(r"(\w+)(\*?)")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into case-folded word tokens.
+    
+    Args:
+        text: Text to tokenize
+    
+    Returns:
+        List of tokens in order of appearance
+    """
+    return _WORD.findall(text.casefold())
+
+
+class SearchIndex:
+    """
+    Inverted index over task titles and descriptions.
+    
+    Every term maps to the IDs of the tasks containing it, with a weight
+    per task: occurrences in the description count once and occurrences
+    in the title TITLE_WEIGHT times. A sorted vocabulary lets a query term
+    ending in ``*`` match every term with that prefix. Queries intersect
+    postings starting from the rarest term and rank by TF-IDF, so their
+    cost depends on the postings touched, never on the number of tasks.
+    """
+    
+    TITLE_WEIGHT = 3
+    
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initialize the index.
+        
+        Args:
+            tasks: Initial tasks (indexed in bulk)
+        """
+        self._postings: Dict[str, Dict[str, int]] = {}
+        # Upper bound on each term's weight; never lowered by removals
+        self._ceilings: Dict[str, int] = {}
+        self._size = 0
+        # Millions of small dicts are allocated; see TaskIndex.__init__
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            postings, ceilings = self._postings, self._ceilings
+            for task in tasks:
+                self._size += 1
+                for term, weight in self._weights(task).items():
+                    entry = postings.get(term)
+                    if entry is None:
+                        entry = postings[term] = {}
+                        ceilings[term] = weight
+                    elif weight > ceilings[term]:
+                        ceilings[term] = weight
+                    entry[task.id] = weight
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        self._vocabulary = sorted(self._postings)
+    
+    def _weights(self, task: Task) -> Counter:
+        """Count the weighted occurrences of each term in a task."""
+        weights = Counter(tokenize(task.description))
+        for term in tokenize(task.title):
+            weights[term] += self.TITLE_WEIGHT
+        return weights
+    
+    def add(self, task: Task):
+        """Index a new task."""
+        self._size += 1
+        for term, weight in self._weights(task).items():
+            entry = self._postings.get(term)
+            if entry is None:
+                entry = self._postings[term] = {}
+                self._ceilings[term] = weight
+                insort(self._vocabulary, term)
+            elif weight > self._ceilings[term]:
+                self._ceilings[term] = weight
+            entry[task.id] = weight
+    
+    def remove(self, task: Task):
+        """Drop a task, given the text it was indexed with."""
+        self._size -= 1
+        for term in self._weights(task):
+            entry = self._postings.get(term)
+            if entry is None:
+                continue
+            entry.pop(task.id, None)
+            if not entry:
+                del self._postings[term]
+                del self._ceilings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+    
+    def update(self, old: Task, new: Task):
+        """
+        Re-index a task after a change.
+        
+        Args:
+            old: Copy of the task taken before the change
+            new: The task after the change
+        """
+        if old.title != new.title or old.description != new.description:
+            self.remove(old)
+            self.add(new)
+    
+    def _matches(self, term: str, prefix: bool) -> Tuple[Dict[str, int], int]:
+        """
+        Get the postings of a term, merged over all its completions for a prefix.
+        
+        Returns:
+            Tuple of (task ID to weight mapping, upper bound on the weights)
+        """
+        if not prefix:
+            return self._postings.get(term, {}), self._ceilings.get(term, 0)
+        merged: Dict[str, int] = {}
+        position = bisect_left(self._vocabulary, term)
+        for completion in islice(self._vocabulary, position, None):
+            if not completion.startswith(term):
+                break
+            for task_id, weight in self._postings[completion].items():
+                merged[task_id] = merged.get(task_id, 0) + weight
+        return merged, max(merged.values(), default=0)
+    
+    def search(self, query: str, limit: int = 20) -> List[Tuple[str, float]]:
+        """
+        Find the tasks containing every term of a query.
+        
+        Args:
+            query: Words to look for; a word ending in ``*`` matches as a prefix
+            limit: Maximum number of results (none if not positive)
+        
+        Returns:
+            (task ID, score) pairs, best match first
+        """
+        terms = {(word, bool(star)) for word, star in _QUERY_TERM.findall(query.casefold())}
+        if not terms or limit <= 0:
+            return []
+        found = sorted((self._matches(term, prefix) for term, prefix in terms), key=lambda match: len(match[0]))
+        if not found[0][0]:
+            return []
+        matches = [postings for postings, _ in found]
+        
+        # Inverse document frequency: rare terms contribute more to the score
+        idfs = [math.log(1 + self._size / len(postings)) for postings in matches]
+        rarest, others = matches[0], matches[1:]
+        candidates = (task_id for task_id in rarest if all(task_id in postings for postings in others))
+        # No task can score above this, so once the kept results all reach
+        # it the remaining candidates need not be looked at. For queries
+        # made of common words this cuts a pass over every match short.
+        ceiling = sum(bound * idf for (_, bound), idf in zip(found, idfs))
+        
+        # Min-heap of the best (score, -arrival, task ID) so far; a later
+        # candidate must score strictly higher to displace an earlier one
+        best: List[Tuple[float, int, str]] = []
+        for arrival, task_id in enumerate(candidates):
+            score = sum(postings[task_id] * idf for postings, idf in zip(matches, idfs))
+            if len(best) < limit:
+                heapq.heappush(best, (score, -arrival, task_id))
+            elif score > best[0][0]:
+                heapq.heapreplace(best, (score, -arrival, task_id))
+            elif best[0][0] >= ceiling:
+                break
+        best.sort(reverse=True)
+        return [(task_id, score) for score, _, task_id in best]
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+def _merge(views: List[SortedView], descending: bool, lazy: bool = False) -> Iterator[tuple]:
+    """
+    Merge already-sorted views into one ordered stream of entries.
+    
+    Args:
+        views: Views to merge
+        descending: Whether the views list in descending order
+        lazy: Merge with a heap as entries are consumed, for callers that
+            only read the first few
+    """
+    views = [view for view in views if len(view)]
+    if not views:
+        return iter(())
+    if len(views) == 1:
+        return iter(views[0])
+    if lazy:
+        return heapq.merge(*views, reverse=descending)
+    # Timsort detects the pre-sorted runs and merges them in C, which beats
+    # a heap merge in Python by a wide margin for the handful of partitions
+    entries = [entry for view in views for entry in view._entries]
+    entries.sort()
+    return reversed(entries) if descending else iter(entries)
+
+
+def _merge_after(views: List[SortedView], descending: bool, key: Any, seq: Optional[int]) -> Iterator[tuple]:
+    """Lazily merge the entries of each view that follow a position (see SortedView.after)."""
+    views = [view for view in views if len(view)]
+    if len(views) == 1:
+        return views[0].after(key, seq)
+    return heapq.merge(*(view.after(key, seq) for view in views), reverse=descending)
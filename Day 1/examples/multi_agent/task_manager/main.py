@@ -3,18 +3,130 @@
 Main entry point for the Task Management CLI application.
 """
 
+import os
 import sys
-from cli import TaskCLI
-from storage import FileStorage
-from task_manager import TaskManager
+from daemon import DaemonClient, TaskDaemon
+
+# The CLI and storage modules are imported where they are used, so that
+# commands handed to a running daemon start no slower than they must
+
+JSON_FILE = "tasks.json"
+NDJSON_FILE = "tasks.ndjson"
+BINARY_FILE = "tasks.bin"
+PARTITIONED_DIR = "tasks.partitioned"
+SOCKET_FILE = "tasks.sock"
+
+# Formats tasks can be migrated to from tasks.json, and back (functions in storage)
+CONVERTERS = {
+    "ndjson": (NDJSON_FILE, "migrate_json_to_ndjson", "migrate_ndjson_to_json"),
+    "binary": (BINARY_FILE, "migrate_json_to_binary", "migrate_binary_to_json"),
+    "partitioned": (PARTITIONED_DIR, "migrate_json_to_partitioned", "migrate_partitioned_to_json"),
+}
+
+
+def create_storage():
+    """Open the store tasks were migrated to, else the JSON file."""
+    from storage import BinaryFileStorage, FileStorage, NDJSONStorage, PartitionedStorage
+    if os.path.exists(NDJSON_FILE):
+        return NDJSONStorage(NDJSON_FILE)
+    if os.path.exists(BINARY_FILE):
+        return BinaryFileStorage(BINARY_FILE)
+    if os.path.exists(PARTITIONED_DIR):
+        return PartitionedStorage(PARTITIONED_DIR)
+    return FileStorage(JSON_FILE)
+
+
+def migrate(target: str):
+    """
+    Convert the task store between tasks.json and the other formats.
+    
+    Args:
+        target: Format to migrate to ("ndjson", "binary", "partitioned" or "json")
+    """
+    import storage
+    if target in CONVERTERS:
+        path, to_target, _ = CONVERTERS[target]
+        others = [other for name, (other, _, _) in CONVERTERS.items() if name != target and os.path.exists(other)]
+        if others:
+            print(f"❌ Tasks are stored in {others[0]}; migrate back to json first")
+            return
+        count = getattr(storage, to_target)(JSON_FILE, path)
+        print(f"✅ Migrated {count} tasks to {path}")
+    elif target == "json":
+        for path, _, to_json in CONVERTERS.values():
+            if os.path.exists(path):
+                count = getattr(storage, to_json)(path, JSON_FILE)
+                # The JSON file now holds every task, and the other format would otherwise take precedence
+                if os.path.isdir(path):
+                    import shutil
+                    shutil.rmtree(path)
+                else:
+                    os.unlink(path)
+                print(f"✅ Migrated {count} tasks to {JSON_FILE}")
+                return
+        print(f"❌ Nothing to migrate: tasks are already in {JSON_FILE}")
+    else:
+        print(f"Usage: migrate {'|'.join(CONVERTERS)}|json")
+
+
+def run_daemon(args):
+    """
+    Start the task daemon in the foreground, or stop a running one.
+    
+    Args:
+        args: Arguments after "daemon": none to start, "stop" to stop
+    """
+    client = DaemonClient.connect(SOCKET_FILE)
+    if args[:1] == ["stop"]:
+        print(client.stop() if client is not None else "❌ No task daemon is running\n", end="")
+        return
+    if args:
+        print("Usage: daemon [stop]")
+        return
+    if client is not None:
+        print(f"❌ A task daemon is already running on {SOCKET_FILE}")
+        return
+    
+    from cli import TaskCLI
+    from task_manager import TaskManager
+    # Load the tasks up front, so that the first command is as quick as the rest
+    cli = TaskCLI(TaskManager(create_storage()))
+    daemon = TaskDaemon(cli, SOCKET_FILE)
+    print(f"✅ Task daemon listening on {SOCKET_FILE} (Ctrl+C or 'daemon stop' to stop)", flush=True)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"Served {daemon.commands} commands with {daemon.commits} commits")
 
 
 def main():
     """Main function to run the task management CLI."""
-    # Initialize storage and task manager
-    storage = FileStorage("tasks.json")
-    manager = TaskManager(storage)
-    cli = TaskCLI(manager)
+    args = sys.argv[1:]
+    if args[:1] == ["daemon"]:
+        run_daemon(args[1:])
+        return
+    
+    # A running daemon already holds the tasks in memory: hand it the command
+    client = DaemonClient.connect(SOCKET_FILE)
+    if args[:1] == ["migrate"]:
+        if client is not None:
+            print("❌ Stop the task daemon first: daemon stop")
+            return
+        migrate(args[1] if len(args) > 1 else "")
+        return
+    if client is not None:
+        if args:
+            print(client.send(args), end="")
+        else:
+            from cli import RemoteTaskCLI
+            RemoteTaskCLI(client).run()
+        return
+    
+    from cli import TaskCLI
+    # Tasks are loaded by the first command that needs them, so a single
+    # add appends to the store and help never touches it
+    cli = TaskCLI(storage=create_storage())
     
     # Check for command line arguments
     if len(sys.argv) > 1:
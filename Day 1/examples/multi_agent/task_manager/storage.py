@@ -2,14 +2,167 @@
 Storage abstraction layer for task persistence.
 """
 
+import hashlib
 import json
+import mmap
 import os
-from typing import List
-from task import Task
+import struct
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from task import Task, TaskStatus
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def atomic_write_json(filepath: str, data, indent=None):
+    """
+    Write JSON to a file atomically.
+    
+    The data is written to a temporary file in the same directory, flushed
+    to disk and then renamed over the target, so a crash mid-write leaves
+    either the old or the new file, never a truncated one.
+    
+    Args:
+        filepath: Destination path
+        data: JSON-serializable object
+        indent: Indentation passed to json.dump
+    """
+    with atomic_file(filepath, 'w', ".json") as f:
+        json.dump(data, f, indent=indent)
+
+
+@contextmanager
+def atomic_file(filepath: str, mode: str = 'wb', suffix: str = ""):
+    """
+    Open a temporary file that atomically replaces another one.
+    
+    The temporary file is created in the same directory, and once the
+    block exits it is flushed to disk and renamed over the target. If the
+    block raises, the temporary file is removed and the target left as is.
+    
+    Args:
+        filepath: Destination path
+        mode: Mode to open the temporary file with ('w' or 'wb')
+        suffix: Suffix of the temporary file name
+    
+    Yields:
+        The open temporary file
+    """
+    # Imported here: tempfile pulls in shutil and random, which commands
+    # that only read tasks never need
+    import tempfile
+    directory = os.path.dirname(os.path.abspath(filepath))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=suffix)
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filepath)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    Hold an exclusive advisory lock on a file, creating it if missing.
+    
+    Only processes that take the same lock are excluded. Lock a separate
+    file rather than one that is replaced by renaming, since the lock
+    belongs to the inode the path pointed to when it was taken.
+    
+    Args:
+        path: Path of the lock file
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def merge_tasks(base: Dict[str, dict], ours: List[dict], theirs: List[dict]) -> List[dict]:
+    """
+    Three-way merge of two task lists that diverged from a common base.
+    
+    A task added, changed or deleted on one side only takes that side's
+    version. A task changed on both sides is merged field by field, and
+    where both changed the same field, ours wins. A task deleted on one
+    side but changed on the other is kept in its changed form.
+    
+    Args:
+        base: Common ancestor, as task dictionaries by ID
+        ours: Task dictionaries being saved
+        theirs: Task dictionaries currently stored
+    
+    Returns:
+        Merged task dictionaries, in stored order followed by our new tasks
+    """
+    ours_by_id = {task["id"]: task for task in ours}
+    merged = []
+    for their_task in theirs:
+        task_id = their_task["id"]
+        original = base.get(task_id)
+        our_task = ours_by_id.pop(task_id, None)
+        if our_task is None:
+            # Deleted by us: drop it unless they changed it since
+            if original is None or original != their_task:
+                merged.append(their_task)
+        elif original is None:
+            # Added on both sides under the same ID
+            merged.append(our_task)
+        elif our_task == original:
+            merged.append(their_task)
+        elif their_task == original:
+            merged.append(our_task)
+        else:
+            merged.append({
+                field: their_task.get(field) if our_task.get(field) == original.get(field) else our_task.get(field)
+                for field in dict.fromkeys(chain(our_task, their_task))
+            })
+    for task_id, our_task in ours_by_id.items():
+        # New on our side, or deleted by them: keep it unless we left it unchanged
+        if base.get(task_id) != our_task:
+            merged.append(our_task)
+    return merged
 
 
 class FileStorage:
-    """File-based storage implementation using JSON."""
+    """
+    File-based storage implementation using JSON.
+    
+    Several processes can share the file. Saves hold an advisory lock on
+    ``<filepath>.lock`` and replace the file atomically, so readers never
+    see a partial write. If another process saved since this one last
+    loaded or saved, the tasks are merged (see merge_tasks) against the
+    state this process last saw instead of overwriting that process's
+    changes.
+    
+    The file is parsed into dictionaries and Task objects are only built
+    for the tasks asked for (load_task_ids and read_task), and single-task
+    writes re-encode only the task they change. New tasks are spliced into
+    the end of the file as it is on disk, so adding one never needs the
+    others to be loaded at all.
+    """
     
     def __init__(self, filepath: str):
         """
@@ -19,13 +172,21 @@ class FileStorage:
             filepath: Path to the JSON file for storing tasks
         """
         self.filepath = filepath
+        self.lock_path = filepath + ".lock"
+        # Task dictionaries as last loaded or saved, and a digest of the
+        # file contents if they match them exactly. File metadata is not enough to
+        # detect changes: inodes are recycled across renames and mtimes are
+        # too coarse to tell apart saves of the same size.
+        self._base: Dict[str, dict] = {}
+        self._version: Optional[bytes] = None
         self.ensure_file_exists()
     
     def ensure_file_exists(self):
         """Create the storage file if it doesn't exist."""
         if not os.path.exists(self.filepath):
-            with open(self.filepath, 'w') as f:
-                json.dump([], f)
+            with file_lock(self.lock_path):
+                if not os.path.exists(self.filepath):
+                    atomic_write_json(self.filepath, [])
     
     def load_tasks(self) -> List[Task]:
         """
@@ -34,50 +195,1372 @@ class FileStorage:
         Returns:
             List of Task objects
         """
+        return [Task.from_dict(task_dict) for task_dict in self._load().values()]
+    
+    def load_task_ids(self) -> List[str]:
+        """
+        Parse the storage file without building Task objects.
+        
+        Returns:
+            IDs of the stored tasks in file order
+        """
+        return list(self._load())
+    
+    def read_task(self, task_id: str) -> Optional[Task]:
+        """
+        Build one task parsed by the last load.
+        
+        Args:
+            task_id: ID of the task
+        
+        Returns:
+            The task, or None if it is not stored
+        """
+        task_dict = self._base.get(task_id)
+        return Task.from_dict(task_dict) if task_dict is not None else None
+    
+    def iter_tasks(self) -> Iterator[Task]:
+        """Build every task parsed by the last load, in file order."""
+        return (Task.from_dict(task_dict) for task_dict in list(self._base.values()))
+    
+    def save_tasks(self, tasks: List[Task]):
+        """
+        Save tasks to the storage file, merging changes saved by other processes.
+        
+        Args:
+            tasks: List of Task objects to save
+        """
+        self._save([task.to_dict() for task in tasks])
+    
+    def add_task(self, task: Task):
+        """Append a new task to the storage file."""
+        self.write_batch([("add", task)])
+    
+    def update_task(self, task: Task):
+        """Save the new state of an updated task."""
+        self.write_batch([("update", task)])
+    
+    def delete_task(self, task_id: str):
+        """Remove a task from the storage file."""
+        self._write_changes([("delete", task_id, None)])
+    
+    def write_batch(self, changes: List[Tuple[str, Task]]):
+        """
+        Save several changes with a single write.
+        
+        Args:
+            changes: (op, task) pairs, op being "add", "update" or "delete"
+        """
+        self._write_changes([
+            (op, task.id, None if op == "delete" else task.to_dict()) for op, task in changes
+        ])
+    
+    def clear(self):
+        """Clear all tasks from storage."""
+        with file_lock(self.lock_path):
+            atomic_write_json(self.filepath, [])
+            self._version = self._read()[1]
+        self._base = {}
+    
+    def _load(self) -> Dict[str, dict]:
+        """Parse the file into the base task dictionaries and return them."""
+        raw, self._version = self._read()
+        self._base = {task_dict["id"]: task_dict for task_dict in self._parse(raw)}
+        return self._base
+    
+    def _save(self, data: List[dict]):
+        """Write task dictionaries, merging if another process saved since our last load."""
+        with file_lock(self.lock_path):
+            raw, version = self._read()
+            if version == self._version:
+                atomic_write_json(self.filepath, data, indent=2)
+                self._version = self._read()[1]
+            else:
+                atomic_write_json(self.filepath, merge_tasks(self._base, data, self._parse(raw)), indent=2)
+                # The file now holds changes the caller has not loaded, so
+                # later saves must merge again until the next load
+                self._version = None
+        self._base = {task_dict["id"]: task_dict for task_dict in data}
+    
+    def _write_changes(self, changes: List[Tuple[str, str, Optional[dict]]]):
+        """
+        Apply changes to the base task dictionaries and save the result.
+        
+        Args:
+            changes: (op, task ID, task dictionary or None for deletes)
+        """
+        if all(op == "add" for op, _, _ in changes):
+            self._splice([task_dict for _, _, task_dict in changes])
+            return
+        data = dict(self._base)
+        for op, task_id, task_dict in changes:
+            if op == "delete":
+                data.pop(task_id, None)
+            else:
+                data[task_id] = task_dict
+        self._save(list(data.values()))
+    
+    def _splice(self, records: List[dict]):
+        """
+        Splice new task dictionaries into the end of the stored array.
+        
+        Works on the file as it is on disk, under the lock, so nothing
+        saved by another process is lost and no merge is needed. The bytes
+        written match what a full save would produce.
+        """
+        # Drop the brackets but keep the indentation of array elements
+        body = json.dumps(records, indent=2)[2:-2].encode()
+        with file_lock(self.lock_path):
+            # The digest only matters if our view matched the file so far
+            tracked = self._version is not None
+            raw, version = self._read(digest=tracked)
+            head = (raw or b"").rstrip()
+            if not (head.startswith(b"[") and head.endswith(b"]")):
+                # Missing or corrupt, which loading treats as empty
+                head = b"[]"
+            head = head[:-1].rstrip()
+            content = head + (b"\n" if head == b"[" else b",\n") + body + b"\n]"
+            with atomic_file(self.filepath, 'wb', ".json") as f:
+                f.write(content)
+            if tracked and version == self._version:
+                self._version = hashlib.blake2b(content, digest_size=16).digest()
+        for task_dict in records:
+            self._base[task_dict["id"]] = task_dict
+    
+    def _read(self, digest: bool = True) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """Read the raw file contents and, if asked for, their digest (None if there is no file)."""
+        try:
+            with open(self.filepath, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None, None
+        return raw, hashlib.blake2b(raw, digest_size=16).digest() if digest else None
+    
+    @staticmethod
+    def _parse(raw: Optional[bytes]) -> List[dict]:
+        """Decode task dictionaries, treating a missing or corrupt file as empty."""
+        try:
+            return json.loads(raw) if raw is not None else []
+        except json.JSONDecodeError:
+            return []
+
+
+class JournaledFileStorage(FileStorage):
+    """
+    File storage that journals single-task mutations.
+    
+    The JSON file at ``filepath`` is a snapshot in the same format used by
+    FileStorage. Every add, update and delete is appended as one line to
+    ``<filepath>.journal`` instead of rewriting the snapshot, so a write
+    costs O(1) regardless of how many tasks are stored. Loading replays
+    the journal on top of the snapshot, and once the journal grows past a
+    fraction of the snapshot size it is compacted back into a new snapshot.
+    """
+    
+    def __init__(self, filepath: str, compact_ratio: float = 0.5,
+                 min_compact_bytes: int = 1024 * 1024, fsync: bool = False):
+        """
+        Initialize journaled file storage.
+        
+        Args:
+            filepath: Path to the JSON snapshot file
+            compact_ratio: Compact once the journal exceeds this fraction of the snapshot size
+            min_compact_bytes: Never compact a journal smaller than this many bytes
+            fsync: Flush every journal record to disk before returning
+        """
+        self.journal_path = filepath + ".journal"
+        self.compact_ratio = compact_ratio
+        self.min_compact_bytes = min_compact_bytes
+        self.fsync = fsync
+        # Offset just past the last complete journal record (None until read)
+        self._journal_end: Optional[int] = None
+        super().__init__(filepath)
+    
+    def _load(self) -> Dict[str, dict]:
+        """
+        Load the snapshot and replay the journal on top of it.
+        
+        A torn record at the end of the journal (left by a crash while
+        appending) is ignored, and overwritten by the next append.
+        
+        Returns:
+            Task dictionaries by ID
+        """
+        tasks: Dict[str, dict] = {}
         try:
             with open(self.filepath, 'r') as f:
-                data = json.load(f)
-                return [Task.from_dict(task_dict) for task_dict in data]
+                for task_dict in json.load(f):
+                    tasks[task_dict["id"]] = task_dict
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            pass
+        
+        for record in self._read_journal():
+            if record["op"] == "delete":
+                tasks.pop(record["id"], None)
+            else:
+                tasks[record["task"]["id"]] = record["task"]
+        
+        self._base = tasks
+        return tasks
+    
+    def save_tasks(self, tasks: List[Task]):
+        """
+        Write a full snapshot and reset the journal.
+        
+        Args:
+            tasks: List of Task objects to save
+        """
+        atomic_write_json(self.filepath, [task.to_dict() for task in tasks], indent=2)
+        # Replaying old records over the new snapshot is harmless, so a crash
+        # between the rename and this truncation cannot lose data.
+        with open(self.journal_path, 'w'):
+            pass
+        self._journal_end = 0
+    
+    def add_task(self, task: Task):
+        """Journal the creation of a task."""
+        self._append([{"op": "add", "task": task.to_dict()}])
+    
+    def update_task(self, task: Task):
+        """Journal the new state of an updated task."""
+        self._append([{"op": "update", "task": task.to_dict()}])
+    
+    def delete_task(self, task_id: str):
+        """Journal the deletion of a task."""
+        self._append([{"op": "delete", "id": task_id}])
+    
+    def write_batch(self, changes: List[Tuple[str, Task]]):
+        """
+        Journal several changes with a single append.
+        
+        Args:
+            changes: (op, task) pairs, op being "add", "update" or "delete"
+        """
+        self._append([
+            {"op": op, "id": task.id} if op == "delete" else {"op": op, "task": task.to_dict()}
+            for op, task in changes
+        ])
+    
+    def compact(self):
+        """Fold the journal into a new snapshot."""
+        self.save_tasks(self.load_tasks())
+    
+    def clear(self):
+        """Clear all tasks from storage."""
+        super().clear()
+        if os.path.exists(self.journal_path):
+            os.unlink(self.journal_path)
+        self._journal_end = 0
+    
+    def _append(self, records: List[dict]):
+        """Append records to the journal, compacting if it grew too large."""
+        if self._journal_end is None:
+            for _ in self._read_journal():
+                pass
+        data = "".join(json.dumps(record, separators=(',', ':')) + "\n" for record in records)
+        with open(self.journal_path, 'ab') as f:
+            # Drop a torn tail first: records written after it would be
+            # unreadable, as replay stops at the first bad line
+            if f.tell() > self._journal_end:
+                f.truncate(self._journal_end)
+            f.write(data.encode())
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            journal_size = self._journal_end = f.tell()
+        
+        if journal_size >= self.min_compact_bytes:
+            snapshot_size = os.path.getsize(self.filepath)
+            if journal_size >= snapshot_size * self.compact_ratio:
+                self.compact()
+    
+    def _read_journal(self):
+        """Yield journal records in order, stopping at a torn tail and noting where it starts."""
+        self._journal_end = 0
+        try:
+            f = open(self.journal_path, 'rb')
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    record = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    break
+                self._journal_end += len(line)
+                yield record
+
+
+class NDJSONStorage:
+    """
+    Newline-delimited JSON storage with an offset index.
+    
+    Each line of the file is one task object, with ``"id"`` as its first
+    key. Opening the store only scans the lines for their IDs and byte
+    offsets, so a single task can be read without parsing the others
+    (see load_task_ids and read_task). Adds and updates append the new
+    version of the task, deletes append a ``{"id": ..., "deleted": true}``
+    tombstone, and the last line for an ID wins. Superseded lines are
+    dropped by compaction once they outnumber a fraction of the live tasks.
+    """
+    
+    _ID_PREFIX = b'{"id":"'
+    
+    def __init__(self, filepath: str, compact_ratio: float = 0.5,
+                 min_compact_lines: int = 1000):
+        """
+        Initialize NDJSON storage.
+        
+        Args:
+            filepath: Path to the NDJSON file
+            compact_ratio: Compact once superseded lines exceed this fraction of the live tasks
+            min_compact_lines: Never compact with fewer superseded lines than this
+        """
+        self.filepath = filepath
+        self.compact_ratio = compact_ratio
+        self.min_compact_lines = min_compact_lines
+        self._offsets: Optional[Dict[str, int]] = None
+        self._end = 0
+        self._dead_lines = 0
+        self._reader = None
+        if not os.path.exists(self.filepath):
+            open(self.filepath, 'wb').close()
+    
+    def load_task_ids(self) -> List[str]:
+        """
+        Index the file without parsing task bodies.
+        
+        Returns:
+            IDs of the stored tasks in insertion order
+        """
+        self._scan()
+        return list(self._offsets)
+    
+    def read_task(self, task_id: str) -> Optional[Task]:
+        """
+        Read a single task by ID.
+        
+        Args:
+            task_id: Unique task identifier
+        
+        Returns:
+            Task object if stored, None otherwise
+        """
+        if self._offsets is None:
+            self._scan()
+        offset = self._offsets.get(task_id)
+        if offset is None:
+            return None
+        if self._reader is None:
+            self._reader = open(self.filepath, 'rb')
+        self._reader.seek(offset)
+        return Task.from_dict(json.loads(self._reader.readline()))
+    
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Stream the stored tasks in file order.
+        
+        Only the current version of each task is parsed.
+        
+        Returns:
+            Iterator of Task objects
+        """
+        if self._offsets is None:
+            self._scan()
+        live = set(self._offsets.values())
+        with open(self.filepath, 'rb') as f:
+            offset = 0
+            for line in f:
+                if offset >= self._end:
+                    break
+                if offset in live:
+                    yield Task.from_dict(json.loads(line))
+                offset += len(line)
+    
+    def load_tasks(self) -> List[Task]:
+        """
+        Load all tasks.
+        
+        Returns:
+            List of Task objects in insertion order
+        """
+        tasks = {task.id: task for task in self.iter_tasks()}
+        return [tasks[task_id] for task_id in self._offsets]
     
     def save_tasks(self, tasks: List[Task]):
         """
-        Save tasks to the storage file.
+        Rewrite the file with exactly the given tasks.
         
         Args:
             tasks: List of Task objects to save
         """
-        data = [task.to_dict() for task in tasks]
-        with open(self.filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        self._rewrite(self._encode(task.to_dict()) for task in tasks)
+    
+    def add_task(self, task: Task):
+        """Append a new task."""
+        self._append([self._entry("add", task.id, task)])
+    
+    def update_task(self, task: Task):
+        """Append the new version of a task."""
+        self._append([self._entry("update", task.id, task)])
+    
+    def delete_task(self, task_id: str):
+        """Append a tombstone for a task."""
+        self._append([self._entry("delete", task_id)])
+    
+    def write_batch(self, changes: List[Tuple[str, Task]]):
+        """
+        Append several changes with a single write.
+        
+        Args:
+            changes: (op, task) pairs, op being "add", "update" or "delete"
+        """
+        self._append([self._entry(op, task.id, task) for op, task in changes])
+    
+    def compact(self):
+        """Rewrite the file without superseded lines and tombstones."""
+        if self._offsets is None:
+            self._scan()
+        reader = open(self.filepath, 'rb')
+        
+        def live_lines():
+            for offset in self._offsets.values():
+                reader.seek(offset)
+                yield reader.readline()
+        
+        with reader:
+            self._rewrite(live_lines())
     
     def clear(self):
         """Clear all tasks from storage."""
-        with open(self.filepath, 'w') as f:
-            json.dump([], f)
+        self._rewrite(())
+    
+    def close(self):
+        """Close the read handle used by read_task."""
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+    
+    @staticmethod
+    def _encode(record: dict) -> bytes:
+        """Serialize one record as a line."""
+        return json.dumps(record, separators=(',', ':')).encode() + b"\n"
+    
+    @classmethod
+    def _entry(cls, op: str, task_id: str, task: Optional[Task] = None) -> Tuple[str, bytes, bool]:
+        """Build the (task ID, line, is tombstone) triple appended for a change."""
+        if op == "delete":
+            return task_id, cls._encode({"id": task_id, "deleted": True}), True
+        return task_id, cls._encode(task.to_dict()), False
+    
+    @staticmethod
+    def _record_id(line: bytes) -> Tuple[str, bool]:
+        """
+        Parse a line for its task ID.
+        
+        Returns:
+            Tuple of (task ID, whether the line is a tombstone)
+        """
+        record = json.loads(line)
+        return record["id"], bool(record.get("deleted"))
+    
+    def _scan(self):
+        """Build the ID to offset index, stopping at a torn or corrupt tail."""
+        offsets: Dict[str, int] = {}
+        dead_lines = 0
+        offset = 0
+        prefix = self._ID_PREFIX
+        start = len(prefix)
+        with open(self.filepath, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                # Fast path for the lines this class writes for tasks: the ID
+                # comes first, contains no escapes, and the record ends with
+                # the updated_at string (tombstones end with "true}")
+                end = line.find(b'"', start)
+                if (line[:start] == prefix and line.endswith(b'"}\n')
+                        and line.find(b"\\", start, end) < 0):
+                    task_id, deleted = line[start:end].decode(), False
+                else:
+                    try:
+                        task_id, deleted = self._record_id(line)
+                    except (ValueError, KeyError, TypeError):
+                        break
+                if task_id in offsets:
+                    dead_lines += 1
+                if deleted:
+                    dead_lines += 1
+                    offsets.pop(task_id, None)
+                else:
+                    offsets[task_id] = offset
+                offset += len(line)
+        self._offsets = offsets
+        self._end = offset
+        self._dead_lines = dead_lines
+    
+    def _append(self, entries: List[Tuple[str, bytes, bool]]):
+        """Append lines, compacting if too many lines are superseded."""
+        if self._offsets is None:
+            self._scan()
+        # The read handle may have buffered a torn tail that is overwritten here
+        self.close()
+        with open(self.filepath, 'r+b') as f:
+            # Writing at the end of the last good line also overwrites a torn tail
+            f.seek(self._end)
+            f.write(b"".join(line for _, line, _ in entries))
+            f.truncate()
+        
+        for task_id, line, deleted in entries:
+            if task_id in self._offsets:
+                self._dead_lines += 1
+            if deleted:
+                self._dead_lines += 1
+                self._offsets.pop(task_id, None)
+            else:
+                self._offsets[task_id] = self._end
+            self._end += len(line)
+        
+        if (self._dead_lines >= self.min_compact_lines
+                and self._dead_lines >= len(self._offsets) * self.compact_ratio):
+            self.compact()
+    
+    def _rewrite(self, lines: Iterable[bytes]):
+        """Atomically replace the file with the given lines and re-index it."""
+        self.close()
+        with atomic_file(self.filepath, 'wb', ".ndjson") as f:
+            f.writelines(lines)
+        self._scan()
+
+
+class BinaryFileStorage:
+    """
+    Versioned binary snapshot storage, loaded through mmap.
+    
+    Layout (little-endian):
+    
+    - header: magic, format version, record size, task count, CRC-32 of
+      everything after the header, the offset of the string heap and the
+      size of the ID block at its start
+    - records: one fixed-width record per task holding status and
+      priority codes, flags, integer due/created/updated timestamps, and
+      (offset, length) references into the heap for the ID, title,
+      description and any original timestamp texts kept by the task
+    - heap: the UTF-8 strings the records point to, starting with all
+      task IDs joined by NUL bytes so they can be decoded in one call
+    
+    The file is mapped read-only instead of read, and records are decoded
+    only when a task is asked for (see load_task_ids and read_task), so
+    opening a large store costs little more than faulting in the record
+    table. Like FileStorage, every save rewrites the whole snapshot.
+    """
+    
+    MAGIC = b"TASKBIN\0"
+    VERSION = 1
+    
+    _HEADER = struct.Struct("<8sHHIIQQ")
+    _RECORD = struct.Struct("<IIIIIIIIBBBxqqq")
+    
+    # Record flags marking which timestamps are present
+    _HAS_DUE, _HAS_CREATED, _HAS_UPDATED = 1, 2, 4
+    
+    def __init__(self, filepath: str, verify: bool = True):
+        """
+        Initialize binary snapshot storage.
+        
+        Args:
+            filepath: Path to the snapshot file
+            verify: Check the CRC-32 of the snapshot when opening it
+        """
+        self.filepath = filepath
+        self.verify = verify
+        self._map: Optional[mmap.mmap] = None
+        self._count = 0
+        self._heap = 0
+        self._ids_size = 0
+        self._index: Optional[Dict[str, int]] = None
+        if not os.path.exists(self.filepath):
+            self.save_tasks([])
+    
+    def _open(self):
+        """Map the snapshot and validate its header."""
+        if self._map is not None:
+            return
+        with open(self.filepath, 'rb') as f:
+            snapshot = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(snapshot) < self._HEADER.size:
+                raise ValueError(f"{self.filepath}: truncated task snapshot")
+            magic, version, record_size, count, checksum, heap, ids_size = self._HEADER.unpack_from(snapshot)
+            if magic != self.MAGIC:
+                raise ValueError(f"{self.filepath}: not a task snapshot")
+            if version != self.VERSION or record_size != self._RECORD.size:
+                raise ValueError(f"{self.filepath}: unsupported snapshot version {version}")
+            if heap != self._HEADER.size + count * record_size or heap + ids_size > len(snapshot):
+                raise ValueError(f"{self.filepath}: truncated task snapshot")
+            if self.verify:
+                with memoryview(snapshot) as view:
+                    if zlib.crc32(view[self._HEADER.size:]) != checksum:
+                        raise ValueError(f"{self.filepath}: snapshot checksum mismatch")
+        except BaseException:
+            snapshot.close()
+            raise
+        self._map, self._count, self._heap, self._ids_size = snapshot, count, heap, ids_size
+    
+    def _records(self) -> Iterator[tuple]:
+        """Unpack every record in file order."""
+        self._open()
+        # unpack_from reads straight from the mapping; unlike iter_unpack
+        # over a memoryview, it leaves no buffer export that would keep
+        # the mapping from being closed
+        unpack_from, snapshot = self._RECORD.unpack_from, self._map
+        return (unpack_from(snapshot, offset)
+                for offset in range(self._HEADER.size, self._heap, self._RECORD.size))
+    
+    def _string(self, offset: int, length: int) -> str:
+        """Decode a string from the heap."""
+        start = self._heap + offset
+        return self._map[start:start + length].decode()
+    
+    def _to_task(self, record: tuple) -> Task:
+        """Build a task from an unpacked record."""
+        (id_offset, id_length, title_offset, title_length,
+         description_offset, description_length, texts_offset, texts_length,
+         status, priority, flags, due, created, updated) = record
+        texts = json.loads(self._string(texts_offset, texts_length)) if texts_length else None
+        return Task.from_row((
+            self._string(id_offset, id_length),
+            self._string(title_offset, title_length),
+            self._string(description_offset, description_length),
+            status,
+            priority,
+            due if flags & self._HAS_DUE else None,
+            created if flags & self._HAS_CREATED else None,
+            updated if flags & self._HAS_UPDATED else None,
+            texts,
+        ))
+    
+    def load_task_ids(self) -> List[str]:
+        """
+        Index the snapshot, decoding only task IDs.
+        
+        Returns:
+            IDs of the stored tasks in order
+        """
+        self._open()
+        task_ids = self._string(0, self._ids_size).split("\0") if self._count else []
+        self._index = {task_id: position for position, task_id in enumerate(task_ids)}
+        return task_ids
+    
+    def read_task(self, task_id: str) -> Optional[Task]:
+        """
+        Decode a single task by ID.
+        
+        Args:
+            task_id: Unique task identifier
+        
+        Returns:
+            Task object if stored, None otherwise
+        """
+        if self._index is None:
+            self.load_task_ids()
+        position = self._index.get(task_id)
+        if position is None:
+            return None
+        record = self._RECORD.unpack_from(self._map, self._HEADER.size + position * self._RECORD.size)
+        return self._to_task(record)
+    
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Decode the stored tasks in order.
+        
+        Returns:
+            Iterator of Task objects
+        """
+        return map(self._to_task, self._records())
+    
+    def load_tasks(self) -> List[Task]:
+        """
+        Load all tasks.
+        
+        Returns:
+            List of Task objects
+        """
+        return list(self.iter_tasks())
+    
+    def save_tasks(self, tasks: List[Task]):
+        """
+        Write a new snapshot atomically.
+        
+        Args:
+            tasks: List of Task objects to save
+        
+        Raises:
+            ValueError: If a task ID contains a NUL character, or the
+                strings exceed the 4 GiB heap limit
+        """
+        rows = [task.to_row() for task in tasks]
+        if any("\0" in row[0] for row in rows):
+            raise ValueError("Task IDs in a binary snapshot cannot contain NUL characters")
+        ids = "\0".join(row[0] for row in rows).encode()
+        heap = bytearray(ids)
+        
+        def put(text: str) -> Tuple[int, int]:
+            data = text.encode()
+            offset = len(heap)
+            heap.extend(data)
+            return offset, len(data)
+        
+        records = bytearray()
+        id_offset = 0
+        for task_id, title, description, status, priority, due, created, updated, texts in rows:
+            id_length = len(task_id.encode())
+            flags = ((self._HAS_DUE if due is not None else 0)
+                     | (self._HAS_CREATED if created is not None else 0)
+                     | (self._HAS_UPDATED if updated is not None else 0))
+            records += self._RECORD.pack(
+                id_offset, id_length, *put(title), *put(description),
+                *(put(json.dumps(texts)) if texts else (0, 0)),
+                status, priority, flags, due or 0, created or 0, updated or 0
+            )
+            id_offset += id_length + 1
+        if len(heap) > 0xFFFFFFFF:
+            raise ValueError("Task strings exceed the 4 GiB snapshot heap limit")
+        
+        body = records + heap
+        header = self._HEADER.pack(self.MAGIC, self.VERSION, self._RECORD.size, len(rows),
+                                   zlib.crc32(body), self._HEADER.size + len(records), len(ids))
+        self.close()
+        with atomic_file(self.filepath, 'wb', ".bin") as f:
+            f.write(header)
+            f.write(body)
+    
+    def clear(self):
+        """Clear all tasks from storage."""
+        self.save_tasks([])
+    
+    def close(self):
+        """Unmap the snapshot."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._index = None
+
+
+class PartitionedStorage:
+    """
+    Storage split into a hot file and immutable, compressed cold segments.
+    
+    Pending and in-progress tasks live in ``hot.json`` in the store's
+    directory, rewritten on every change. Completed and cancelled tasks
+    rarely change again: once ``segment_size`` of them have gathered in the
+    hot file, they move out to a new cold segment that is never rewritten.
+    Saves then only write the hot file, and opening the store only reads it
+    (load_hot_tasks). Cold tasks are read when something asks for them: one
+    segment to find a single task (read_task), all of them for listings and
+    statistics that cover finished tasks (iter_cold_tasks).
+    
+    A segment file starts with a JSON line of its task IDs, which is all
+    that is read to look tasks up by ID or prefix, followed by the
+    zlib-compressed JSON array of the tasks. Updating or deleting a cold
+    task records its copy (segment and ID) as removed in the hot file, an
+    updated task moving back to the hot file; if it is finished again, it
+    is later frozen into a new segment while the old copy stays removed.
+    Segments are compacted once removed copies exceed a fraction of the
+    live ones. Like NDJSONStorage, the store assumes a
+    single writing process.
+    """
+    
+    # Statuses of tasks that are moved to cold segments
+    cold_statuses = frozenset([TaskStatus.COMPLETED, TaskStatus.CANCELLED])
+    
+    _COLD_VALUES = frozenset(status.value for status in cold_statuses)
+    
+    def __init__(self, directory: str, segment_size: int = 1000,
+                 compact_ratio: float = 0.5, min_compact_tasks: int = 1000):
+        """
+        Initialize partitioned storage.
+        
+        Args:
+            directory: Directory holding the hot file and cold segments
+            segment_size: Finished tasks gathered in the hot file before they
+                are moved to a cold segment, and the size of each segment
+            compact_ratio: Compact once removed cold tasks exceed this
+                fraction of the live ones
+            min_compact_tasks: Never compact with fewer removed tasks than this
+        """
+        self.directory = directory
+        self.filepath = os.path.join(directory, "hot.json")
+        self.segment_size = segment_size
+        self.compact_ratio = compact_ratio
+        self.min_compact_tasks = min_compact_tasks
+        # Hot task dictionaries, live segments as [file name, task count],
+        # removed cold copies as (segment file name, task ID) and the number
+        # of the next segment; all read from the hot file on first use
+        self._hot: Optional[Dict[str, dict]] = None
+        self._segments: List[list] = []
+        self._removed: Set[Tuple[str, str]] = set()
+        self._next_segment = 1
+        # Cold task ID to segment position, read from the segment headers
+        self._cold_index: Optional[Dict[str, int]] = None
+        # Position and task dictionaries of the last segment decoded by read_task
+        self._cached: Tuple[int, Dict[str, dict]] = (-1, {})
+        os.makedirs(directory, exist_ok=True)
+        if not os.path.exists(self.filepath):
+            self.save_tasks([])
+    
+    def load_hot_tasks(self) -> List[Task]:
+        """
+        Load the tasks of the hot file, without touching cold segments.
+        
+        Returns:
+            Pending and in-progress tasks, and finished ones not moved yet
+        """
+        self._load()
+        return [Task.from_dict(task_dict) for task_dict in self._hot.values()]
+    
+    def cold_task_ids(self) -> List[str]:
+        """
+        List the tasks in cold segments from their headers.
+        
+        Returns:
+            IDs of the live cold tasks
+        """
+        if self._hot is None:
+            self._load()
+        return [task_id for task_id, position in self._index().items()
+                if not self._is_removed(position, task_id)]
+    
+    def read_task(self, task_id: str) -> Optional[Task]:
+        """
+        Read a single task, decoding at most the one segment holding it.
+        
+        Args:
+            task_id: Unique task identifier
+        
+        Returns:
+            Task object if stored, None otherwise
+        """
+        if self._hot is None:
+            self._load()
+        task_dict = self._hot.get(task_id)
+        if task_dict is None:
+            position = self._index().get(task_id)
+            if position is not None and not self._is_removed(position, task_id):
+                if self._cached[0] != position:
+                    self._cached = (position, {d["id"]: d for d in self._read_segment(position)})
+                task_dict = self._cached[1].get(task_id)
+        return Task.from_dict(task_dict) if task_dict is not None else None
+    
+    def iter_cold_tasks(self) -> Iterator[Task]:
+        """
+        Decode the live tasks of every cold segment, one segment at a time.
+        
+        Returns:
+            Iterator of Task objects
+        """
+        if self._hot is None:
+            self._load()
+        for position, (name, _) in enumerate(self._segments):
+            for task_dict in self._read_segment(position):
+                if (name, task_dict["id"]) not in self._removed:
+                    yield Task.from_dict(task_dict)
+    
+    def load_tasks(self) -> List[Task]:
+        """
+        Load all tasks, hot and cold.
+        
+        Returns:
+            List of Task objects, hot tasks first
+        """
+        return self.load_hot_tasks() + list(self.iter_cold_tasks())
+    
+    def save_tasks(self, tasks: List[Task]):
+        """
+        Rewrite the store with exactly the given tasks.
+        
+        Finished tasks go straight to new cold segments, in full ones plus
+        one for the remainder, and the old segments are deleted.
+        
+        Args:
+            tasks: List of Task objects to save
+        """
+        hot, cold = {}, []
+        for task in tasks:
+            task_dict = task.to_dict()
+            if task_dict["status"] in self._COLD_VALUES:
+                cold.append(task_dict)
+            else:
+                hot[task_dict["id"]] = task_dict
+        if self._hot is None and os.path.exists(self.filepath):
+            self._load()
+        old = [name for name, _ in self._segments]
+        self._hot = hot
+        self._reset_segments()
+        self._freeze(cold, hot=False)
+        self._write_hot()
+        self._delete_segments(old)
+    
+    def add_task(self, task: Task):
+        """Save a new task to the hot file."""
+        self.write_batch([("add", task)])
+    
+    def update_task(self, task: Task):
+        """Save the new state of a task to the hot file."""
+        self.write_batch([("update", task)])
+    
+    def delete_task(self, task_id: str):
+        """Remove a task, hot or cold."""
+        self._write_changes([("delete", task_id, None)])
+    
+    def write_batch(self, changes: List[Tuple[str, Task]]):
+        """
+        Save several changes with a single write of the hot file.
+        
+        Args:
+            changes: (op, task) pairs, op being "add", "update" or "delete"
+        """
+        self._write_changes([
+            (op, task.id, None if op == "delete" else task.to_dict()) for op, task in changes
+        ])
+    
+    def freeze(self):
+        """Move every finished task in the hot file to cold segments now."""
+        if self._hot is None:
+            self._load()
+        finished = [d for d in self._hot.values() if d["status"] in self._COLD_VALUES]
+        if finished:
+            self._freeze(finished)
+            self._write_hot()
+    
+    def compact(self):
+        """Rewrite the cold segments without removed tasks."""
+        if self._hot is None:
+            self._load()
+        old = [name for name, _ in self._segments]
+        tasks = [task.to_dict() for task in self.iter_cold_tasks()]
+        self._reset_segments()
+        self._freeze(tasks, hot=False)
+        self._write_hot()
+        self._delete_segments(old)
+    
+    def clear(self):
+        """Clear all tasks from storage."""
+        self.save_tasks([])
+    
+    def _load(self):
+        """Read the hot file."""
+        with open(self.filepath, 'rb') as f:
+            state = json.load(f)
+        self._hot = {task_dict["id"]: task_dict for task_dict in state["tasks"]}
+        self._segments = state["segments"]
+        self._next_segment = state["next_segment"]
+        self._cold_index = None
+        self._cached = (-1, {})
+        self._removed = set()
+        for entry in state["removed"]:
+            if isinstance(entry, str):
+                # Written before removed copies named their segment
+                position = self._index().get(entry)
+                if position is not None:
+                    self._removed.add((self._segments[position][0], entry))
+            else:
+                self._removed.add(tuple(entry))
+    
+    def _write_hot(self):
+        """Atomically replace the hot file with the current state."""
+        atomic_write_json(self.filepath, {
+            "next_segment": self._next_segment,
+            "segments": self._segments,
+            "removed": [list(entry) for entry in sorted(self._removed)],
+            "tasks": list(self._hot.values()),
+        }, indent=2)
+    
+    def _write_changes(self, changes: List[Tuple[str, str, Optional[dict]]]):
+        """
+        Apply changes to the hot state, move finished tasks out if enough
+        have gathered, and save.
+        
+        Args:
+            changes: (op, task ID, task dictionary or None for deletes)
+        """
+        if self._hot is None:
+            self._load()
+        for op, task_id, task_dict in changes:
+            if task_id not in self._hot and op != "add":
+                position = self._index().get(task_id)
+                if position is not None:
+                    # The cold copy is superseded by the hot one, or deleted
+                    self._removed.add((self._segments[position][0], task_id))
+            if op == "delete":
+                self._hot.pop(task_id, None)
+            else:
+                self._hot[task_id] = task_dict
+        
+        finished = [d for d in self._hot.values() if d["status"] in self._COLD_VALUES]
+        if len(finished) >= self.segment_size:
+            self._freeze(finished[:len(finished) - len(finished) % self.segment_size])
+        # Every removed copy is dead, whether or not its task was frozen again
+        live = sum(count for _, count in self._segments) - len(self._removed)
+        if len(self._removed) >= max(self.min_compact_tasks, live * self.compact_ratio):
+            self.compact()
+        else:
+            self._write_hot()
+    
+    def _freeze(self, tasks: List[dict], hot: bool = True):
+        """
+        Write task dictionaries to new cold segments, before the hot file
+        that lists them is saved.
+        
+        Args:
+            tasks: Finished task dictionaries
+            hot: Whether the tasks come from the hot file, and must leave it
+        """
+        for start in range(0, len(tasks), self.segment_size):
+            chunk = tasks[start:start + self.segment_size]
+            name = f"cold-{self._next_segment:06d}.seg"
+            task_ids = [task_dict["id"] for task_dict in chunk]
+            with atomic_file(os.path.join(self.directory, name), 'wb', ".seg") as f:
+                f.write(json.dumps(task_ids).encode() + b"\n")
+                f.write(zlib.compress(json.dumps(chunk, separators=(',', ':')).encode()))
+            if self._cold_index is not None:
+                for task_id in task_ids:
+                    self._cold_index[task_id] = len(self._segments)
+            self._segments.append([name, len(chunk)])
+            self._next_segment += 1
+            if hot:
+                for task_id in task_ids:
+                    del self._hot[task_id]
+    
+    def _index(self) -> Dict[str, int]:
+        """Map cold task IDs to their segment, reading only segment headers."""
+        if self._cold_index is None:
+            index = {}
+            for position, (name, _) in enumerate(self._segments):
+                with open(os.path.join(self.directory, name), 'rb') as f:
+                    index.update(dict.fromkeys(json.loads(f.readline()), position))
+            self._cold_index = index
+        return self._cold_index
+    
+    def _is_removed(self, position: int, task_id: str) -> bool:
+        """Whether the copy of a task in the segment at a position was removed."""
+        return (self._segments[position][0], task_id) in self._removed
+    
+    def _read_segment(self, position: int) -> List[dict]:
+        """Decompress and decode the tasks of one segment."""
+        with open(os.path.join(self.directory, self._segments[position][0]), 'rb') as f:
+            f.readline()
+            return json.loads(zlib.decompress(f.read()))
+    
+    def _reset_segments(self):
+        """Forget every cold segment, before writing new ones to replace them."""
+        self._segments, self._removed = [], set()
+        self._cold_index = {}
+        self._cached = (-1, {})
+    
+    def _delete_segments(self, names: List[str]):
+        """Delete segment files that are no longer listed in the hot file."""
+        for name in names:
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+
+def migrate_json_to_ndjson(json_path: str, ndjson_path: str) -> int:
+    """
+    Convert a JSON array task file to NDJSON.
+    
+    Args:
+        json_path: Existing file in the FileStorage format
+        ndjson_path: Destination file, replaced if it exists
+    
+    Returns:
+        Number of tasks migrated
+    """
+    tasks = FileStorage(json_path).load_tasks()
+    NDJSONStorage(ndjson_path).save_tasks(tasks)
+    return len(tasks)
+
+
+def migrate_ndjson_to_json(ndjson_path: str, json_path: str) -> int:
+    """
+    Convert an NDJSON task file back to a JSON array.
+    
+    Args:
+        ndjson_path: Existing file in the NDJSONStorage format
+        json_path: Destination file, replaced if it exists
+    
+    Returns:
+        Number of tasks migrated
+    """
+    tasks = NDJSONStorage(ndjson_path).load_tasks()
+    atomic_write_json(json_path, [task.to_dict() for task in tasks], indent=2)
+    return len(tasks)
+
+
+def migrate_json_to_binary(json_path: str, binary_path: str) -> int:
+    """
+    Convert a JSON array task file to a binary snapshot.
+    
+    Args:
+        json_path: Existing file in the FileStorage format
+        binary_path: Destination file, replaced if it exists
+    
+    Returns:
+        Number of tasks migrated
+    """
+    tasks = FileStorage(json_path).load_tasks()
+    BinaryFileStorage(binary_path).save_tasks(tasks)
+    return len(tasks)
+
+
+def migrate_binary_to_json(binary_path: str, json_path: str) -> int:
+    """
+    Convert a binary snapshot back to a JSON array task file.
+    
+    Args:
+        binary_path: Existing file in the BinaryFileStorage format
+        json_path: Destination file, replaced if it exists
+    
+    Returns:
+        Number of tasks migrated
+    """
+    storage = BinaryFileStorage(binary_path)
+    tasks = storage.load_tasks()
+    storage.close()
+    atomic_write_json(json_path, [task.to_dict() for task in tasks], indent=2)
+    return len(tasks)
 
 
 class DatabaseStorage:
-    """Database storage implementation (placeholder for future implementation)."""
+    """
+    SQLite storage implementation.
+    
+    Tasks are stored one row each, so single-task changes are row-level
+    upserts and deletes. Filtering, sorting and statistics are answered
+    with SQL queries backed by indexes on status, priority and due_date.
+    """
+    
+    _COLUMNS = ("id", "title", "description", "status", "priority",
+                "due_date", "created_at", "updated_at")
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id TEXT PRIMARY KEY,
+            title TEXT NOT NULL,
+            description TEXT NOT NULL DEFAULT '',
+            status TEXT NOT NULL,
+            priority TEXT NOT NULL,
+            due_date TEXT,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+        CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+        CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+    """
+    
+    # Statements are constant strings with placeholders, so sqlite3's
+    # statement cache prepares each of them only once per connection.
+    _UPSERT = (
+        "INSERT INTO tasks (id, title, description, status, priority, due_date, created_at, updated_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+        "ON CONFLICT(id) DO UPDATE SET title = excluded.title, description = excluded.description, "
+        "status = excluded.status, priority = excluded.priority, due_date = excluded.due_date, "
+        "created_at = excluded.created_at, updated_at = excluded.updated_at"
+    )
+    
+    # rowid preserves insertion order, matching the stable sorts of the in-memory path
+    _ORDER_BY = {
+        "priority": "CASE priority WHEN 'high' THEN 3 WHEN 'medium' THEN 2 WHEN 'low' THEN 1 ELSE 0 END DESC, rowid",
+        "due_date": "COALESCE(due_date, '9999-12-31'), rowid",
+        "updated_at": "updated_at DESC, rowid",
+        "created_at": "created_at DESC, rowid",
+    }
     
     def __init__(self, connection_string: str):
         """
         Initialize database storage.
         
         Args:
-            connection_string: Database connection string
+            connection_string: SQLite database path, optionally prefixed with "sqlite:///"
         """
         self.connection_string = connection_string
-        # TODO: Implement database connection and schema
+        path = connection_string
+        if path.startswith("sqlite:///"):
+            path = path[len("sqlite:///"):]
+        
+        # Imported here so that the file-based storages don't load SQLite
+        import sqlite3
+        # The connection may be handed to another thread (AsyncTaskManager
+        # does all storage I/O on one), but is never used by two at once
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(self._SCHEMA)
     
     def load_tasks(self) -> List[Task]:
         """Load tasks from database."""
-        # TODO: Implement database query
-        raise NotImplementedError("Database storage not yet implemented")
+        rows = self.connection.execute(
+            f"SELECT {', '.join(self._COLUMNS)} FROM tasks ORDER BY rowid"
+        )
+        return [self._row_to_task(row) for row in rows]
     
     def save_tasks(self, tasks: List[Task]):
-        """Save tasks to database."""
-        # TODO: Implement database insert/update
-        raise NotImplementedError("Database storage not yet implemented")
+        """Replace the stored tasks with the given list."""
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks")
+            self.connection.executemany(self._UPSERT, (self._task_to_row(t) for t in tasks))
+    
+    def add_task(self, task: Task):
+        """Insert a single task."""
+        with self.connection:
+            self.connection.execute(self._UPSERT, self._task_to_row(task))
+    
+    def update_task(self, task: Task):
+        """Write the new state of a single task."""
+        with self.connection:
+            self.connection.execute(self._UPSERT, self._task_to_row(task))
+    
+    def delete_task(self, task_id: str):
+        """Delete a single task."""
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+    
+    def write_batch(self, changes: List[Tuple[str, Task]]):
+        """
+        Apply several changes in one transaction.
+        
+        Args:
+            changes: (op, task) pairs with at most one change per task,
+                op being "add", "update" or "delete"
+        """
+        with self.connection:
+            self.connection.executemany(
+                self._UPSERT, (self._task_to_row(task) for op, task in changes if op != "delete")
+            )
+            self.connection.executemany(
+                "DELETE FROM tasks WHERE id = ?", ((task.id,) for op, task in changes if op == "delete")
+            )
+    
+    def query_task_ids(self, status: Optional[str] = None,
+                       priority: Optional[str] = None,
+                       sort_by: str = "created_at") -> List[str]:
+        """
+        Filter and sort tasks in SQL.
+        
+        Args:
+            status: Status value to filter by
+            priority: Priority value to filter by
+            sort_by: Sort field (created_at, updated_at, priority, due_date)
+        
+        Returns:
+            Matching task IDs in sort order
+        """
+        clauses, params = [], []
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if priority:
+            clauses.append("priority = ?")
+            params.append(priority)
+        
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order_by = self._ORDER_BY.get(sort_by, self._ORDER_BY["created_at"])
+        rows = self.connection.execute(f"SELECT id FROM tasks{where} ORDER BY {order_by}", params)
+        return [row[0] for row in rows]
+    
+    def query_statistics(self) -> dict:
+        """
+        Count tasks per status and priority in SQL.
+        
+        Returns:
+            Dictionary with total, completed, pending, in_progress,
+            high_priority and overdue counts
+        """
+        by_status = dict(self.connection.execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        ))
+        by_priority = dict(self.connection.execute(
+            "SELECT priority, COUNT(*) FROM tasks GROUP BY priority"
+        ))
+        # ISO strings compare chronologically, so a due date is past once it sorts below "now"
+        overdue = self.connection.execute(
+            "SELECT COUNT(*) FROM tasks WHERE due_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]*' "
+            "AND status != 'completed' AND due_date < ?",
+            (datetime.now().isoformat(),)
+        ).fetchone()[0]
+        
+        return {
+            "total": sum(by_status.values()),
+            "completed": by_status.get("completed", 0),
+            "pending": by_status.get("pending", 0),
+            "in_progress": by_status.get("in_progress", 0),
+            "high_priority": by_priority.get("high", 0),
+            "overdue": overdue,
+        }
+    
+    def clear(self):
+        """Clear all tasks from storage."""
+        with self.connection:
+            self.connection.execute("DELETE FROM tasks")
+    
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+    
+    @staticmethod
+    def _task_to_row(task: Task) -> tuple:
+        """Convert a task to a row tuple in column order."""
+        return (task.id, task.title, task.description, task.status.value,
+                task.priority.value, task.due_date, task.created_at, task.updated_at)
+    
+    @staticmethod
+    def _row_to_task(row: tuple) -> Task:
+        """Convert a row tuple in column order to a task."""
+        return Task(
+            task_id=row[0],
+            title=row[1],
+            description=row[2],
+            status=row[3],
+            priority=row[4],
+            due_date=row[5],
+            created_at=row[6],
+            updated_at=row[7]
+        )
+
 
+def migrate_json_to_partitioned(json_path: str, directory: str) -> int:
+    """
+    Convert a JSON array task file to hot and cold partitions.
+    
+    Args:
+        json_path: Existing file in the FileStorage format
+        directory: Destination directory, whose tasks are replaced
+    
+    Returns:
+        Number of tasks migrated
+    """
+    tasks = FileStorage(json_path).load_tasks()
+    PartitionedStorage(directory).save_tasks(tasks)
+    return len(tasks)
+
+
+def migrate_partitioned_to_json(directory: str, json_path: str) -> int:
+    """
+    Convert hot and cold partitions back to a JSON array task file.
+    
+    Args:
+        directory: Existing directory in the PartitionedStorage format
+        json_path: Destination file, replaced if it exists
+    
+    Returns:
+        Number of tasks migrated
+    """
+    tasks = PartitionedStorage(directory).load_tasks()
+    atomic_write_json(json_path, [task.to_dict() for task in tasks], indent=2)
+    return len(tasks)
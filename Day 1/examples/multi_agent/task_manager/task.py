@@ -2,9 +2,9 @@
 Task data model and related enums.
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 import uuid
 
 
@@ -23,8 +23,83 @@ class TaskPriority(Enum):
     HIGH = "high"
 
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_timestamp(moment: datetime) -> int:
+    """
+    Convert a datetime to the integer timestamp used by Task.
+    
+    Args:
+        moment: Naive local datetime (aware datetimes are converted to local time)
+    
+    Returns:
+        Microseconds since 1970-01-01T00:00:00 in local wall-clock time
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    return (moment - _EPOCH) // _MICROSECOND
+
+
+def _format_timestamp(timestamp: int, date_only_at_midnight: bool = False) -> str:
+    """Render a timestamp as an ISO 8601 string."""
+    moment = _EPOCH + timestamp * _MICROSECOND
+    if date_only_at_midnight and timestamp % 86_400_000_000 == 0:
+        return moment.date().isoformat()
+    return moment.isoformat()
+
+
+def _parse_timestamp(text: Optional[str], date_only_at_midnight: bool = False) -> Tuple[Optional[int], bool]:
+    """
+    Parse an ISO 8601 string into a timestamp.
+    
+    Returns:
+        Tuple of (timestamp, exact). ``exact`` is False when formatting the
+        timestamp would not reproduce the text (or it did not parse), in
+        which case the caller keeps the text for serialization.
+    """
+    if text is None:
+        return None, True
+    try:
+        moment = datetime.fromisoformat(text)
+    except (ValueError, TypeError):
+        return None, False
+    if moment.tzinfo is not None:
+        return to_timestamp(moment), False
+    timestamp = (moment - _EPOCH) // _MICROSECOND
+    # fromisoformat accepted the text, so checking its shape is enough to
+    # know whether isoformat() would reproduce it, without formatting
+    length = len(text)
+    if date_only_at_midnight and timestamp % 86_400_000_000 == 0:
+        return timestamp, length == 10 and text[4] == "-"
+    if moment.microsecond:
+        return timestamp, length == 26 and text[10] == "T" and text[19] == "."
+    return timestamp, length == 19 and text[10] == "T"
+
+
+_STATUSES = tuple(TaskStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_PRIORITIES = tuple(TaskPriority)
+_PRIORITY_CODES = {priority: code for code, priority in enumerate(_PRIORITIES)}
+_STATUS_VALUES = {status.value: code for status, code in _STATUS_CODES.items()}
+_PRIORITY_VALUES = {priority.value: code for priority, code in _PRIORITY_CODES.items()}
+_COMPLETED = _STATUS_CODES[TaskStatus.COMPLETED]
+
+
 class Task:
-    """Represents a single task in the system."""
+    """
+    Represents a single task in the system.
+    
+    Tasks are slotted to keep a large store compact: status and priority
+    are stored as small ints and timestamps as integer microseconds, and
+    the enum and ISO string views are exposed as properties. The
+    ``*_ts`` properties give direct access to the integer timestamps for
+    comparisons that should not allocate strings.
+    """
+    
+    __slots__ = ("id", "title", "description", "_status", "_priority",
+                 "_due", "_created", "_updated", "_texts")
     
     def __init__(self, title: str, description: str = "",
                  status: TaskStatus = TaskStatus.PENDING,
@@ -46,15 +121,97 @@ class Task:
             created_at: Creation timestamp (auto-generated if not provided)
             updated_at: Last update timestamp (auto-generated if not provided)
         """
+        self._texts = None
         self.id = task_id or str(uuid.uuid4())
         self.title = title
         self.description = description
-        self.status = status if isinstance(status, TaskStatus) else TaskStatus(status)
-        self.priority = priority if isinstance(priority, TaskPriority) else TaskPriority(priority)
+        self.status = status
+        self.priority = priority
         self.due_date = due_date
         self.created_at = created_at or datetime.now().isoformat()
         self.updated_at = updated_at or datetime.now().isoformat()
     
+    @property
+    def status(self) -> TaskStatus:
+        """Current task status."""
+        return _STATUSES[self._status]
+    
+    @status.setter
+    def status(self, value):
+        self._status = _STATUS_CODES[value if isinstance(value, TaskStatus) else TaskStatus(value)]
+    
+    @property
+    def priority(self) -> TaskPriority:
+        """Task priority level."""
+        return _PRIORITIES[self._priority]
+    
+    @priority.setter
+    def priority(self, value):
+        self._priority = _PRIORITY_CODES[value if isinstance(value, TaskPriority) else TaskPriority(value)]
+    
+    @property
+    def due_date(self) -> Optional[str]:
+        """Due date as given (normally YYYY-MM-DD), or None."""
+        return self._get_timestamp("due_date", self._due, date_only_at_midnight=True)
+    
+    @due_date.setter
+    def due_date(self, value: Optional[str]):
+        self._due = self._set_timestamp("due_date", value, date_only_at_midnight=True)
+    
+    @property
+    def created_at(self) -> str:
+        """Creation timestamp in ISO 8601 format."""
+        return self._get_timestamp("created_at", self._created)
+    
+    @created_at.setter
+    def created_at(self, value: str):
+        self._created = self._set_timestamp("created_at", value)
+    
+    @property
+    def updated_at(self) -> str:
+        """Last update timestamp in ISO 8601 format."""
+        return self._get_timestamp("updated_at", self._updated)
+    
+    @updated_at.setter
+    def updated_at(self, value: str):
+        self._updated = self._set_timestamp("updated_at", value)
+    
+    def _get_timestamp(self, field: str, timestamp: Optional[int],
+                       date_only_at_midnight: bool = False) -> Optional[str]:
+        """Render a timestamp field, preferring text kept for exact round trips."""
+        if self._texts and field in self._texts:
+            return self._texts[field]
+        if timestamp is None:
+            return None
+        return _format_timestamp(timestamp, date_only_at_midnight)
+    
+    def _set_timestamp(self, field: str, text: Optional[str],
+                       date_only_at_midnight: bool = False) -> Optional[int]:
+        """Parse a timestamp field, keeping the text only if it cannot be reproduced."""
+        timestamp, exact = _parse_timestamp(text, date_only_at_midnight)
+        if not exact:
+            if self._texts is None:
+                self._texts = {}
+            self._texts[field] = text
+        elif self._texts and field in self._texts:
+            del self._texts[field]
+        return timestamp
+    
+    @property
+    def due_ts(self) -> Optional[int]:
+        """Due date as a timestamp, or None if unset or unparseable."""
+        return self._due
+    
+    @property
+    def created_ts(self) -> Optional[int]:
+        """Creation time as a timestamp, or None if unparseable."""
+        return self._created
+    
+    @property
+    def updated_ts(self) -> Optional[int]:
+        """Last update time as a timestamp, or None if unparseable."""
+        return self._updated
+    
     def is_overdue(self) -> bool:
         """
         Check if the task is overdue.
@@ -62,14 +219,9 @@ class Task:
         Returns:
             True if task is overdue, False otherwise
         """
-        if not self.due_date or self.status == TaskStatus.COMPLETED:
-            return False
-        
-        try:
-            due = datetime.fromisoformat(self.due_date)
-            return datetime.now() > due
-        except (ValueError, TypeError):
+        if self._due is None or self._status == _COMPLETED:
             return False
+        return to_timestamp(datetime.now()) > self._due
     
     def to_dict(self) -> dict:
         """
@@ -100,16 +252,61 @@ class Task:
         Returns:
             Task instance
         """
-        return cls(
-            task_id=data.get("id"),
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            status=TaskStatus(data.get("status", "pending")),
-            priority=TaskPriority(data.get("priority", "medium")),
-            due_date=data.get("due_date"),
-            created_at=data.get("created_at"),
-            updated_at=data.get("updated_at")
-        )
+        # Loading is the hot path for large stores, so fill the slots
+        # directly instead of going through __init__ and the enum lookups
+        status = _STATUS_VALUES.get(data.get("status", "pending"))
+        priority = _PRIORITY_VALUES.get(data.get("priority", "medium"))
+        if status is None or priority is None:
+            return cls(
+                task_id=data.get("id"),
+                title=data.get("title", ""),
+                description=data.get("description", ""),
+                status=TaskStatus(data.get("status", "pending")),
+                priority=TaskPriority(data.get("priority", "medium")),
+                due_date=data.get("due_date"),
+                created_at=data.get("created_at"),
+                updated_at=data.get("updated_at")
+            )
+        
+        task = cls.__new__(cls)
+        task._texts = None
+        task.id = data.get("id") or str(uuid.uuid4())
+        task.title = data.get("title", "")
+        task.description = data.get("description", "")
+        task._status = status
+        task._priority = priority
+        task._due = task._set_timestamp("due_date", data.get("due_date"), date_only_at_midnight=True)
+        task._created = task._set_timestamp("created_at", data.get("created_at") or datetime.now().isoformat())
+        task._updated = task._set_timestamp("updated_at", data.get("updated_at") or datetime.now().isoformat())
+        return task
+    
+    def to_row(self) -> tuple:
+        """
+        Get the task's fields in their compact stored form.
+        
+        Returns:
+            Tuple of (id, title, description, status code, priority code,
+            due, created and updated timestamps, original texts or None),
+            which from_row turns back into an identical task
+        """
+        return (self.id, self.title, self.description, self._status, self._priority,
+                self._due, self._created, self._updated, self._texts)
+    
+    @classmethod
+    def from_row(cls, row: tuple) -> 'Task':
+        """
+        Create a Task instance from the output of to_row without re-parsing.
+        
+        Args:
+            row: Tuple in the to_row layout
+        
+        Returns:
+            Task instance
+        """
+        task = cls.__new__(cls)
+        (task.id, task.title, task.description, task._status, task._priority,
+         task._due, task._created, task._updated, task._texts) = row
+        return task
     
     def __str__(self) -> str:
         """String representation of the task."""
@@ -131,6 +328,16 @@ class Task:
         
         return f"{icon} [{self.id[:8]}] {self.title} {priority} {overdue}".strip()
     
+    def __copy__(self) -> 'Task':
+        """Shallow copy without re-parsing any field."""
+        clone = Task.__new__(Task)
+        for name in Task.__slots__:
+            setattr(clone, name, getattr(self, name))
+        # The setters edit _texts in place, so the copy needs its own
+        if self._texts is not None:
+            clone._texts = dict(self._texts)
+        return clone
+    
     def __repr__(self) -> str:
         """Developer-friendly representation."""
         return f"Task(id={self.id}, title={self.title!r}, status={self.status.value})"
@@ -2,27 +2,348 @@
 Core task management logic and business rules.
 """
 
+import copy
+import base64
+import binascii
+import json
+from collections.abc import MutableMapping
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Optional
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from task import Task, TaskStatus, TaskPriority
+from events import EventType, Subscription, TaskEvent
+from indexes import PrefixIndex, SearchIndex, StatisticsIndex, TaskIndex, listing_key
+
+
+class LazyTaskMap(MutableMapping):
+    """
+    Task ID to Task mapping that reads tasks from storage on first access.
+    
+    Used with storages that can list IDs without parsing tasks
+    (load_task_ids) and read one task by ID (read_task). Keys and length
+    are available immediately; a task is only parsed when it is looked up,
+    and iterating over values hydrates the rest in one sequential pass.
+    """
+    
+    def __init__(self, storage):
+        """
+        Initialize the mapping.
+        
+        Args:
+            storage: Storage providing load_task_ids, read_task and iter_tasks
+        """
+        self._storage = storage
+        # None marks a task that has not been read yet
+        self._data: Dict[str, Optional[Task]] = dict.fromkeys(storage.load_task_ids())
+        self._pending = len(self._data)
+    
+    def __getitem__(self, task_id: str) -> Task:
+        task = self._data[task_id]
+        if task is None:
+            task = self._data[task_id] = self._storage.read_task(task_id)
+            self._pending -= 1
+        return task
+    
+    def __setitem__(self, task_id: str, task: Task):
+        if self._data.get(task_id, False) is None:
+            self._pending -= 1
+        self._data[task_id] = task
+    
+    def __delitem__(self, task_id: str):
+        if self._data.pop(task_id) is None:
+            self._pending -= 1
+    
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._data
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def values(self):
+        """Hydrate any unread tasks and return a view of all of them."""
+        if self._pending:
+            data = self._data
+            for task in self._storage.iter_tasks():
+                if data.get(task.id, False) is None:
+                    data[task.id] = task
+            self._pending = 0
+        return self._data.values()
+    
+    def reorder(self, task_ids: List[str]):
+        """Put the mapping in the given key order without hydrating tasks."""
+        data = self._data
+        self._data = {task_id: data[task_id] for task_id in task_ids if task_id in data}
+
+
+class TieredTaskMap(MutableMapping):
+    """
+    Task ID to Task mapping over hot tasks, reading cold ones on demand.
+    
+    Used with storages that keep finished tasks apart (load_hot_tasks,
+    cold_task_ids, read_task and iter_cold_tasks, as PartitionedStorage
+    does). Only hot tasks are loaded up front. Cold IDs are listed the
+    first time a lookup misses, the length is asked for or the keys are
+    iterated; a cold task is read when it is looked up, and iterating over
+    values reads the rest.
+    """
+    
+    def __init__(self, storage):
+        """
+        Initialize the mapping.
+        
+        Args:
+            storage: Storage providing the hot/cold hooks
+        """
+        self._storage = storage
+        self._data: Dict[str, Task] = {task.id: task for task in storage.load_hot_tasks()}
+        # IDs of cold tasks not read yet, listed on first need
+        self._cold: Optional[Dict[str, None]] = None
+    
+    @property
+    def cold_loaded(self) -> bool:
+        """Whether every cold task has been read."""
+        return self._cold is not None and not self._cold
+    
+    def _cold_ids(self) -> Dict[str, None]:
+        if self._cold is None:
+            self._cold = dict.fromkeys(task_id for task_id in self._storage.cold_task_ids()
+                                       if task_id not in self._data)
+        return self._cold
+    
+    def __getitem__(self, task_id: str) -> Task:
+        task = self._data.get(task_id)
+        if task is None:
+            if task_id not in self._cold_ids():
+                raise KeyError(task_id)
+            task = self._data[task_id] = self._storage.read_task(task_id)
+            del self._cold[task_id]
+        return task
+    
+    def __setitem__(self, task_id: str, task: Task):
+        self._cold_ids().pop(task_id, None)
+        self._data[task_id] = task
+    
+    def __delitem__(self, task_id: str):
+        if self._data.pop(task_id, None) is None:
+            del self._cold_ids()[task_id]
+    
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._data or task_id in self._cold_ids()
+    
+    def __iter__(self) -> Iterator[str]:
+        return chain(self._data, self._cold_ids())
+    
+    def __len__(self) -> int:
+        return len(self._data) + len(self._cold_ids())
+    
+    def loaded_values(self):
+        """Tasks read so far: every hot task, and the cold ones looked up."""
+        return self._data.values()
+    
+    def values(self):
+        """Read any unread cold tasks and return a view of all of them."""
+        cold = self._cold_ids()
+        if cold:
+            data = self._data
+            for task in self._storage.iter_cold_tasks():
+                if task.id in cold:
+                    data[task.id] = task
+            cold.clear()
+        return self._data.values()
+    
+    def reorder(self, task_ids: List[str]):
+        """Put the read tasks in the given key order."""
+        data = self._data
+        self._data = {task_id: data[task_id] for task_id in task_ids if task_id in data}
+
+
+def _encode_cursor(status: Optional[TaskStatus], priority: Optional[TaskPriority],
+                   sort_by: str, key: int, task_id: str) -> str:
+    """Pack a listing and the position of its last shown task into an opaque token."""
+    state = [status.value if status else None, priority.value if priority else None, sort_by, key, task_id]
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, status: Optional[TaskStatus], priority: Optional[TaskPriority],
+                   sort_by: str) -> Tuple[int, str]:
+    """
+    Unpack a cursor made by _encode_cursor.
+    
+    Returns:
+        ``(listing_key, task_id)`` of the task to resume after
+    
+    Raises:
+        ValueError: If the cursor is malformed or belongs to another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_status, cursor_priority, cursor_sort, key, task_id = state
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(key, int) or not isinstance(task_id, str):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    if [cursor_status, cursor_priority, cursor_sort] != [
+            status.value if status else None, priority.value if priority else None, sort_by]:
+        raise ValueError("Cursor belongs to a listing with other filters or sorting")
+    return key, task_id
+
+
+def _skip_to(tasks: Iterable[Task], sort_by: str, after: Tuple[int, str]) -> Iterator[Task]:
+    """
+    Skip an ordered task stream up to a cursor position.
+    
+    Tasks before the cursor's key are dropped. Among tasks sharing the key,
+    those up to the cursor's task are dropped too; if that task is gone,
+    all of them are kept.
+    """
+    key, task_id = after
+    tasks = iter(tasks)
+    ties: List[Task] = []
+    for task in tasks:
+        task_key = listing_key(task, sort_by)
+        if task_key < key:
+            continue
+        if task_key == key:
+            if task.id == task_id:
+                ties.clear()
+            else:
+                ties.append(task)
+            continue
+        yield from ties
+        yield task
+        break
+    else:
+        yield from ties
+        return
+    yield from tasks
+
+
+class _Batch:
+    """Pending changes and undo information of an open TaskManager.batch."""
+    
+    def __init__(self):
+        # Net change per task ID, in first-touched order
+        self.changes: Dict[str, Tuple[str, Task]] = {}
+        # (op, task, copy before the change), applied in reverse on rollback
+        self.undo: List[Tuple[str, Task, Optional[Task]]] = []
+        # Task order before the first delete, which rollback must restore
+        self.order: Optional[List[str]] = None
+    
+    def record(self, op: str, task: Task, old: Optional[Task] = None):
+        """
+        Record a change.
+        
+        Args:
+            op: Mutation type ("add", "update" or "delete")
+            task: The affected task
+            old: Copy of the task taken before an update
+        """
+        self.undo.append((op, task, old))
+        previous = self.changes.get(task.id)
+        if previous is None or previous[0] != "add":
+            self.changes[task.id] = (op, task)
+        elif op == "delete":
+            # Added and deleted within the batch: nothing to write
+            del self.changes[task.id]
+        # An update to a task added in this batch is still an add, and the
+        # task object already carries the latest values
 
 
 class TaskManager:
     """Manages tasks with CRUD operations and filtering capabilities."""
     
-    def __init__(self, storage):
+    def __init__(self, storage, columnar: bool = False):
         """
         Initialize the task manager with a storage backend.
         
         Args:
             storage: Storage implementation (FileStorage, DatabaseStorage, etc.)
+            columnar: Answer listings and statistics from a NumPy-backed
+                TaskTable instead of the per-task object indexes
+        
+        Raises:
+            ImportError: If columnar is requested but NumPy is not installed
         """
         self.storage = storage
-        self.tasks = self.storage.load_tasks()
+        self._table_class = None
+        if columnar:
+            # Imported here so that NumPy is only loaded when asked for
+            from task_table import TaskTable
+            self._table_class = TaskTable
+        if hasattr(self.storage, "load_hot_tasks"):
+            self._tasks = TieredTaskMap(self.storage)
+        elif hasattr(self.storage, "load_task_ids"):
+            self._tasks = LazyTaskMap(self.storage)
+        else:
+            self._tasks = {task.id: task for task in self.storage.load_tasks()}
+        # Built on the first shortened-ID lookup, so that commands naming a
+        # task by its full ID never sort every ID
+        self._prefix_index: Optional[PrefixIndex] = None
+        
+        # Indexes over task fields, kept in sync through add/update/remove
+        # once built. They are only needed for listings and statistics, so
+        # single-task commands never pay for building them.
+        self._query_index = None
+        self._stats = None
+        self._search_index: Optional[SearchIndex] = None
+        self._indexed = False
+        self._indexes: list = []
+        # With a hot/cold storage, listings filtered to a hot status are
+        # answered from an index over the hot tasks until cold ones are read
+        self._hot_index: Optional[TaskIndex] = None
+        self._batch: Optional[_Batch] = None
+        # Change feed: events are only built while someone is subscribed
+        self._subscriptions: List[Subscription] = []
+        self._sequence = 0
+    
+    def _ensure_indexes(self, in_memory: bool = False):
+        """
+        Build the listing and statistics indexes on first use.
+        
+        Args:
+            in_memory: Build them even if the storage answers queries itself,
+                for queries it cannot answer yet: inside a batch, the database
+                has not seen the batch's changes
+        """
+        # Storages that answer queries themselves need no in-memory index
+        needs_query = self._query_index is None and (in_memory or not hasattr(self.storage, "query_task_ids"))
+        needs_stats = self._stats is None and (in_memory or not hasattr(self.storage, "query_statistics"))
+        if self._indexed and not needs_query and not needs_stats:
+            return
+        self._indexed = True
+        if self._hot_index is not None:
+            self._indexes.remove(self._hot_index)
+            self._hot_index = None
+        if self._table_class is not None and (needs_query or needs_stats):
+            # One columnar table serves both roles
+            table = self._table_class(self._tasks.values())
+            if needs_query:
+                self._query_index = table
+            if needs_stats:
+                self._stats = table
+            self._indexes.append(table)
+            return
+        
+        if needs_query:
+            self._query_index = TaskIndex(self._tasks.values())
+        if needs_stats:
+            self._stats = StatisticsIndex(self._tasks.values())
+        self._indexes.extend(index for index in (self._query_index, self._stats) if index is not None)
+    
+    @property
+    def tasks(self) -> List[Task]:
+        """All tasks in insertion order."""
+        return list(self._tasks.values())
     
     def add_task(self, title: str, description: str = "", 
                  priority: TaskPriority = TaskPriority.MEDIUM, 
-                 due_date: Optional[str] = None) -> Task:
+                 due_date: Optional[str] = None,
+                 status: TaskStatus = TaskStatus.PENDING) -> Task:
         """
         Add a new task to the system.
         
@@ -31,6 +352,7 @@ class TaskManager:
             description: Task description
             priority: Task priority level
             due_date: Due date in YYYY-MM-DD format
+            status: Initial task status
             
         Returns:
             Created Task object
@@ -38,13 +360,262 @@ class TaskManager:
         task = Task(
             title=title,
             description=description,
+            status=status,
             priority=priority,
             due_date=due_date
         )
-        self.tasks.append(task)
-        self.storage.save_tasks(self.tasks)
+        self._tasks[task.id] = task
+        if self._prefix_index is not None:
+            self._prefix_index.add(task.id)
+        for index in self._indexes:
+            index.add(task)
+        self._persist("add", task)
         return task
     
+    def add_tasks(self, tasks: Iterable[dict]) -> List[Task]:
+        """
+        Add several tasks with a single write.
+        
+        Args:
+            tasks: Keyword arguments for add_task, one dictionary per task
+        
+        Returns:
+            Created Task objects, in order
+        """
+        with self.batch():
+            return [self.add_task(**fields) for fields in tasks]
+    
+    def update_many(self, task_ids: Iterable[str], **kwargs) -> List[Task]:
+        """
+        Apply the same update to several tasks with a single write.
+        
+        Args:
+            task_ids: Unique task identifiers
+            **kwargs: Task properties to update (title, description, status, priority, due_date)
+        
+        Returns:
+            Updated Task objects; IDs that were not found are skipped
+        """
+        with self.batch():
+            updated = [self.update_task(task_id, **kwargs) for task_id in task_ids]
+        return [task for task in updated if task is not None]
+    
+    def delete_many(self, task_ids: Iterable[str]) -> int:
+        """
+        Delete several tasks with a single write.
+        
+        Args:
+            task_ids: Unique task identifiers
+        
+        Returns:
+            Number of tasks deleted
+        """
+        with self.batch():
+            return sum(self.delete_task(task_id) for task_id in task_ids)
+    
+    def import_tasks(self, tasks: Iterable[Task], chunk_size: int = 1000) -> Iterator[int]:
+        """
+        Insert existing tasks in chunks, with one write per chunk.
+        
+        Tasks keep their IDs, statuses and timestamps. A task whose ID is
+        already stored replaces it. Only one chunk of the input is held at
+        a time, so tasks can stream straight from a file.
+        
+        Args:
+            tasks: Tasks to insert
+            chunk_size: Number of tasks saved per write
+        
+        Returns:
+            Iterator yielding the number of tasks in each chunk once it is saved
+        
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        # Checked here, not in the generator, so a bad call fails at once
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        return self._import_chunks(iter(tasks), chunk_size)
+    
+    def _import_chunks(self, tasks: Iterator[Task], chunk_size: int) -> Iterator[int]:
+        """Insert tasks chunk by chunk for import_tasks, yielding each chunk's size."""
+        while True:
+            chunk = list(islice(tasks, chunk_size))
+            if not chunk:
+                return
+            with self.batch():
+                for task in chunk:
+                    existing = self._tasks.get(task.id)
+                    if existing is None:
+                        self._tasks[task.id] = task
+                        if self._prefix_index is not None:
+                            self._prefix_index.add(task.id)
+                        for index in self._indexes:
+                            index.add(task)
+                        self._persist("add", task)
+                        continue
+                    # Overwrite in place, as update_task does
+                    old = copy.copy(existing)
+                    for name in Task.__slots__:
+                        setattr(existing, name, getattr(task, name))
+                    for index in self._indexes:
+                        index.update(old, existing)
+                    self._persist("update", existing, old)
+            yield len(chunk)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Group mutations into one storage write.
+        
+        Inside the block, changes apply in memory right away but are only
+        persisted when the block exits, as one write_batch call (or one
+        save_tasks for storages without single-task writes). If the block
+        raises, or the write fails, every in-memory change made in it is
+        undone and the exception propagates. Nested batches join the
+        outermost one.
+        
+        Example:
+            with manager.batch():
+                task = manager.add_task("Write report")
+                manager.update_task(task.id, status=TaskStatus.IN_PROGRESS)
+        """
+        if self._batch is not None:
+            yield self
+            return
+        
+        batch = self._batch = _Batch()
+        try:
+            yield self
+            self._write_batch(list(batch.changes.values()))
+        except BaseException:
+            self._rollback(batch)
+            raise
+        finally:
+            self._batch = None
+        if self._subscriptions:
+            # One event per task, for its net change: an add followed by
+            # updates is a creation, and an update's old values are the
+            # ones from before the batch
+            before = {}
+            for op, task, old in batch.undo:
+                if op == "update":
+                    before.setdefault(task.id, old)
+            self._publish([(op, task, before.get(task.id)) for op, task in batch.changes.values()])
+    
+    def _persist(self, op: str, task: Task, old: Optional[Task] = None):
+        """
+        Persist a single mutation, or record it if a batch is open.
+        
+        Storages that journal individual changes (add_task, update_task,
+        delete_task) receive just the affected task; others get the full
+        task list through save_tasks.
+        
+        Args:
+            op: Mutation type ("add", "update" or "delete")
+            task: The affected task
+            old: Copy of the task taken before an update
+        """
+        if self._batch is not None:
+            self._batch.record(op, task, old)
+            return
+        
+        writer = getattr(self.storage, f"{op}_task", None)
+        if writer is None:
+            self.storage.save_tasks(self.tasks)
+        elif op == "delete":
+            writer(task.id)
+        else:
+            writer(task)
+        if self._subscriptions:
+            self._publish([(op, task, old)])
+    
+    def _publish(self, changes: List[Tuple[str, Task, Optional[Task]]]):
+        """Send events for saved changes to every subscription, in order."""
+        types = {"add": EventType.CREATED, "update": EventType.UPDATED, "delete": EventType.DELETED}
+        events = []
+        for op, task, old in changes:
+            self._sequence += 1
+            diff = TaskEvent.diff(old, task) if op == "update" else None
+            events.append(TaskEvent(self._sequence, types[op], copy.copy(task), diff))
+        for subscription in list(self._subscriptions):
+            for event in events:
+                subscription.publish(event)
+    
+    def _write_batch(self, changes: List[Tuple[str, Task]]):
+        """Persist the net changes of a batch with as few writes as the storage allows."""
+        if not changes:
+            return
+        writer = getattr(self.storage, "write_batch", None)
+        if writer is not None:
+            writer(changes)
+        elif all(hasattr(self.storage, f"{op}_task") for op, _ in changes):
+            for op, task in changes:
+                writer = getattr(self.storage, f"{op}_task")
+                writer(task.id if op == "delete" else task)
+        else:
+            self.storage.save_tasks(self.tasks)
+    
+    def _rollback(self, batch: _Batch):
+        """Undo the in-memory changes of a failed batch."""
+        for op, task, old in reversed(batch.undo):
+            if op == "add":
+                del self._tasks[task.id]
+            elif op == "delete":
+                self._tasks[task.id] = task
+            else:
+                # Restore in place so references held by callers stay valid
+                for name in Task.__slots__:
+                    setattr(task, name, getattr(old, name))
+        
+        if batch.order is not None:
+            if not isinstance(self._tasks, dict):
+                self._tasks.reorder(batch.order)
+            else:
+                self._tasks = {task_id: self._tasks[task_id] for task_id in batch.order if task_id in self._tasks}
+        # Rebuilt from the restored tasks on next use
+        self._prefix_index = None
+        self._query_index = None
+        self._stats = None
+        self._search_index = None
+        self._indexed = False
+        self._indexes = []
+        self._hot_index = None
+    
+    def subscribe(self, callback: Optional[Callable[[TaskEvent], None]] = None,
+                  types: Optional[Iterable[EventType]] = None,
+                  maxsize: int = 1000, overflow: str = "drop_oldest") -> Subscription:
+        """
+        Subscribe to task changes.
+        
+        Every saved creation, update and deletion becomes a TaskEvent,
+        published once the change is handed to storage (for a batch, once
+        the batch is saved, with one event per task for its net change).
+        Consumers can keep derived views up to date from the events
+        instead of polling listings.
+        
+        Example:
+            subscription = manager.subscribe(maxsize=100, overflow="error")
+            async for event in subscription:
+                print(event.type.value, event.task_id, event.changes)
+        
+        Args:
+            callback: Called synchronously with each event; without one,
+                events are buffered for ``async for`` or get()
+            types: Event types to receive (all if None)
+            maxsize: Most events buffered at once
+            overflow: When the buffer is full, "drop_oldest", "drop_newest",
+                "error" or "block" (see Subscription)
+        
+        Returns:
+            The subscription; close() it to unsubscribe
+        
+        Raises:
+            ValueError: If maxsize is not positive or the policy is unknown
+        """
+        subscription = Subscription(self._subscriptions.remove, callback, types, maxsize, overflow)
+        self._subscriptions.append(subscription)
+        return subscription
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """
         Retrieve a task by ID.
@@ -55,10 +626,30 @@ class TaskManager:
         Returns:
             Task object if found, None otherwise
         """
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._tasks.get(task_id)
+    
+    def resolve_task_id(self, prefix: str) -> Optional[str]:
+        """
+        Resolve a full or shortened task ID.
+        
+        Args:
+            prefix: Full task ID or any unambiguous leading part of one
+        
+        Returns:
+            Full task ID if exactly one task matches, None if none does
+        
+        Raises:
+            ValueError: If the prefix matches more than one task
+        """
+        if prefix in self._tasks:
+            return prefix
+        
+        if self._prefix_index is None:
+            self._prefix_index = PrefixIndex(self._tasks)
+        matches = self._prefix_index.match(prefix)
+        if len(matches) > 1:
+            raise ValueError(f"Ambiguous task ID '{prefix}': matches several tasks")
+        return matches[0] if matches else None
     
     def update_task(self, task_id: str, **kwargs) -> Optional[Task]:
         """
@@ -75,6 +666,7 @@ class TaskManager:
         if not task:
             return None
         
+        old = copy.copy(task)
         if 'title' in kwargs:
             task.title = kwargs['title']
         if 'description' in kwargs:
@@ -87,7 +679,9 @@ class TaskManager:
             task.due_date = kwargs['due_date']
         
         task.updated_at = datetime.now().isoformat()
-        self.storage.save_tasks(self.tasks)
+        for index in self._indexes:
+            index.update(old, task)
+        self._persist("update", task, old)
         return task
     
     def delete_task(self, task_id: str) -> bool:
@@ -100,16 +694,25 @@ class TaskManager:
         Returns:
             True if task was deleted, False if not found
         """
-        task = self.get_task(task_id)
-        if task:
-            self.tasks.remove(task)
-            self.storage.save_tasks(self.tasks)
-            return True
-        return False
+        if task_id not in self._tasks:
+            return False
+        if self._batch is not None and self._batch.order is None:
+            self._batch.order = list(self._tasks)
+        
+        task = self._tasks.pop(task_id)
+        if self._prefix_index is not None:
+            self._prefix_index.remove(task_id)
+        for index in self._indexes:
+            index.remove(task)
+        self._persist("delete", task)
+        return True
     
     def list_tasks(self, status: Optional[TaskStatus] = None,
                    priority: Optional[TaskPriority] = None,
-                   sort_by: str = "created_at") -> List[Task]:
+                   sort_by: str = "created_at",
+                   limit: Optional[int] = None,
+                   offset: int = 0,
+                   cursor: Optional[str] = None) -> List[Task]:
         """
         List tasks with optional filtering and sorting.
         
@@ -117,30 +720,139 @@ class TaskManager:
             status: Filter by task status
             priority: Filter by task priority
             sort_by: Sort field (created_at, updated_at, priority, due_date)
+            limit: Maximum number of tasks to return
+            offset: Number of tasks to skip
+            cursor: Resume after the page this cursor came from (see list_page)
             
         Returns:
             List of filtered and sorted Task objects
+        
+        Raises:
+            ValueError: If limit or offset is negative, or the cursor is
+                malformed or belongs to another listing
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit must not be negative: {limit}")
+        if offset < 0:
+            raise ValueError(f"Offset must not be negative: {offset}")
+        end = None if limit is None else offset + limit
+        tasks = self._query(status, priority, sort_by, cursor, end)
+        return list(islice(tasks, offset, end))
+    
+    def list_page(self, status: Optional[TaskStatus] = None,
+                  priority: Optional[TaskPriority] = None,
+                  sort_by: str = "created_at",
+                  limit: int = 20,
+                  cursor: Optional[str] = None) -> Tuple[List[Task], Optional[str]]:
         """
-        filtered_tasks = self.tasks.copy()
+        Get one page of a listing.
         
-        if status:
-            filtered_tasks = [t for t in filtered_tasks if t.status == status]
+        Only the tasks on the page are selected from the indexes, and the
+        returned cursor picks up right after the last of them, even if
+        tasks were added or deleted in between or the manager restarted.
         
-        if priority:
-            filtered_tasks = [t for t in filtered_tasks if t.priority == priority]
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            sort_by: Sort field (created_at, updated_at, priority, due_date)
+            limit: Page size
+            cursor: Cursor returned with the previous page, or None for the first
         
-        # Sort tasks
-        if sort_by == "priority":
-            priority_order = {TaskPriority.HIGH: 3, TaskPriority.MEDIUM: 2, TaskPriority.LOW: 1}
-            filtered_tasks.sort(key=lambda t: priority_order.get(t.priority, 0), reverse=True)
-        elif sort_by == "due_date":
-            filtered_tasks.sort(key=lambda t: t.due_date or "9999-12-31")
-        elif sort_by == "updated_at":
-            filtered_tasks.sort(key=lambda t: t.updated_at, reverse=True)
-        else:  # created_at (default)
-            filtered_tasks.sort(key=lambda t: t.created_at, reverse=True)
+        Returns:
+            Tuple of (tasks on the page, cursor of the next page or None on the last)
         
-        return filtered_tasks
+        Raises:
+            ValueError: If the page size is not positive, or the cursor is
+                malformed or belongs to another listing
+        """
+        if limit < 1:
+            raise ValueError(f"Page size must be positive: {limit}")
+        tasks = list(islice(self._query(status, priority, sort_by, cursor, limit + 1), limit + 1))
+        if len(tasks) <= limit:
+            return tasks, None
+        last = tasks[limit - 1]
+        return tasks[:limit], _encode_cursor(status, priority, sort_by, listing_key(last, sort_by), last.id)
+    
+    def iter_tasks(self, status: Optional[TaskStatus] = None,
+                   priority: Optional[TaskPriority] = None,
+                   sort_by: str = "created_at",
+                   cursor: Optional[str] = None) -> Iterator[Task]:
+        """
+        Stream tasks with optional filtering and sorting.
+        
+        Same as list_tasks, but yields tasks as they are read from the
+        index instead of materializing the whole result.
+        
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            sort_by: Sort field (created_at, updated_at, priority, due_date)
+            cursor: Resume after the page this cursor came from (see list_page)
+        
+        Returns:
+            Iterator of filtered and sorted Task objects
+        
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another listing
+        """
+        return self._query(status, priority, sort_by, cursor, None)
+    
+    def _query(self, status: Optional[TaskStatus], priority: Optional[TaskPriority],
+               sort_by: str, cursor: Optional[str], limit: Optional[int]) -> Iterator[Task]:
+        """Stream a listing from the storage's SQL or the indexes, resuming at a cursor."""
+        after = _decode_cursor(cursor, status, priority, sort_by) if cursor else None
+        
+        query = getattr(self.storage, "query_task_ids", None)
+        if query is not None and self._batch is None:
+            task_ids = query(
+                status=status.value if status else None,
+                priority=priority.value if priority else None,
+                sort_by=sort_by
+            )
+            tasks = (self._tasks[task_id] for task_id in task_ids)
+            return tasks if after is None else _skip_to(tasks, sort_by, after)
+        
+        index = self._hot_query_index(status)
+        if index is None:
+            self._ensure_indexes(in_memory=query is not None)
+            index = self._query_index
+        return index.query(status=status, priority=priority, sort_by=sort_by, after=after, limit=limit)
+    
+    def _hot_query_index(self, status: Optional[TaskStatus]) -> Optional[TaskIndex]:
+        """
+        Get the index over hot tasks if it can answer a listing on its own.
+        
+        Every task with a hot status is loaded, and the index is kept up
+        to date for the cold tasks read since, so it holds all the tasks a
+        listing filtered to a hot status can return.
+        """
+        if (self._indexed or status is None or not isinstance(self._tasks, TieredTaskMap)
+                or self._tasks.cold_loaded or status in self.storage.cold_statuses):
+            return None
+        if self._hot_index is None:
+            self._hot_index = TaskIndex(self._tasks.loaded_values())
+            self._indexes.append(self._hot_index)
+        return self._hot_index
+    
+    def search_tasks(self, query: str, limit: int = 20) -> List[Task]:
+        """
+        Find tasks by words in their title or description.
+        
+        Matching is case-insensitive and requires every query word; a word
+        ending in ``*`` matches as a prefix. The search index is built on
+        first use and kept up to date afterwards.
+        
+        Args:
+            query: Words to look for
+            limit: Maximum number of results
+        
+        Returns:
+            Matching tasks, best match first
+        """
+        if self._search_index is None:
+            self._search_index = SearchIndex(self._tasks.values())
+            self._indexes.append(self._search_index)
+        return [self._tasks[task_id] for task_id, _ in self._search_index.search(query, limit)]
     
     def get_statistics(self) -> dict:
         """
@@ -149,13 +861,21 @@ class TaskManager:
         Returns:
             Dictionary with task statistics
         """
-        total = len(self.tasks)
-        completed = len([t for t in self.tasks if t.status == TaskStatus.COMPLETED])
-        pending = len([t for t in self.tasks if t.status == TaskStatus.PENDING])
-        in_progress = len([t for t in self.tasks if t.status == TaskStatus.IN_PROGRESS])
+        query = getattr(self.storage, "query_statistics", None)
+        if query is not None and self._batch is None:
+            stats = query()
+            total = stats["total"]
+            stats["completion_rate"] = (stats["completed"] / total * 100) if total > 0 else 0
+            return stats
+        
+        self._ensure_indexes(in_memory=query is not None)
+        total = len(self._tasks)
+        completed = self._stats.by_status[TaskStatus.COMPLETED]
+        pending = self._stats.by_status[TaskStatus.PENDING]
+        in_progress = self._stats.by_status[TaskStatus.IN_PROGRESS]
         
-        high_priority = len([t for t in self.tasks if t.priority == TaskPriority.HIGH])
-        overdue = len([t for t in self.tasks if t.is_overdue()])
+        high_priority = self._stats.by_priority[TaskPriority.HIGH]
+        overdue = self._stats.overdue_count()
         
         return {
             "total": total,
@@ -0,0 +1,262 @@
+"""
+Columnar task table for analytics-scale listings and statistics.
+
+Requires NumPy, which is optional: check NUMPY_AVAILABLE before use.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from task import Task, TaskStatus, TaskPriority, to_timestamp
+from indexes import NO_DUE_DATE, PRIORITY_ORDER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+_STATUSES = list(TaskStatus)
+_PRIORITIES = list(TaskPriority)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_PRIORITY_CODES = {priority: code for code, priority in enumerate(_PRIORITIES)}
+
+
+class TaskTable:
+    """
+    Tasks stored as parallel NumPy columns.
+    
+    Each task occupies one row: status and priority as int8 codes,
+    created/updated/due dates as int64 microsecond timestamps, and the
+    title as an int32 code into an interned string pool. Rows are appended
+    in insertion order, so the row number doubles as the stable-sort
+    tiebreak. Deleted rows are only marked dead and squeezed out once they
+    make up half of the table; the pool is rebuilt from the live titles
+    then, and whenever renames leave it twice the size of the table.
+    
+    Filters are boolean masks, sorts are stable argsorts and counts are
+    bincounts, all vectorized over the whole table. The table offers the
+    same interface as TaskIndex (query) and StatisticsIndex (by_status,
+    by_priority, overdue_count), so TaskManager can use it in their place.
+    """
+    
+    _COLUMNS = {
+        "status": "int8",
+        "priority": "int8",
+        "created": "int64",
+        "updated": "int64",
+        "due": "int64",
+        "has_due": "bool",
+        "title": "int32",
+        "alive": "bool",
+    }
+    
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initialize the table.
+        
+        Args:
+            tasks: Initial tasks (loaded in bulk)
+        
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("TaskTable requires NumPy (pip install numpy)")
+        
+        self._tasks: List[Optional[Task]] = list(tasks)
+        self._size = len(self._tasks)
+        self._rows: Dict[str, int] = {task.id: row for row, task in enumerate(self._tasks)}
+        self._dead = 0
+        self._title_pool: List[str] = []
+        self._title_codes: Dict[str, int] = {}
+        
+        # Maps a priority code to its position in PRIORITY_ORDER
+        self._priority_rank = np.array([PRIORITY_ORDER.index(p) for p in _PRIORITIES], dtype=np.int8)
+        
+        capacity = max(16, self._size)
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in self._COLUMNS.items()}
+        self._fill(0, self._tasks)
+    
+    def _intern(self, title: str) -> int:
+        """Get the pool code of a title, adding it if new."""
+        code = self._title_codes.get(title)
+        if code is None:
+            code = self._title_codes[title] = len(self._title_pool)
+            self._title_pool.append(title)
+        return code
+    
+    def _fill(self, start: int, tasks: List[Task]):
+        """Write tasks into consecutive rows starting at ``start``."""
+        count = len(tasks)
+        if not count:
+            return
+        columns = self._columns
+        end = start + count
+        columns["status"][start:end] = np.fromiter((_STATUS_CODES[t.status] for t in tasks), np.int8, count)
+        columns["priority"][start:end] = np.fromiter((_PRIORITY_CODES[t.priority] for t in tasks), np.int8, count)
+        columns["created"][start:end] = np.fromiter((t.created_ts or 0 for t in tasks), np.int64, count)
+        columns["updated"][start:end] = np.fromiter((t.updated_ts or 0 for t in tasks), np.int64, count)
+        due = [t.due_ts for t in tasks]
+        columns["has_due"][start:end] = np.fromiter((d is not None for d in due), np.bool_, count)
+        columns["due"][start:end] = np.fromiter((NO_DUE_DATE if d is None else d for d in due), np.int64, count)
+        columns["title"][start:end] = np.fromiter((self._intern(t.title) for t in tasks), np.int32, count)
+        columns["alive"][start:end] = True
+    
+    def _grow(self):
+        """Double the capacity of every column."""
+        for name, column in self._columns.items():
+            grown = np.zeros(len(column) * 2, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            self._columns[name] = grown
+    
+    def add(self, task: Task):
+        """Append a new task."""
+        if self._size == len(self._columns["alive"]):
+            self._grow()
+        row = self._size
+        self._size += 1
+        self._rows[task.id] = row
+        self._tasks.append(task)
+        self._fill(row, [task])
+    
+    def remove(self, task: Task):
+        """Mark a task's row dead."""
+        row = self._rows.pop(task.id)
+        self._columns["alive"][row] = False
+        self._tasks[row] = None
+        self._dead += 1
+        if self._dead * 2 > self._size:
+            self._compact()
+    
+    def update(self, old: Task, new: Task):
+        """
+        Rewrite a task's row after a change, adding it if the table did not hold it.
+        
+        Args:
+            old: Copy of the task taken before the change
+            new: The task after the change
+        """
+        row = self._rows.get(new.id)
+        if row is None:
+            self.add(new)
+            return
+        self._fill(row, [new])
+        if len(self._title_pool) > 2 * max(len(self._rows), 16):
+            self._rebuild_titles()
+    
+    def _compact(self):
+        """Drop dead rows, keeping the live ones in insertion order."""
+        live = np.flatnonzero(self._columns["alive"][:self._size])
+        for name, column in self._columns.items():
+            column[:len(live)] = column[live]
+            column[len(live):self._size] = 0
+        self._tasks = [self._tasks[row] for row in live.tolist()]
+        self._rows = {task.id: row for row, task in enumerate(self._tasks)}
+        self._size = len(live)
+        self._dead = 0
+        self._rebuild_titles()
+    
+    def _rebuild_titles(self):
+        """Re-intern the titles of live rows, dropping titles no row uses."""
+        self._title_pool = []
+        self._title_codes = {}
+        self._columns["title"][:self._size] = np.fromiter(
+            (0 if task is None else self._intern(task.title) for task in self._tasks), np.int32, self._size)
+    
+    def _column(self, name: str):
+        """View of a column over the used rows."""
+        return self._columns[name][:self._size]
+    
+    def query(self, status: Optional[TaskStatus] = None,
+              priority: Optional[TaskPriority] = None,
+              sort_by: str = "created_at",
+              after: Optional[Tuple[int, str]] = None,
+              limit: Optional[int] = None) -> Iterator[Task]:
+        """
+        Iterate over matching tasks in sort order.
+        
+        Args:
+            status: Filter by task status
+            priority: Filter by task priority
+            sort_by: Sort field (created_at, updated_at, priority, due_date)
+            after: ``(listing_key, task_id)`` of the task to resume after.
+                If that task is gone, resume at the first task with its key.
+            limit: Most tasks the caller will read. Only the smallest keys
+                are then selected (in linear time) and sorted.
+        
+        Returns:
+            Iterator of matching tasks
+        """
+        mask = self._column("alive").copy()
+        if status is not None:
+            mask &= self._column("status") == _STATUS_CODES[status]
+        if priority is not None:
+            mask &= self._column("priority") == _PRIORITY_CODES[priority]
+        rows = np.flatnonzero(mask)
+        
+        # Keys ascend in listing order (see indexes.listing_key): negating a
+        # key sorts descending while stable sorts keep ties in row order
+        if sort_by == "priority":
+            keys = self._priority_rank[self._column("priority")[rows]].astype(np.int64)
+        elif sort_by == "due_date":
+            keys = self._column("due")[rows]
+        elif sort_by == "updated_at":
+            keys = -self._column("updated")[rows]
+        else:
+            keys = -self._column("created")[rows]
+        
+        if after is not None:
+            key, task_id = after
+            row = self._rows.get(task_id)
+            keep = keys > key
+            keep |= keys == key if row is None else (keys == key) & (rows > row)
+            rows, keys = rows[keep], keys[keep]
+        
+        if limit is not None and limit < len(rows):
+            if limit <= 0:
+                return iter(())
+            # Every row tied with the limit-th smallest key survives, so the
+            # stable sort below still breaks those ties by row
+            cutoff = np.partition(keys, limit - 1)[limit - 1]
+            keep = keys <= cutoff
+            rows, keys = rows[keep], keys[keep]
+        
+        rows = rows[np.argsort(keys, kind="stable")][:limit]
+        return map(self._tasks.__getitem__, rows.tolist())
+    
+    @property
+    def by_status(self) -> Counter:
+        """Number of tasks per status."""
+        counts = np.bincount(self._column("status")[self._column("alive")], minlength=len(_STATUSES))
+        return Counter(dict(zip(_STATUSES, counts.tolist())))
+    
+    @property
+    def by_priority(self) -> Counter:
+        """Number of tasks per priority."""
+        counts = np.bincount(self._column("priority")[self._column("alive")], minlength=len(_PRIORITIES))
+        return Counter(dict(zip(_PRIORITIES, counts.tolist())))
+    
+    def overdue_count(self, now: Optional[datetime] = None) -> int:
+        """
+        Count overdue tasks.
+        
+        Args:
+            now: Point in time to evaluate against (defaults to now)
+        
+        Returns:
+            Number of non-completed tasks whose due date has passed
+        """
+        now = to_timestamp(now or datetime.now())
+        overdue = (self._column("alive") & self._column("has_due")
+                   & (self._column("status") != _STATUS_CODES[TaskStatus.COMPLETED])
+                   & (self._column("due") < now))
+        return int(np.count_nonzero(overdue))
+    
+    def title(self, task_id: str) -> str:
+        """Look up a task's title in the string pool."""
+        return self._title_pool[self._columns["title"][self._rows[task_id]]]
+    
+    def __len__(self) -> int:
+        return len(self._rows)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the AsyncTaskManager class.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from async_task_manager import AsyncTaskManager
+from storage import BinaryFileStorage, DatabaseStorage, FileStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+class GatedStorage(BinaryFileStorage):
+    """Storage without single-task hooks whose saves block until released, counting them."""
+    
+    def __init__(self, filepath):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.saves = 0
+        super().__init__(filepath)
+        self.gate.clear()
+        self.saves = 0
+    
+    def save_tasks(self, tasks):
+        self.gate.wait(5)
+        self.saves += 1
+        super().save_tasks(tasks)
+
+
+class TestAsyncTaskManager(unittest.TestCase):
+    """Test cases for AsyncTaskManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.json")
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_changes_are_saved(self):
+        """Test that awaited writes are on disk."""
+        async def scenario():
+            manager = await AsyncTaskManager.open(FileStorage(self.path))
+            kept = await manager.add_task("Kept")
+            dropped = await manager.add_task("Dropped")
+            await manager.update_task(kept.id, status=TaskStatus.COMPLETED)
+            await manager.delete_task(dropped.id)
+            self.assertEqual([t.id for t in TaskManager(FileStorage(self.path)).list_tasks()], [kept.id])
+            await manager.close()
+        
+        asyncio.run(scenario())
+    
+    def test_reads_do_not_wait_for_saves(self):
+        """Test that reads see pending changes while the save is blocked."""
+        async def scenario():
+            path = os.path.join(self.temp_dir.name, "tasks.bin")
+            storage = GatedStorage(path)
+            manager = await AsyncTaskManager.open(storage)
+            adds = [asyncio.ensure_future(manager.add_task(f"Task {i}")) for i in range(10)]
+            await asyncio.sleep(0.05)
+            
+            self.assertFalse(any(add.done() for add in adds))
+            self.assertEqual(len(await manager.list_tasks()), 10)
+            self.assertEqual((await manager.get_statistics())["total"], 10)
+            
+            storage.gate.set()
+            await asyncio.gather(*adds)
+            # The saves queued behind the blocked one were collapsed
+            self.assertLessEqual(storage.saves, 2)
+            self.assertEqual(len(BinaryFileStorage(path).load_tasks()), 10)
+            await manager.close()
+        
+        asyncio.run(scenario())
+    
+    def test_batch_rollback(self):
+        """Test that a failed batch writes nothing and restores memory."""
+        async def scenario():
+            manager = await AsyncTaskManager.open(FileStorage(self.path))
+            task = await manager.add_task("Original")
+            with self.assertRaises(RuntimeError):
+                async with manager.batch() as tasks:
+                    tasks.update_task(task.id, title="Changed")
+                    tasks.add_task("New")
+                    raise RuntimeError("abort")
+            self.assertEqual([t.title for t in await manager.list_tasks()], ["Original"])
+            
+            async with manager.batch() as tasks:
+                tasks.add_task("New")
+            self.assertEqual(len(FileStorage(self.path).load_tasks()), 2)
+            await manager.close()
+        
+        asyncio.run(scenario())
+    
+    def test_database_storage(self):
+        """Test that a SQLite storage is used from the I/O thread."""
+        async def scenario():
+            storage = DatabaseStorage(os.path.join(self.temp_dir.name, "tasks.db"))
+            manager = await AsyncTaskManager.open(storage)
+            task = await manager.add_task("Task")
+            self.assertEqual([t.id for t in storage.load_tasks()], [task.id])
+            await manager.close()
+        
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
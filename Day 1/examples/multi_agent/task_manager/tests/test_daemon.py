@@ -0,0 +1,103 @@
+"""
+Unit tests for the task daemon and its client.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from cli import TaskCLI
+from daemon import DaemonClient, TaskDaemon
+from storage import FileStorage
+from task_manager import TaskManager
+
+
+class SlowFileStorage(FileStorage):
+    """FileStorage whose batch writes take a while, counting them and failing on request."""
+    
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.writes = 0
+        self.fail = False
+    
+    def write_batch(self, changes):
+        time.sleep(0.02)
+        if self.fail:
+            raise OSError("disk full")
+        self.writes += 1
+        super().write_batch(changes)
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+class TestTaskDaemon(unittest.TestCase):
+    """Test cases for TaskDaemon and DaemonClient."""
+    
+    def setUp(self):
+        """Start a daemon over a temporary store."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.json")
+        self.storage = SlowFileStorage(self.path)
+        socket_path = os.path.join(self.temp_dir.name, "tasks.sock")
+        self.daemon = TaskDaemon(TaskCLI(TaskManager(self.storage)), socket_path)
+        self.thread = threading.Thread(target=self.daemon.serve_forever)
+        self.thread.start()
+        deadline = time.monotonic() + 5
+        while DaemonClient.connect(socket_path) is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.client = DaemonClient.connect(socket_path)
+    
+    def tearDown(self):
+        """Stop the daemon and clean up."""
+        self.daemon.stop()
+        self.thread.join()
+        self.assertFalse(os.path.exists(self.daemon.socket_path))
+        self.temp_dir.cleanup()
+    
+    def stored_titles(self):
+        """Titles of the tasks on disk."""
+        return sorted(task.title for task in FileStorage(self.path).load_tasks())
+    
+    def test_changes_are_saved_before_the_reply(self):
+        """Test that a command's output arrives once its change is on disk."""
+        output = self.client.send(["add", "From client"])
+        self.assertIn("Task added", output)
+        self.assertEqual(self.stored_titles(), ["From client"])
+        self.assertIn("Total Tasks: 1", self.client.send(["stats"]))
+    
+    def test_writes_are_group_committed(self):
+        """Test that commands arriving together are saved with fewer writes."""
+        outputs = []
+        threads = [threading.Thread(target=lambda i=i: outputs.append(self.client.send(["add", f"Task {i}"])))
+                   for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(len(outputs), 20)
+        self.assertTrue(all("Task added" in output for output in outputs))
+        self.assertEqual(self.stored_titles(), sorted(f"Task {i}" for i in range(20)))
+        self.assertLess(self.storage.writes, 20)
+        self.assertEqual(self.daemon.commands, 20)
+    
+    def test_failed_commit_is_reported_and_undone(self):
+        """Test that a failed write rolls the group back and tells the client."""
+        self.storage.fail = True
+        output = self.client.send(["add", "Lost"])
+        self.assertIn("Changes not saved: disk full", output)
+        self.storage.fail = False
+        self.assertIn("Total Tasks: 0", self.client.send(["stats"]))
+        self.assertEqual(self.stored_titles(), [])
+    
+    def test_batch_command_rolls_back_on_its_own(self):
+        """Test that a failing batch command is undone without affecting other commands."""
+        self.client.send(["add", "Kept"])
+        output = self.client.send(["batch", "add", "Dropped", ";", "delete", "missing"])
+        self.assertIn("Batch rolled back", output)
+        self.assertEqual(self.stored_titles(), ["Kept"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+Unit tests for the change feed of TaskManager.
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from async_task_manager import AsyncTaskManager
+from events import EventOverflow, EventType
+from storage import FileStorage
+from task import TaskStatus
+from task_manager import TaskManager
+
+
+class TestChangeFeed(unittest.TestCase):
+    """Test cases for TaskManager.subscribe and Subscription."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = TaskManager(FileStorage(os.path.join(self.temp_dir.name, "tasks.json")))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_callback_receives_typed_events(self):
+        """Test that creations, updates and deletions are published with their changes."""
+        events = []
+        self.manager.subscribe(events.append)
+        task = self.manager.add_task("Write report")
+        self.manager.update_task(task.id, status=TaskStatus.COMPLETED)
+        self.manager.delete_task(task.id)
+        
+        self.assertEqual([e.type for e in events], [EventType.CREATED, EventType.UPDATED, EventType.DELETED])
+        self.assertEqual([e.sequence for e in events], [1, 2, 3])
+        self.assertEqual(events[1].changes["status"], (TaskStatus.PENDING, TaskStatus.COMPLETED))
+        self.assertNotIn("title", events[1].changes)
+        self.assertEqual(events[0].task.status, TaskStatus.PENDING)
+    
+    def test_type_filter_and_close(self):
+        """Test that subscriptions receive only their types, and nothing once closed."""
+        events = []
+        subscription = self.manager.subscribe(events.append, types=[EventType.DELETED])
+        task = self.manager.add_task("Task")
+        self.manager.delete_task(task.id)
+        subscription.close()
+        self.manager.delete_task(self.manager.add_task("Other").id)
+        self.assertEqual([(e.type, e.task_id) for e in events], [(EventType.DELETED, task.id)])
+    
+    def test_batch_publishes_net_changes(self):
+        """Test that a batch publishes one event per task once it is saved."""
+        kept = self.manager.add_task("Kept")
+        events = []
+        self.manager.subscribe(events.append)
+        with self.manager.batch():
+            self.manager.update_task(kept.id, title="Renamed")
+            self.manager.update_task(kept.id, title="Renamed again")
+            new = self.manager.add_task("New")
+            self.manager.update_task(new.id, status=TaskStatus.COMPLETED)
+            self.manager.delete_task(self.manager.add_task("Gone").id)
+            self.assertEqual(events, [])
+        
+        by_id = {e.task_id: e for e in events}
+        self.assertEqual(len(events), 2)
+        self.assertEqual(by_id[kept.id].changes["title"], ("Kept", "Renamed again"))
+        self.assertEqual(by_id[new.id].type, EventType.CREATED)
+        self.assertEqual(by_id[new.id].task.status, TaskStatus.COMPLETED)
+    
+    def test_rolled_back_batch_publishes_nothing(self):
+        """Test that undone changes are never published."""
+        events = []
+        self.manager.subscribe(events.append)
+        with self.assertRaises(ValueError):
+            with self.manager.batch():
+                self.manager.add_task("Dropped")
+                raise ValueError("abort")
+        self.assertEqual(events, [])
+    
+    def test_failing_callback_is_unsubscribed(self):
+        """Test that a raising callback keeps its error and stops receiving events."""
+        def callback(event):
+            raise RuntimeError("view broken")
+        
+        subscription = self.manager.subscribe(callback)
+        self.manager.add_task("First")
+        self.manager.add_task("Second")
+        self.assertTrue(subscription.closed)
+        self.assertIsInstance(subscription.error, RuntimeError)
+        self.assertEqual(len(self.manager.list_tasks()), 2)
+    
+    def test_drop_policies(self):
+        """Test that full buffers drop the oldest or newest events and count them."""
+        oldest = self.manager.subscribe(maxsize=2, overflow="drop_oldest")
+        newest = self.manager.subscribe(maxsize=2, overflow="drop_newest")
+        for i in range(5):
+            self.manager.add_task(f"Task {i}")
+        
+        self.assertEqual([oldest.get(0).task.title for _ in range(2)], ["Task 3", "Task 4"])
+        self.assertEqual([newest.get(0).task.title for _ in range(2)], ["Task 0", "Task 1"])
+        self.assertEqual((oldest.dropped, newest.dropped), (3, 3))
+        self.assertIsNone(oldest.get(0))
+    
+    def test_error_policy(self):
+        """Test that overflowing under "error" delivers the buffer, then raises."""
+        subscription = self.manager.subscribe(maxsize=2, overflow="error")
+        for i in range(3):
+            self.manager.add_task(f"Task {i}")
+        
+        self.assertTrue(subscription.closed)
+        self.assertEqual(subscription.get(0).task.title, "Task 0")
+        self.assertEqual(subscription.get(0).task.title, "Task 1")
+        with self.assertRaises(EventOverflow):
+            subscription.get(0)
+        self.assertIsNone(subscription.get(0))
+    
+    def test_block_policy_waits_for_consumer_thread(self):
+        """Test that a writer waits for a slower consumer instead of dropping events."""
+        subscription = self.manager.subscribe(maxsize=1, overflow="block")
+        received = []
+        
+        def consume():
+            while len(received) < 20:
+                received.append(subscription.get(5).task.title)
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        for i in range(20):
+            self.manager.add_task(f"Task {i}")
+        consumer.join(5)
+        self.assertEqual(received, [f"Task {i}" for i in range(20)])
+        self.assertEqual(subscription.dropped, 0)
+    
+    def test_invalid_settings(self):
+        """Test that bad buffer settings are rejected."""
+        with self.assertRaises(ValueError):
+            self.manager.subscribe(maxsize=0)
+        with self.assertRaises(ValueError):
+            self.manager.subscribe(overflow="ignore")
+
+
+class TestAsyncChangeFeed(unittest.TestCase):
+    """Test cases for consuming the change feed with async iteration."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.json")
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_incremental_view(self):
+        """Test that an async consumer keeps a view equal to a fresh listing."""
+        async def scenario():
+            manager = await AsyncTaskManager.open(FileStorage(self.path))
+            subscription = manager.subscribe(maxsize=2, overflow="block")
+            view = {}
+            
+            async def consume():
+                async for event in subscription:
+                    if event.type is EventType.DELETED:
+                        view.pop(event.task_id)
+                    else:
+                        view[event.task_id] = event.task.status
+            
+            consumer = asyncio.create_task(consume())
+            tasks = [await manager.add_task(f"Task {i}") for i in range(10)]
+            for task in tasks[:4]:
+                await manager.update_task(task.id, status=TaskStatus.COMPLETED)
+            await manager.delete_task(tasks[9].id)
+            async with manager.batch() as batch:
+                batch.update_task(tasks[5].id, status=TaskStatus.IN_PROGRESS)
+                batch.delete_task(tasks[8].id)
+            subscription.close()
+            await consumer
+            
+            expected = {task.id: task.status for task in await manager.list_tasks()}
+            self.assertEqual(view, expected)
+            self.assertEqual(subscription.dropped, 0)
+            await manager.close()
+        
+        asyncio.run(scenario())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Unit tests for the in-memory task indexes.
+"""
+
+import copy
+import random
+import unittest
+from datetime import datetime
+from itertools import islice
+from indexes import PrefixIndex, SearchIndex, StatisticsIndex, TaskIndex, listing_key, tokenize
+from task import Task, TaskStatus, TaskPriority
+
+
+def check_paging(test, query, tasks):
+    """Check that resuming a query after any task, or a deleted one, continues the full listing."""
+    for sort_by in ["created_at", "updated_at", "due_date", "priority"]:
+        for status in [None, TaskStatus.PENDING]:
+            full = reference_list(tasks, status, None, sort_by)
+            test.assertEqual(list(islice(query(status, None, sort_by, limit=5), 5)), full[:5])
+            keys = [listing_key(task, sort_by) for task in full]
+            for position, task in enumerate(full):
+                after = (keys[position], task.id)
+                test.assertEqual(list(query(status, None, sort_by, after=after)), full[position + 1:],
+                                 (status, sort_by, position))
+                # Without the task, resume at the first one sharing its key
+                first_tie = keys.index(keys[position])
+                test.assertEqual(list(query(status, None, sort_by, after=(keys[position], "gone"))),
+                                 full[first_tie:])
+
+
+def reference_list(tasks, status=None, priority=None, sort_by="created_at"):
+    """Filter and sort by scanning, as list_tasks did before indexing."""
+    result = [t for t in tasks if (status is None or t.status == status)
+              and (priority is None or t.priority == priority)]
+    if sort_by == "priority":
+        order = {TaskPriority.HIGH: 3, TaskPriority.MEDIUM: 2, TaskPriority.LOW: 1}
+        result.sort(key=lambda t: order[t.priority], reverse=True)
+    elif sort_by == "due_date":
+        result.sort(key=lambda t: t.due_date or "9999-12-31")
+    else:
+        result.sort(key=lambda t: getattr(t, sort_by), reverse=True)
+    return result
+
+
+class TestPrefixIndex(unittest.TestCase):
+    """Test cases for PrefixIndex class."""
+    
+    def test_match(self):
+        """Test prefix matching after adds and removes."""
+        index = PrefixIndex(["b2", "a1", "a2"])
+        self.assertEqual(index.match("a"), ["a1", "a2"])
+        self.assertEqual(index.match("a", limit=1), ["a1"])
+        index.remove("a1")
+        index.add("c3")
+        self.assertEqual(index.match("a"), ["a2"])
+        self.assertEqual(index.match("c"), ["c3"])
+        self.assertEqual(index.match("d"), [])
+
+
+class TestTaskIndex(unittest.TestCase):
+    """Test cases for TaskIndex class."""
+    
+    def test_query_matches_scan(self):
+        """Test that indexed listings match a filtered full sort."""
+        rng = random.Random(7)
+        days = [None, "2030-01-01", "2030-01-02", "2030-01-03"]
+        
+        def random_task(i):
+            return Task(
+                f"Task {i}",
+                status=rng.choice(list(TaskStatus)),
+                priority=rng.choice(list(TaskPriority)),
+                due_date=rng.choice(days),
+                created_at=f"2025-01-01T00:00:{rng.randint(0, 9):02d}",
+                updated_at=f"2025-01-02T00:00:{rng.randint(0, 9):02d}",
+            )
+        
+        tasks = [random_task(i) for i in range(200)]
+        index = TaskIndex(tasks)
+        
+        for i in range(200, 300):
+            task = random_task(i)
+            tasks.append(task)
+            index.add(task)
+        for task in rng.sample(tasks, 50):
+            old = copy.copy(task)
+            task.status = rng.choice(list(TaskStatus))
+            task.due_date = rng.choice(days)
+            task.updated_at = f"2025-01-03T00:00:{rng.randint(0, 9):02d}"
+            index.update(old, task)
+        for task in rng.sample(tasks, 30):
+            tasks.remove(task)
+            index.remove(task)
+        
+        self.assertEqual(len(index), len(tasks))
+        for sort_by in ["created_at", "updated_at", "due_date", "priority"]:
+            for status in [None, TaskStatus.PENDING]:
+                for priority in [None, TaskPriority.HIGH]:
+                    self.assertEqual(
+                        list(index.query(status, priority, sort_by)),
+                        reference_list(tasks, status, priority, sort_by),
+                        (status, priority, sort_by)
+                    )
+    
+    
+    def test_resume_after(self):
+        """Test resuming listings after a task, as pagination cursors do."""
+        rng = random.Random(9)
+        tasks = [
+            Task(
+                f"Task {i}",
+                status=rng.choice([TaskStatus.PENDING, TaskStatus.COMPLETED]),
+                priority=rng.choice(list(TaskPriority)),
+                due_date=rng.choice([None, "2030-01-01", "2030-01-02"]),
+                created_at=f"2025-01-01T00:00:{rng.randint(0, 5):02d}",
+                updated_at=f"2025-01-02T00:00:{rng.randint(0, 5):02d}",
+            )
+            for i in range(60)
+        ]
+        check_paging(self, TaskIndex(tasks).query, tasks)
+
+
+class TestStatisticsIndex(unittest.TestCase):
+    """Test cases for StatisticsIndex class."""
+    
+    def test_counters(self):
+        """Test that bucket counts follow adds, updates and removes."""
+        first = Task("First", priority=TaskPriority.HIGH)
+        second = Task("Second")
+        stats = StatisticsIndex([first])
+        stats.add(second)
+        
+        old = copy.copy(first)
+        first.status = TaskStatus.COMPLETED
+        stats.update(old, first)
+        stats.remove(second)
+        
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats.by_status[TaskStatus.COMPLETED], 1)
+        self.assertEqual(stats.by_status[TaskStatus.PENDING], 0)
+        self.assertEqual(stats.by_priority[TaskPriority.HIGH], 1)
+    
+    def test_overdue_advances_with_time(self):
+        """Test that tasks become overdue as the clock passes their due date."""
+        early = Task("Early", due_date="2030-01-01")
+        late = Task("Late", due_date="2030-02-01")
+        done = Task("Done", due_date="2030-01-01", status=TaskStatus.COMPLETED)
+        invalid = Task("Invalid", due_date="soon")
+        stats = StatisticsIndex([early, late, done, invalid])
+        
+        self.assertEqual(stats.overdue_count(datetime(2029, 12, 31)), 0)
+        self.assertEqual(stats.overdue_count(datetime(2030, 1, 15)), 1)
+        self.assertEqual(stats.overdue_count(datetime(2030, 3, 1)), 2)
+        
+        old = copy.copy(early)
+        early.due_date = "2031-01-01"
+        stats.update(old, early)
+        self.assertEqual(stats.overdue_count(datetime(2030, 3, 1)), 1)
+        
+        stats.remove(late)
+        self.assertEqual(stats.overdue_count(datetime(2030, 3, 1)), 0)
+        self.assertEqual(stats.overdue_count(datetime(2031, 1, 2)), 1)
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test cases for SearchIndex class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.report = Task("Write quarterly REPORT", "Numbers for the report")
+        self.review = Task("Review report", "Check the draft")
+        self.groceries = Task("Groceries", "Milk, eggs; report to nobody")
+        self.index = SearchIndex([self.report, self.review, self.groceries])
+    
+    def ids(self, query, limit=20):
+        return [task_id for task_id, _ in self.index.search(query, limit)]
+    
+    def test_tokenize(self):
+        """Test that tokens are case-folded words without punctuation."""
+        self.assertEqual(tokenize("Straße, ÉTÉ & co-op!"), ["strasse", "été", "co", "op"])
+    
+    def test_ranking(self):
+        """Test that all words must match and title hits rank first."""
+        self.assertEqual(self.ids("report"), [self.report.id, self.review.id, self.groceries.id])
+        self.assertEqual(self.ids("REPORT review"), [self.review.id])
+        self.assertEqual(self.ids("report", limit=1), [self.report.id])
+        self.assertEqual(self.ids("missing report"), [])
+        self.assertEqual(self.ids("  "), [])
+    
+    def test_prefix(self):
+        """Test that a trailing star matches every completion."""
+        self.assertEqual(self.ids("rev*"), [self.review.id])
+        self.assertEqual(sorted(self.ids("re*")), sorted([self.report.id, self.review.id, self.groceries.id]))
+        self.assertEqual(self.ids("rev"), [])
+    
+    def test_incremental_updates(self):
+        """Test that updates and removals are reflected in results."""
+        old = copy.copy(self.groceries)
+        self.groceries.title = "Groceries reviewed"
+        self.groceries.description = "Milk"
+        self.index.update(old, self.groceries)
+        self.index.remove(self.report)
+        self.index.add(Task("Another review", task_id="new"))
+        
+        self.assertEqual(self.ids("report"), [self.review.id])
+        self.assertEqual(sorted(self.ids("review*")), sorted([self.review.id, self.groceries.id, "new"]))
+        self.assertEqual(self.ids("quarterly"), [])
+        self.assertEqual(len(self.index), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,551 @@
+"""
+Unit tests for the storage backends.
+"""
+
+import unittest
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from task_manager import TaskManager
+from storage import (FileStorage, JournaledFileStorage, DatabaseStorage, NDJSONStorage,
+                     BinaryFileStorage, PartitionedStorage, migrate_json_to_ndjson, migrate_ndjson_to_json,
+                     migrate_json_to_binary, migrate_binary_to_json, migrate_json_to_partitioned,
+                     migrate_partitioned_to_json)
+from task import Task, TaskStatus, TaskPriority
+
+
+class TestFileStorage(unittest.TestCase):
+    """Test cases for FileStorage shared between processes."""
+    
+    def setUp(self):
+        """Set up two managers over the same file, as two processes would have."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.json")
+        self.shared = TaskManager(FileStorage(self.path)).add_task("Shared", "Original")
+        self.first = TaskManager(FileStorage(self.path))
+        self.second = TaskManager(FileStorage(self.path))
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def reload(self):
+        """Load the stored tasks by title."""
+        return {task.title: task for task in FileStorage(self.path).load_tasks()}
+    
+    def test_concurrent_adds_are_kept(self):
+        """Test that a save does not drop tasks another process added."""
+        self.first.add_task("From first")
+        self.second.add_task("From second")
+        # The second manager never loaded "From first", which must survive its next save too
+        self.second.add_task("From second again")
+        self.assertEqual(set(self.reload()), {"Shared", "From first", "From second", "From second again"})
+    
+    def test_field_level_merge(self):
+        """Test that edits to different fields of one task are combined."""
+        self.first.update_task(self.shared.id, status=TaskStatus.COMPLETED)
+        self.second.update_task(self.shared.id, description="Edited", priority=TaskPriority.HIGH)
+        shared = self.reload()["Shared"]
+        self.assertEqual((shared.status, shared.description, shared.priority),
+                         (TaskStatus.COMPLETED, "Edited", TaskPriority.HIGH))
+        
+        # The same field changed on both sides: the later save wins
+        self.first.update_task(self.shared.id, description="First")
+        self.second.update_task(self.shared.id, description="Second")
+        self.assertEqual(self.reload()["Shared"].description, "Second")
+    
+    def test_deletes(self):
+        """Test deletions against unchanged and concurrently edited tasks."""
+        other = self.first.add_task("Other")
+        self.second.add_task("Unrelated")
+        self.first.delete_task(self.shared.id)
+        self.assertNotIn("Shared", self.reload())
+        
+        # Deleting a task another process edited in the meantime keeps the edit
+        self.second = TaskManager(FileStorage(self.path))
+        self.first.update_task(other.id, description="Edited")
+        self.second.delete_task(other.id)
+        self.assertEqual(self.reload()["Other"].description, "Edited")
+    
+    def test_add_without_loading(self):
+        """Test that tasks are appended to a file that was never loaded."""
+        storage = FileStorage(self.path)
+        added = [Task(f"Appended {i}") for i in range(2)]
+        storage.add_task(added[0])
+        storage.write_batch([("add", added[1])])
+        
+        tasks = FileStorage(self.path).load_tasks()
+        self.assertEqual([t.title for t in tasks], ["Shared", "Appended 0", "Appended 1"])
+        # The file is laid out exactly as a full save would write it
+        with open(self.path) as f:
+            self.assertEqual(f.read(), json.dumps([t.to_dict() for t in tasks], indent=2))
+        
+        # A manager that loaded before the appends keeps them when it saves
+        self.first.update_task(self.shared.id, status=TaskStatus.COMPLETED)
+        self.assertEqual(set(self.reload()), {"Shared", "Appended 0", "Appended 1"})
+    
+    def test_writes_are_atomic(self):
+        """Test that saves leave no temporary files behind."""
+        self.first.add_task("Task")
+        leftovers = [name for name in os.listdir(self.temp_dir.name) if name.startswith(".tmp-")]
+        self.assertEqual(leftovers, [])
+
+
+class TestJournaledFileStorage(unittest.TestCase):
+    """Test cases for JournaledFileStorage class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.json")
+        self.storage = JournaledFileStorage(self.path)
+        self.manager = TaskManager(self.storage)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_mutations_append_to_journal(self):
+        """Test that single-task writes leave the snapshot untouched."""
+        task = self.manager.add_task("Journaled", priority=TaskPriority.HIGH)
+        self.manager.update_task(task.id, status=TaskStatus.IN_PROGRESS)
+        self.manager.delete_task(task.id)
+        
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), [])
+        with open(self.storage.journal_path) as f:
+            ops = [json.loads(line)["op"] for line in f]
+        self.assertEqual(ops, ["add", "update", "delete"])
+    
+    def test_replay_on_load(self):
+        """Test that loading replays the journal over the snapshot."""
+        kept = self.manager.add_task("Kept")
+        removed = self.manager.add_task("Removed")
+        self.manager.update_task(kept.id, title="Kept and renamed")
+        self.manager.delete_task(removed.id)
+        
+        reloaded = TaskManager(JournaledFileStorage(self.path))
+        self.assertEqual([t.title for t in reloaded.tasks], ["Kept and renamed"])
+    
+    def test_compaction(self):
+        """Test that a large journal is folded into the snapshot."""
+        storage = JournaledFileStorage(self.path, min_compact_bytes=0, compact_ratio=0)
+        manager = TaskManager(storage)
+        manager.add_task("Compacted")
+        
+        self.assertEqual(os.path.getsize(storage.journal_path), 0)
+        with open(self.path) as f:
+            self.assertEqual([t["title"] for t in json.load(f)], ["Compacted"])
+    
+    def test_torn_journal_tail_is_ignored(self):
+        """Test that a partially written record does not break loading."""
+        self.manager.add_task("Complete")
+        with open(self.storage.journal_path, 'a') as f:
+            f.write('{"op": "add", "task": {"id": "tor')
+        
+        reloaded = TaskManager(JournaledFileStorage(self.path))
+        self.assertEqual([t.title for t in reloaded.tasks], ["Complete"])
+    
+    def test_appends_after_torn_tail_are_kept(self):
+        """Test that records written after a torn tail are readable on the next load."""
+        self.manager.add_task("A")
+        with open(self.storage.journal_path, 'a') as f:
+            f.write('{"op": "add", "task": {"id": "tor')
+        
+        manager = TaskManager(JournaledFileStorage(self.path))
+        manager.add_task("B")
+        manager.add_task("C")
+        
+        reloaded = TaskManager(JournaledFileStorage(self.path))
+        self.assertEqual(sorted(t.title for t in reloaded.tasks), ["A", "B", "C"])
+        reloaded.storage.compact()
+        self.assertEqual(sorted(t.title for t in TaskManager(JournaledFileStorage(self.path)).tasks),
+                         ["A", "B", "C"])
+
+
+class TestNDJSONStorage(unittest.TestCase):
+    """Test cases for NDJSONStorage class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.ndjson")
+        self.storage = NDJSONStorage(self.path)
+        self.manager = TaskManager(self.storage)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.storage.close()
+        self.temp_dir.cleanup()
+    
+    def reload(self) -> TaskManager:
+        """Open a fresh manager on the same file."""
+        self.storage.close()
+        self.storage = NDJSONStorage(self.path)
+        return TaskManager(self.storage)
+    
+    def test_replay_on_load(self):
+        """Test that the last line for each task wins, in insertion order."""
+        first = self.manager.add_task("First")
+        removed = self.manager.add_task("Removed")
+        third = self.manager.add_task("Third")
+        self.manager.update_task(first.id, title="First, renamed")
+        self.manager.delete_task(removed.id)
+        
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 5)
+        reloaded = self.reload()
+        self.assertEqual([t.to_dict() for t in reloaded.tasks],
+                         [first.to_dict(), third.to_dict()])
+    
+    def test_lazy_hydration(self):
+        """Test that looking up one task parses only that task."""
+        tasks = [self.manager.add_task(f"Task {i}") for i in range(5)]
+        reloaded = self.reload()
+        
+        task = reloaded.get_task(reloaded.resolve_task_id(tasks[2].id[:8]))
+        self.assertEqual(task.to_dict(), tasks[2].to_dict())
+        self.assertEqual(reloaded._tasks._pending, 4)
+        
+        listed = reloaded.list_tasks(sort_by="due_date")
+        self.assertEqual([t.id for t in listed], [t.id for t in tasks])
+        self.assertIs(listed[2], task)
+        self.assertEqual(reloaded._tasks._pending, 0)
+    
+    def test_compaction(self):
+        """Test that superseded lines are dropped without reordering tasks."""
+        storage = NDJSONStorage(self.path, min_compact_lines=2, compact_ratio=0)
+        manager = TaskManager(storage)
+        first = manager.add_task("First")
+        second = manager.add_task("Second")
+        manager.update_task(first.id, status=TaskStatus.COMPLETED)
+        manager.update_task(first.id, title="First, done")
+        storage.close()
+        
+        with open(self.path) as f:
+            self.assertEqual([json.loads(line)["id"] for line in f], [first.id, second.id])
+        self.assertEqual([t.title for t in self.reload().tasks], ["First, done", "Second"])
+    
+    def test_batch_appends_net_changes(self):
+        """Test that a batch appends one line per task it changed."""
+        kept = self.manager.add_task("Kept")
+        with self.manager.batch():
+            added = self.manager.add_tasks([{"title": "Added"}, {"title": "Transient"}])
+            self.manager.update_many([kept.id, added[0].id], status=TaskStatus.COMPLETED)
+            self.manager.delete_task(added[1].id)
+        
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 3)
+        self.assertEqual([t.to_dict() for t in self.reload().tasks],
+                         [kept.to_dict(), added[0].to_dict()])
+    
+    def test_torn_tail_is_ignored_and_overwritten(self):
+        """Test that a partially written line neither breaks loading nor later appends."""
+        self.manager.add_task("Complete")
+        with open(self.path, 'a') as f:
+            f.write('{"id":"tor')
+        
+        reloaded = self.reload()
+        self.assertEqual([t.title for t in reloaded.tasks], ["Complete"])
+        reloaded.add_task("After the tear")
+        self.assertEqual([t.title for t in self.reload().tasks], ["Complete", "After the tear"])
+    
+    def test_migration_round_trip(self):
+        """Test converting a JSON array file to NDJSON and back."""
+        json_path = os.path.join(self.temp_dir.name, "tasks.json")
+        manager = TaskManager(FileStorage(json_path))
+        manager.add_task("Migrated", "Description", TaskPriority.HIGH, "2030-01-01")
+        manager.add_task("Also migrated")
+        original = [t.to_dict() for t in manager.tasks]
+        
+        self.assertEqual(migrate_json_to_ndjson(json_path, self.path), 2)
+        self.assertEqual([t.to_dict() for t in self.reload().tasks], original)
+        
+        os.unlink(json_path)
+        self.assertEqual(migrate_ndjson_to_json(self.path, json_path), 2)
+        with open(json_path) as f:
+            self.assertEqual(json.load(f), original)
+
+
+class TestBinaryFileStorage(unittest.TestCase):
+    """Test cases for BinaryFileStorage class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.bin")
+        self.storage = BinaryFileStorage(self.path)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.storage.close()
+        self.temp_dir.cleanup()
+    
+    def test_round_trip_is_exact(self):
+        """Test that every field, including unusual ones, survives a save and load."""
+        tasks = [
+            Task("Plain"),
+            Task("Ünïcödé ✓", "Multi\nline", TaskStatus.COMPLETED, TaskPriority.HIGH, "2030-01-01"),
+            Task("Odd dates", due_date="someday", created_at="2025-01-01T00:00:00+02:00",
+                 updated_at="2025-01-01 10:00:00"),
+            Task("", task_id="custom-id", due_date="2030-01-01T09:30:00"),
+        ]
+        self.storage.save_tasks(tasks)
+        
+        loaded = BinaryFileStorage(self.path).load_tasks()
+        self.assertEqual([t.to_dict() for t in loaded], [t.to_dict() for t in tasks])
+    
+    def test_lazy_hydration(self):
+        """Test that a manager decodes only the tasks it looks up."""
+        manager = TaskManager(self.storage)
+        tasks = manager.add_tasks([{"title": f"Task {i}"} for i in range(5)])
+        
+        reloaded = TaskManager(BinaryFileStorage(self.path))
+        task = reloaded.get_task(reloaded.resolve_task_id(tasks[3].id[:8]))
+        self.assertEqual(task.to_dict(), tasks[3].to_dict())
+        self.assertEqual(reloaded._tasks._pending, 4)
+        self.assertEqual([t.title for t in reloaded.tasks], [t.title for t in tasks])
+        reloaded.storage.close()
+    
+    def test_corruption_is_detected(self):
+        """Test that a damaged snapshot fails its checksum instead of loading garbage."""
+        self.storage.save_tasks([Task("Checked")])
+        with open(self.path, 'r+b') as f:
+            f.seek(-3, os.SEEK_END)
+            f.write(b"XYZ")
+        
+        with self.assertRaisesRegex(ValueError, "checksum"):
+            BinaryFileStorage(self.path).load_tasks()
+        self.assertEqual(len(BinaryFileStorage(self.path, verify=False).load_tasks()), 1)
+    
+    def test_migration_round_trip(self):
+        """Test converting a JSON array file to a binary snapshot and back."""
+        json_path = os.path.join(self.temp_dir.name, "tasks.json")
+        manager = TaskManager(FileStorage(json_path))
+        manager.add_task("Migrated", "Description", TaskPriority.HIGH, "2030-01-01")
+        original = [t.to_dict() for t in manager.tasks]
+        
+        self.assertEqual(migrate_json_to_binary(json_path, self.path), 1)
+        os.unlink(json_path)
+        self.assertEqual(migrate_binary_to_json(self.path, json_path), 1)
+        with open(json_path) as f:
+            self.assertEqual(json.load(f), original)
+
+
+class TestPartitionedStorage(unittest.TestCase):
+    """Test cases for PartitionedStorage class."""
+    
+    def setUp(self):
+        """Set up a store whose finished tasks move to cold segments in pairs."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks")
+        self.manager = TaskManager(self.open())
+        self.tasks = self.manager.add_tasks([{"title": f"Task {i}"} for i in range(6)])
+        self.manager.update_many([t.id for t in self.tasks[:4]], status=TaskStatus.COMPLETED)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def open(self, **kwargs) -> PartitionedStorage:
+        """Open the store, counting the cold segments it decodes."""
+        storage = PartitionedStorage(self.path, segment_size=2, **kwargs)
+        storage.segment_reads = 0
+        read_segment = storage._read_segment
+        
+        def counting(position):
+            storage.segment_reads += 1
+            return read_segment(position)
+        
+        storage._read_segment = counting
+        return storage
+    
+    def hot_titles(self):
+        """Titles of the tasks in the hot file."""
+        with open(os.path.join(self.path, "hot.json")) as f:
+            return sorted(task["title"] for task in json.load(f)["tasks"])
+    
+    def test_finished_tasks_move_to_cold_segments(self):
+        """Test that completed tasks leave the hot file in full segments."""
+        self.assertEqual(self.hot_titles(), ["Task 4", "Task 5"])
+        self.assertEqual(sorted(name for name in os.listdir(self.path) if name.endswith(".seg")),
+                         ["cold-000001.seg", "cold-000002.seg"])
+        self.manager.update_task(self.tasks[4].id, status=TaskStatus.CANCELLED)
+        self.assertEqual(self.hot_titles(), ["Task 4", "Task 5"])
+        
+        self.assertEqual(sorted(t.to_dict()["id"] for t in self.open().load_tasks()),
+                         sorted(t.id for t in self.tasks))
+    
+    def test_hot_listing_does_not_read_cold_tasks(self):
+        """Test that only queries covering finished tasks decode cold segments."""
+        reloaded = TaskManager(self.open())
+        self.assertEqual(len(reloaded._tasks), 6)
+        pending = reloaded.list_tasks(status=TaskStatus.PENDING)
+        self.assertEqual([t.title for t in pending], ["Task 5", "Task 4"])
+        found = reloaded.get_task(reloaded.resolve_task_id(self.tasks[0].id[:8]))
+        self.assertEqual(found.to_dict(), self.manager.get_task(self.tasks[0].id).to_dict())
+        self.assertEqual(reloaded.storage.segment_reads, 1)
+        
+        completed = reloaded.list_tasks(status=TaskStatus.COMPLETED)
+        self.assertEqual(sorted(t.title for t in completed), [f"Task {i}" for i in range(4)])
+        self.assertEqual(reloaded.get_statistics()["completed"], 4)
+        self.assertEqual(reloaded.storage.segment_reads, 3)
+    
+    def test_reopened_and_deleted_cold_tasks(self):
+        """Test that changing cold tasks moves or removes them, and compaction drops them."""
+        reloaded = TaskManager(self.open(min_compact_tasks=3, compact_ratio=0))
+        reloaded.list_tasks(status=TaskStatus.PENDING)
+        reloaded.update_task(self.tasks[0].id, status=TaskStatus.IN_PROGRESS)
+        self.assertEqual([t.title for t in reloaded.list_tasks(status=TaskStatus.IN_PROGRESS)], ["Task 0"])
+        reloaded.delete_task(self.tasks[1].id)
+        self.assertEqual(self.hot_titles(), ["Task 0", "Task 4", "Task 5"])
+        
+        fresh = TaskManager(self.open())
+        self.assertEqual(sorted(t.title for t in fresh.tasks), ["Task 0", "Task 2", "Task 3", "Task 4", "Task 5"])
+        self.assertIsNone(fresh.get_task(self.tasks[1].id))
+        
+        reloaded.delete_task(self.tasks[2].id)
+        self.assertEqual(sorted(name for name in os.listdir(self.path) if name.endswith(".seg")),
+                         ["cold-000003.seg"])
+        self.assertEqual(sorted(t.title for t in TaskManager(self.open()).tasks),
+                         ["Task 0", "Task 3", "Task 4", "Task 5"])
+    
+    def test_updated_cold_task_frozen_again(self):
+        """Test that a cold task updated and then moved to a new segment stays visible."""
+        first = self.tasks[0].id
+        self.manager.update_task(first, title="Renamed")
+        self.manager.update_task(self.tasks[4].id, status=TaskStatus.COMPLETED)
+        self.assertEqual(self.hot_titles(), ["Task 5"])
+        
+        expected = ["Renamed", "Task 1", "Task 2", "Task 3", "Task 4", "Task 5"]
+        fresh = TaskManager(self.open())
+        self.assertEqual(sorted(t.title for t in fresh.list_tasks()), expected)
+        self.assertEqual(fresh.get_task(first).title, "Renamed")
+        self.assertEqual(fresh.get_statistics()["completed"], 5)
+        
+        fresh.storage.compact()
+        compacted = TaskManager(self.open())
+        self.assertEqual(sorted(t.title for t in compacted.list_tasks()), expected)
+        self.assertEqual(compacted.get_task(first).title, "Renamed")
+    
+    def test_rolled_back_delete_restores_cold_task(self):
+        """Test that a failed batch puts back a cold task it deleted."""
+        reloaded = TaskManager(self.open())
+        with self.assertRaises(ValueError):
+            with reloaded.batch():
+                reloaded.delete_task(self.tasks[0].id)
+                raise ValueError("abort")
+        self.assertEqual(reloaded.get_task(self.tasks[0].id).title, "Task 0")
+        self.assertEqual(len(reloaded.list_tasks()), 6)
+    
+    def test_migration_round_trip(self):
+        """Test converting a JSON array file to partitions and back."""
+        json_path = os.path.join(self.temp_dir.name, "tasks.json")
+        manager = TaskManager(FileStorage(json_path))
+        manager.add_task("Migrated", "Description", TaskPriority.HIGH, "2030-01-01")
+        manager.add_task("Done", status=TaskStatus.COMPLETED)
+        original = sorted((t.to_dict() for t in manager.tasks), key=lambda d: d["id"])
+        
+        self.assertEqual(migrate_json_to_partitioned(json_path, self.path), 2)
+        self.assertEqual(self.hot_titles(), ["Migrated"])
+        os.unlink(json_path)
+        self.assertEqual(migrate_partitioned_to_json(self.path, json_path), 2)
+        with open(json_path) as f:
+            self.assertEqual(sorted(json.load(f), key=lambda d: d["id"]), original)
+
+
+class TestDatabaseStorage(unittest.TestCase):
+    """Test cases for DatabaseStorage class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tasks.db")
+        self.storage = DatabaseStorage(f"sqlite:///{self.path}")
+        self.manager = TaskManager(self.storage)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.storage.close()
+        self.temp_dir.cleanup()
+    
+    def test_persistence(self):
+        """Test that row-level writes survive a reload."""
+        kept = self.manager.add_task("Kept", "Description", TaskPriority.HIGH, "2030-01-01")
+        removed = self.manager.add_task("Removed")
+        self.manager.update_task(kept.id, status=TaskStatus.IN_PROGRESS)
+        self.manager.delete_task(removed.id)
+        
+        storage = DatabaseStorage(self.path)
+        tasks = storage.load_tasks()
+        storage.close()
+        self.assertEqual(len(tasks), 1)
+        self.assertEqual(tasks[0].to_dict(), kept.to_dict())
+    
+    def test_batch_in_one_transaction(self):
+        """Test that batched changes reach the database as their net effect."""
+        kept = self.manager.add_task("Kept")
+        with self.manager.batch():
+            added = self.manager.add_task("Added")
+            self.manager.update_task(added.id, status=TaskStatus.COMPLETED)
+            transient = self.manager.add_task("Transient")
+            self.manager.delete_task(transient.id)
+            self.manager.delete_task(kept.id)
+        
+        storage = DatabaseStorage(self.path)
+        tasks = storage.load_tasks()
+        storage.close()
+        self.assertEqual([t.to_dict() for t in tasks], [added.to_dict()])
+    
+    def test_queries_inside_batch(self):
+        """Test that listings and statistics inside a batch see its unsaved changes."""
+        kept = self.manager.add_task("Kept")
+        removed = self.manager.add_task("Removed", status=TaskStatus.COMPLETED)
+        with self.manager.batch():
+            self.manager.delete_task(removed.id)
+            added = self.manager.add_task("Added", priority=TaskPriority.HIGH)
+            self.manager.update_task(kept.id, status=TaskStatus.IN_PROGRESS)
+            self.assertEqual(self.manager.list_tasks(), [added, kept])
+            self.assertEqual(self.manager.list_tasks(status=TaskStatus.IN_PROGRESS), [kept])
+            stats = self.manager.get_statistics()
+            self.assertEqual((stats["total"], stats["completed"], stats["high_priority"]), (2, 0, 1))
+        
+        self.assertEqual(self.manager.list_tasks(), [added, kept])
+        self.assertEqual(self.manager.get_statistics()["in_progress"], 1)
+    
+    def test_list_tasks_in_sql(self):
+        """Test that filters and sorts are answered by the database."""
+        low = self.manager.add_task("Low", priority=TaskPriority.LOW, due_date="2030-01-02")
+        high = self.manager.add_task("High", priority=TaskPriority.HIGH, due_date="2030-01-03")
+        none = self.manager.add_task("No due date", priority=TaskPriority.HIGH)
+        self.manager.update_task(low.id, status=TaskStatus.COMPLETED)
+        
+        self.assertEqual(self.manager.list_tasks(priority=TaskPriority.HIGH, sort_by="due_date"),
+                         [high, none])
+        self.assertEqual(self.manager.list_tasks(status=TaskStatus.COMPLETED), [low])
+        self.assertEqual(self.manager.list_tasks(sort_by="priority"), [high, none, low])
+        
+        page, cursor = self.manager.list_page(sort_by="priority", limit=1)
+        self.assertEqual(page, [high])
+        self.assertEqual(self.manager.list_page(sort_by="priority", limit=2, cursor=cursor), ([none, low], None))
+    
+    def test_statistics_in_sql(self):
+        """Test that statistics are counted by the database."""
+        past = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+        self.manager.add_task("Overdue", priority=TaskPriority.HIGH, due_date=past)
+        done = self.manager.add_task("Done", due_date=past)
+        self.manager.update_task(done.id, status=TaskStatus.COMPLETED)
+        self.manager.add_task("Invalid due date", due_date="someday")
+        
+        stats = self.manager.get_statistics()
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(stats["completed"], 1)
+        self.assertEqual(stats["pending"], 2)
+        self.assertEqual(stats["high_priority"], 1)
+        self.assertEqual(stats["overdue"], 1)
+        self.assertAlmostEqual(stats["completion_rate"], 100 / 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,6 +63,29 @@ class TestTask(unittest.TestCase):
         self.assertEqual(task2.title, task.title)
         self.assertEqual(task2.status, task.status)
         self.assertEqual(task2.priority, task.priority)
+    
+    def test_serialization_round_trip_is_exact(self):
+        """Test that timestamps survive the compact representation unchanged."""
+        for due_date in [None, "", "2025-06-15", "2025-06-15T09:30:00", "2025-06-15T00:00:00", "someday"]:
+            data = {
+                "id": "abc",
+                "title": "Round trip",
+                "description": "",
+                "status": "completed",
+                "priority": "low",
+                "due_date": due_date,
+                "created_at": "2025-01-01T08:00:00.123456",
+                "updated_at": "2025-01-01T08:00:00+02:00"
+            }
+            self.assertEqual(Task.from_dict(data).to_dict(), data)
+    
+    def test_compact_layout(self):
+        """Test that tasks are slotted and store timestamps as integers."""
+        task = Task(title="Compact", due_date="1970-01-02", created_at="1970-01-01T00:00:01")
+        self.assertFalse(hasattr(task, "__dict__"))
+        self.assertEqual(task.due_ts, 86_400_000_000)
+        self.assertEqual(task.created_ts, 1_000_000)
+        self.assertIsNone(Task(title="Invalid", due_date="someday").due_ts)
 
 
 if __name__ == "__main__":
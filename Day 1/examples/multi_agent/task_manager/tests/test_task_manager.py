@@ -7,7 +7,7 @@ import os
 import tempfile
 from task_manager import TaskManager
 from storage import FileStorage
-from task import TaskStatus, TaskPriority
+from task import Task, TaskStatus, TaskPriority
 
 
 class TestTaskManager(unittest.TestCase):
@@ -54,6 +54,23 @@ class TestTaskManager(unittest.TestCase):
         self.assertIsNone(self.manager.get_task(task.id))
         self.assertFalse(self.manager.delete_task("nonexistent"))
     
+    def test_resolve_task_id(self):
+        """Test resolving shortened task IDs."""
+        self.storage.save_tasks([
+            Task("First", task_id="abc12345-0000"),
+            Task("Second", task_id="abc67890-0000"),
+        ])
+        manager = TaskManager(self.storage)
+        
+        self.assertEqual(manager.resolve_task_id("abc1"), "abc12345-0000")
+        self.assertEqual(manager.resolve_task_id("abc67890-0000"), "abc67890-0000")
+        self.assertIsNone(manager.resolve_task_id("abd"))
+        with self.assertRaises(ValueError):
+            manager.resolve_task_id("abc")
+        
+        manager.delete_task("abc12345-0000")
+        self.assertEqual(manager.resolve_task_id("abc"), "abc67890-0000")
+    
     def test_list_tasks_filtered(self):
         """Test listing tasks with filters."""
         self.manager.add_task("Task 1", priority=TaskPriority.HIGH)
@@ -66,6 +83,96 @@ class TestTaskManager(unittest.TestCase):
         completed = self.manager.list_tasks(status=TaskStatus.COMPLETED)
         self.assertEqual(len(completed), 1)
     
+    def test_pagination(self):
+        """Test limit/offset and cursor pages, including across restarts."""
+        for i in range(7):
+            self.manager.add_task(f"Task {i}", priority=TaskPriority.HIGH if i % 3 else TaskPriority.LOW)
+        full = self.manager.list_tasks(sort_by="priority")
+        self.assertEqual(self.manager.list_tasks(sort_by="priority", limit=3, offset=2), full[2:5])
+        
+        page, cursor = self.manager.list_page(sort_by="priority", limit=3)
+        self.assertEqual(page, full[:3])
+        # A new manager over the same file resumes from the cursor, and a
+        # task deleted from an earlier page does not shift the next one
+        manager = TaskManager(FileStorage(self.temp_file.name))
+        manager.delete_task(full[0].id)
+        page, cursor = manager.list_page(sort_by="priority", limit=3, cursor=cursor)
+        self.assertEqual([t.id for t in page], [t.id for t in full[3:6]])
+        page, cursor = manager.list_page(sort_by="priority", limit=3, cursor=cursor)
+        self.assertEqual([t.id for t in page], [full[6].id])
+        self.assertIsNone(cursor)
+        
+        _, cursor = self.manager.list_page(limit=2)
+        with self.assertRaises(ValueError):
+            self.manager.list_page(sort_by="due_date", cursor=cursor)
+        with self.assertRaises(ValueError):
+            self.manager.list_tasks(cursor="not-a-cursor")
+        with self.assertRaises(ValueError):
+            self.manager.list_tasks(limit=-1)
+        with self.assertRaises(ValueError):
+            self.manager.list_tasks(offset=-2)
+        self.assertEqual(self.manager.list_tasks(limit=0), [])
+    
+    def test_batch_writes_once(self):
+        """Test that a batch of mutations is saved with a single write."""
+        kept = self.manager.add_task("Kept")
+        dropped = self.manager.add_task("Dropped")
+        writes = []
+        write_batch = self.storage.write_batch
+        self.storage.write_batch = lambda changes: writes.append([op for op, _ in changes]) or write_batch(changes)
+        self.storage.save_tasks = lambda tasks: self.fail("a batch rewrote every task")
+        
+        added = self.manager.add_tasks([{"title": f"Bulk {i}"} for i in range(3)])
+        updated = self.manager.update_many([kept.id, "nonexistent", added[0].id], status=TaskStatus.COMPLETED)
+        deleted = self.manager.delete_many([dropped.id, added[1].id])
+        
+        self.assertEqual(writes, [["add"] * 3, ["update"] * 2, ["delete"] * 2])
+        self.assertEqual(updated, [kept, added[0]])
+        self.assertEqual(deleted, 2)
+        reloaded = TaskManager(FileStorage(self.temp_file.name))
+        self.assertEqual([t.to_dict() for t in reloaded.tasks],
+                         [t.to_dict() for t in [kept, added[0], added[2]]])
+    
+    def test_batch_rollback(self):
+        """Test that a failing batch leaves memory and storage untouched."""
+        first = self.manager.add_task("First", priority=TaskPriority.HIGH)
+        second = self.manager.add_task("Second", due_date="2030-01-01")
+        third = self.manager.add_task("Third")
+        before = [t.to_dict() for t in self.manager.tasks]
+        self.assertEqual(len(self.manager.list_tasks(priority=TaskPriority.HIGH)), 1)
+        
+        with self.assertRaises(RuntimeError):
+            with self.manager.batch():
+                added = self.manager.add_task("Added", priority=TaskPriority.HIGH)
+                self.manager.update_task(first.id, title="Renamed", priority=TaskPriority.LOW)
+                self.manager.update_task(second.id, due_date=None)
+                self.manager.delete_task(second.id)
+                self.manager.delete_task(added.id)
+                raise RuntimeError("abort")
+        
+        self.assertEqual([t.to_dict() for t in self.manager.tasks], before)
+        self.assertIs(self.manager.get_task(first.id), first)
+        self.assertEqual(first.title, "First")
+        self.assertEqual(self.manager.list_tasks(priority=TaskPriority.HIGH), [first])
+        self.assertEqual(self.manager.list_tasks(sort_by="due_date"), [second, first, third])
+        self.assertIsNone(self.manager.resolve_task_id(added.id))
+        reloaded = TaskManager(FileStorage(self.temp_file.name))
+        self.assertEqual([t.to_dict() for t in reloaded.tasks], before)
+    
+    def test_search_tasks(self):
+        """Test that search follows adds, updates and deletes."""
+        report = self.manager.add_task("Quarterly report", "Revenue numbers")
+        self.assertEqual(self.manager.search_tasks("REPORT"), [report])
+        self.assertEqual(self.manager.search_tasks("report", limit=0), [])
+        
+        draft = self.manager.add_task("Draft", "First report draft")
+        self.manager.update_task(report.id, title="Quarterly summary")
+        self.assertEqual(self.manager.search_tasks("report"), [draft])
+        self.assertEqual(self.manager.search_tasks("quart*"), [report])
+        
+        self.manager.delete_task(draft.id)
+        self.assertEqual(self.manager.search_tasks("report"), [])
+    
     def test_get_statistics(self):
         """Test getting task statistics."""
         self.manager.add_task("Task 1", status=TaskStatus.PENDING)
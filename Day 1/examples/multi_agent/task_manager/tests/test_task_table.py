@@ -0,0 +1,147 @@
+"""
+Unit tests for the columnar task table.
+"""
+
+import copy
+import random
+import unittest
+from datetime import datetime
+from task import Task, TaskStatus, TaskPriority
+from task_manager import TaskManager
+from task_table import NUMPY_AVAILABLE, TaskTable
+from tests.test_indexes import check_paging, reference_list
+
+
+class MemoryStorage:
+    """Storage that starts empty and discards writes."""
+    
+    def load_tasks(self):
+        return []
+    
+    def save_tasks(self, tasks):
+        pass
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "NumPy is not installed")
+class TestTaskTable(unittest.TestCase):
+    """Test cases for TaskTable class."""
+    
+    def test_query_matches_scan(self):
+        """Test that vectorized listings match a filtered full sort."""
+        rng = random.Random(11)
+        days = [None, "2030-01-01", "2030-01-02", "2030-01-03"]
+        
+        def random_task(i):
+            return Task(
+                f"Task {i % 7}",
+                status=rng.choice(list(TaskStatus)),
+                priority=rng.choice(list(TaskPriority)),
+                due_date=rng.choice(days),
+                created_at=f"2025-01-01T00:00:{rng.randint(0, 9):02d}",
+                updated_at=f"2025-01-02T00:00:{rng.randint(0, 9):02d}",
+            )
+        
+        tasks = [random_task(i) for i in range(200)]
+        table = TaskTable(tasks)
+        
+        for i in range(200, 300):
+            task = random_task(i)
+            tasks.append(task)
+            table.add(task)
+        for task in rng.sample(tasks, 50):
+            old = copy.copy(task)
+            task.status = rng.choice(list(TaskStatus))
+            task.due_date = rng.choice(days)
+            task.updated_at = f"2025-01-03T00:00:{rng.randint(0, 9):02d}"
+            table.update(old, task)
+        # Enough removals to trigger compaction of the dead rows
+        for task in rng.sample(tasks, 160):
+            tasks.remove(task)
+            table.remove(task)
+        
+        self.assertEqual(len(table), len(tasks))
+        for sort_by in ["created_at", "updated_at", "due_date", "priority"]:
+            for status in [None, TaskStatus.PENDING]:
+                for priority in [None, TaskPriority.HIGH]:
+                    self.assertEqual(
+                        list(table.query(status, priority, sort_by)),
+                        reference_list(tasks, status, priority, sort_by),
+                        (status, priority, sort_by)
+                    )
+        self.assertEqual(table.title(tasks[0].id), tasks[0].title)
+    
+    def test_resume_after(self):
+        """Test resuming listings after a task and selecting the first few."""
+        rng = random.Random(13)
+        tasks = [
+            Task(
+                f"Task {i}",
+                status=rng.choice([TaskStatus.PENDING, TaskStatus.COMPLETED]),
+                priority=rng.choice(list(TaskPriority)),
+                due_date=rng.choice([None, "2030-01-01", "2030-01-02"]),
+                created_at=f"2025-01-01T00:00:{rng.randint(0, 5):02d}",
+                updated_at=f"2025-01-02T00:00:{rng.randint(0, 5):02d}",
+            )
+            for i in range(60)
+        ]
+        check_paging(self, TaskTable(tasks).query, tasks)
+    
+    def test_statistics(self):
+        """Test counts and overdue checks against a point in time."""
+        early = Task("Early", due_date="2030-01-01", priority=TaskPriority.HIGH)
+        late = Task("Late", due_date="2030-02-01")
+        done = Task("Done", due_date="2030-01-01", status=TaskStatus.COMPLETED)
+        table = TaskTable([early, late, done, Task("No due date")])
+        
+        self.assertEqual(table.by_status[TaskStatus.PENDING], 3)
+        self.assertEqual(table.by_status[TaskStatus.COMPLETED], 1)
+        self.assertEqual(table.by_priority[TaskPriority.HIGH], 1)
+        self.assertEqual(table.overdue_count(datetime(2029, 12, 31)), 0)
+        self.assertEqual(table.overdue_count(datetime(2030, 3, 1)), 2)
+        
+        table.remove(late)
+        self.assertEqual(table.overdue_count(datetime(2030, 3, 1)), 1)
+    
+    def test_title_pool_keeps_only_live_titles(self):
+        """Test that renamed and deleted tasks' titles leave the pool."""
+        tasks = [Task(f"Task {i}") for i in range(40)]
+        table = TaskTable(tasks)
+        for n in range(10):
+            for task in tasks[:20]:
+                old = copy.copy(task)
+                task.title = f"{task.id} round {n}"
+                table.update(old, task)
+        self.assertLessEqual(len(table._title_pool), 2 * len(tasks))
+        
+        # Removing over half of the rows compacts the table
+        for task in tasks[:21]:
+            table.remove(task)
+        self.assertEqual(sorted(table._title_pool), sorted(task.title for task in tasks[21:]))
+        self.assertEqual([table.title(task.id) for task in tasks[21:]], [task.title for task in tasks[21:]])
+    
+    def test_update_adds_unknown_task(self):
+        """Test that updating a task the table does not hold adds it, as TaskIndex does."""
+        table = TaskTable([Task("Kept")])
+        task = Task("Late arrival", status=TaskStatus.COMPLETED)
+        table.update(copy.copy(task), task)
+        
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(table.query(status=TaskStatus.COMPLETED)), [task])
+        self.assertEqual(table.title(task.id), "Late arrival")
+    
+    def test_manager_uses_table(self):
+        """Test that a columnar manager answers through the same API."""
+        manager = TaskManager(MemoryStorage(), columnar=True)
+        high = manager.add_task("High", priority=TaskPriority.HIGH, due_date="2000-01-01")
+        low = manager.add_task("Low", priority=TaskPriority.LOW)
+        manager.update_task(low.id, status=TaskStatus.COMPLETED)
+        
+        self.assertEqual(manager.list_tasks(sort_by="priority"), [high, low])
+        self.assertIsInstance(manager._query_index, TaskTable)
+        self.assertEqual(manager.list_tasks(status=TaskStatus.COMPLETED), [low])
+        stats = manager.get_statistics()
+        self.assertEqual((stats["total"], stats["completed"], stats["overdue"]), (2, 1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Unit tests for CSV and NDJSON import and export.
+"""
+
+import os
+import tempfile
+import unittest
+from storage import NDJSONStorage
+from task import Task, TaskStatus, TaskPriority
+from task_manager import TaskManager
+from transfer import read_tasks, write_tasks
+
+
+class TestTransfer(unittest.TestCase):
+    """Test cases for the transfer module and TaskManager.import_tasks."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tasks = [
+            Task("Plain"),
+            Task("Full, with \"quotes\"", "Line one\nline two", TaskStatus.COMPLETED,
+                 TaskPriority.HIGH, due_date="2030-01-01"),
+        ]
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def path(self, name):
+        """Get the path of a file in the temporary directory."""
+        return os.path.join(self.temp_dir.name, name)
+    
+    def test_round_trip(self):
+        """Test that both formats preserve every field."""
+        for name in ["tasks.csv", "tasks.ndjson"]:
+            self.assertEqual(write_tasks(self.path(name), self.tasks), 2)
+            self.assertEqual([t.to_dict() for t in read_tasks(self.path(name))],
+                             [t.to_dict() for t in self.tasks], name)
+    
+    def test_defaults_and_errors(self):
+        """Test that only title is required and bad records report their line."""
+        with open(self.path("tasks.csv"), "w") as f:
+            f.write("title,priority,extra\nMinimal,,ignored\n,high,\n")
+        tasks = read_tasks(self.path("tasks.csv"))
+        task = next(tasks)
+        self.assertEqual((task.title, task.status, task.priority),
+                         ("Minimal", TaskStatus.PENDING, TaskPriority.MEDIUM))
+        with self.assertRaisesRegex(ValueError, "tasks.csv:3: missing title"):
+            next(tasks)
+        with self.assertRaises(ValueError):
+            list(read_tasks(self.path("tasks.txt")))
+    
+    def test_import_in_chunks(self):
+        """Test that an import saves once per chunk and replaces known IDs."""
+        storage = NDJSONStorage(self.path("store.ndjson"))
+        manager = TaskManager(storage)
+        existing = manager.add_task("Old title")
+        batches = []
+        original = storage.write_batch
+        storage.write_batch = lambda changes: (batches.append(len(changes)), original(changes))
+        
+        incoming = [Task(f"Task {i}") for i in range(5)] + [Task("New title", task_id=existing.id)]
+        self.assertEqual(list(manager.import_tasks(incoming, chunk_size=4)), [4, 2])
+        self.assertEqual(batches, [4, 2])
+        with self.assertRaises(ValueError):
+            manager.import_tasks(incoming, chunk_size=0)
+        self.assertEqual(len(manager.tasks), 6)
+        self.assertIs(manager.get_task(existing.id), existing)
+        self.assertEqual(existing.title, "New title")
+        
+        storage.close()
+        reloaded = TaskManager(NDJSONStorage(self.path("store.ndjson")))
+        self.assertEqual(reloaded.get_task(existing.id).title, "New title")
+        reloaded.storage.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
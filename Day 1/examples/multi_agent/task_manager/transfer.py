@@ -0,0 +1,114 @@
+"""
+Streaming import and export of tasks as CSV or NDJSON files.
+"""
+
+import csv
+import json
+import os
+from typing import Iterable, Iterator, Optional
+from task import Task
+
+FORMATS = ("csv", "ndjson")
+
+# Columns of the CSV format, matching the keys of Task.to_dict
+FIELDS = ("id", "title", "description", "status", "priority", "due_date", "created_at", "updated_at")
+
+
+def detect_format(path: str, file_format: Optional[str] = None) -> str:
+    """
+    Determine the format of a task file.
+    
+    Args:
+        path: File path; ".csv" means CSV, ".ndjson" or ".jsonl" NDJSON
+        file_format: Explicit format, overriding the extension
+    
+    Returns:
+        "csv" or "ndjson"
+    
+    Raises:
+        ValueError: If the format is unknown or cannot be told from the extension
+    """
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        file_format = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}.get(extension)
+        if file_format is None:
+            raise ValueError(f"Cannot tell the format of {path}; use format={'|'.join(FORMATS)}")
+    if file_format not in FORMATS:
+        raise ValueError(f"Unknown format: {file_format} (expected {' or '.join(FORMATS)})")
+    return file_format
+
+
+def read_tasks(path: str, file_format: Optional[str] = None) -> Iterator[Task]:
+    """
+    Stream tasks from a CSV or NDJSON file, one record at a time.
+    
+    Records use the fields of Task.to_dict; only title is required, and
+    missing or empty fields take their defaults (a new ID, pending,
+    medium priority, created now). Unknown fields are ignored.
+    
+    Args:
+        path: File to read
+        file_format: "csv" or "ndjson" (detected from the extension if omitted)
+    
+    Returns:
+        Iterator of Task objects
+    
+    Raises:
+        ValueError: If the format is unknown, or a record is malformed
+            (the message gives its line number)
+    """
+    file_format = detect_format(path, file_format)
+    with open(path, newline="" if file_format == "csv" else None, encoding="utf-8") as f:
+        if file_format == "csv":
+            reader = csv.DictReader(f)
+            records = ((reader.line_num, row) for row in reader)
+        else:
+            records = ((number, line) for number, line in enumerate(f, 1) if line.strip())
+        for line, record in records:
+            try:
+                if file_format == "ndjson":
+                    record = json.loads(record)
+                    if not isinstance(record, dict):
+                        raise ValueError("expected a JSON object")
+                yield _to_task(record)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line}: {e}") from e
+
+
+def _to_task(record: dict) -> Task:
+    """Build a task from an imported record."""
+    fields = {field: record.get(field) for field in FIELDS if record.get(field) not in (None, "")}
+    if "title" not in fields:
+        raise ValueError("missing title")
+    return Task.from_dict(fields)
+
+
+def write_tasks(path: str, tasks: Iterable[Task], file_format: Optional[str] = None) -> int:
+    """
+    Stream tasks to a CSV or NDJSON file, one record at a time.
+    
+    Args:
+        path: File to write (replaced if it exists)
+        tasks: Tasks to write
+        file_format: "csv" or "ndjson" (detected from the extension if omitted)
+    
+    Returns:
+        Number of tasks written
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    file_format = detect_format(path, file_format)
+    count = 0
+    with open(path, "w", newline="" if file_format == "csv" else None, encoding="utf-8") as f:
+        if file_format == "csv":
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            for task in tasks:
+                writer.writerow(["" if value is None else value for value in task.to_dict().values()])
+                count += 1
+        else:
+            for task in tasks:
+                f.write(json.dumps(task.to_dict(), ensure_ascii=False) + "\n")
+                count += 1
+    return count
@@ -0,0 +1,125 @@
+"""
+Benchmark upstream call latency: a new connection per call versus the pooled client.
+
+A local HTTP/1.1 server stands in for AccuWeather, answering every request
+with a small forecast-sized JSON body. On localhost, connecting is nearly
+free, so the server waits ``--handshake-ms`` on each new connection to
+stand for the TCP and TLS round trips to a real API host; requests on a
+kept-alive connection skip that wait, as they skip the handshakes.
+
+Calls are made one after another, then from several threads at once (as
+concurrent tool calls do), once with ``requests.get`` (what the tools
+used to call) and once through the shared HTTPClient.
+
+Usage (from the travel_mcp_server directory):
+    python -m benchmarks.bench_http --calls 200 --handshake-ms 30
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from tools.http_client import HTTPClient
+
+
+BODY = json.dumps({
+    "DailyForecasts": [
+        {"Temperature": {"Minimum": {"Value": 12.0}, "Maximum": {"Value": 21.0}},
+         "Day": {"IconPhrase": "Partly sunny"}}
+    ] * 5
+}).encode()
+
+
+def make_server(handshake: float) -> ThreadingHTTPServer:
+    """Start the stand-in API server on a free port, in a background thread."""
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are sent in separate writes; without this, Nagle's
+        # algorithm holds the body back until the client's delayed ACK
+        disable_nagle_algorithm = True
+        
+        def setup(self):
+            super().setup()
+            self.server.connections += 1
+            time.sleep(handshake)
+        
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(BODY)))
+            self.end_headers()
+            self.wfile.write(BODY)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.connections = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed_call(get, url: str) -> float:
+    """Make one call and return its latency in seconds."""
+    start = time.perf_counter()
+    response = get(url, params={"apikey": "benchmark", "metric": "true"})
+    response.raise_for_status()
+    response.json()
+    return time.perf_counter() - start
+
+
+def measure(server: ThreadingHTTPServer, get, calls: int, threads: int) -> dict:
+    """Time calls made sequentially, then concurrently."""
+    url = f"http://127.0.0.1:{server.server_address[1]}/forecasts/v1/daily/5day/123"
+    results = {}
+    
+    server.connections = 0
+    latencies = [timed_call(get, url) for _ in range(calls)]
+    results["sequential"] = (latencies, server.connections)
+    
+    server.connections = 0
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        latencies = list(pool.map(lambda _: timed_call(get, url), range(calls)))
+    results[f"{threads} threads"] = (latencies, server.connections)
+    return results
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200, help="calls per measurement")
+    parser.add_argument("--handshake-ms", type=float, default=30.0,
+                        help="simulated connection setup time per new connection")
+    parser.add_argument("--threads", type=int, default=8, help="concurrent callers")
+    args = parser.parse_args()
+    
+    server = make_server(args.handshake_ms / 1000)
+    unpooled = lambda url, params: requests.get(url, params=params, timeout=10)
+    client = HTTPClient(pool_per_host=args.threads)
+    results = {
+        "unpooled": measure(server, unpooled, args.calls, args.threads),
+        "pooled": measure(server, client.get, args.calls, args.threads),
+    }
+    client.close()
+    server.shutdown()
+    
+    print(f"\n{args.calls} calls per run, {args.handshake_ms:g} ms simulated handshake")
+    print(f"{'run':<24}{'p50':>10}{'p95':>10}{'total':>11}{'connections':>13}")
+    for name, runs in results.items():
+        for run, (latencies, connections) in runs.items():
+            latencies = sorted(latencies)
+            p50 = statistics.median(latencies)
+            p95 = latencies[int(len(latencies) * 0.95) - 1]
+            print(f"{name + ', ' + run:<24}{p50 * 1000:>8.2f}ms{p95 * 1000:>8.2f}ms"
+                  f"{sum(latencies) * 1000:>9.0f}ms{connections:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,17 @@ Travel MCP Server
 Provides travel-related tools via Model Context Protocol (MCP).
 """
 
+import sys
 import json
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
 
 try:
-    from tools.weather import get_weather_forecast
+    from tools.weather import get_weather_forecast, get_weather_forecasts, get_cache_stats, set_upstream_concurrency
     WEATHER_TOOL_AVAILABLE = True
 except ImportError as e:
     WEATHER_TOOL_AVAILABLE = False
@@ -26,6 +29,83 @@ except ImportError as e:
 
 server = Server("travel-mcp-server")
 
+# The tools are synchronous and wait on upstream APIs, so they run in a
+# bounded pool of worker threads: while one call waits, the event loop keeps
+# serving other requests. Each tool also has its own limit on calls in
+# flight, so a burst of one kind cannot take every worker or exceed the
+# upstream API's rate limits. Both are set in .env or the environment.
+DEFAULT_TOOL_WORKERS = 8
+TOOL_CONCURRENCY_SETTINGS = {
+    "get_weather_forecast": ("TRAVEL_WEATHER_CONCURRENCY", 4),
+    "get_weather_forecasts": ("TRAVEL_WEATHER_BATCH_CONCURRENCY", 2),
+    "search_flights": ("TRAVEL_FLIGHTS_CONCURRENCY", 4),
+}
+
+
+def read_tool_settings() -> tuple[int, dict[str, int]]:
+    """
+    Read the worker pool size and per-tool limits from the environment.
+    
+    Returns:
+        The number of workers, and each tool's limit on calls in flight
+    
+    Raises:
+        ValueError: If a variable is not a positive whole number, naming it
+        ImportError: If the tools (and so their settings helpers) are unavailable
+    """
+    from tools.http_client import env_number
+    
+    workers = env_number("TRAVEL_TOOL_WORKERS", DEFAULT_TOOL_WORKERS, int)
+    concurrency = {
+        name: env_number(variable, default, int)
+        for name, (variable, default) in TOOL_CONCURRENCY_SETTINGS.items()
+    }
+    return workers, concurrency
+
+
+# Invalid settings fall back to the defaults here, so importing the server
+# never fails; main() refuses to start with them
+TOOL_SETTINGS_ERROR = None
+try:
+    TOOL_WORKERS, TOOL_CONCURRENCY = read_tool_settings()
+except (ImportError, ValueError) as e:
+    TOOL_WORKERS = DEFAULT_TOOL_WORKERS
+    TOOL_CONCURRENCY = {name: default for name, (_, default) in TOOL_CONCURRENCY_SETTINGS.items()}
+    if isinstance(e, ValueError):
+        TOOL_SETTINGS_ERROR = e
+if WEATHER_TOOL_AVAILABLE:
+    # A batch fans out to several AccuWeather requests; both weather tools
+    # share one cap on requests in flight, not just on calls
+    set_upstream_concurrency(TOOL_CONCURRENCY["get_weather_forecast"])
+tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="tool")
+_tool_limits: dict[str, asyncio.Semaphore] = {}
+
+
+async def run_tool(name: str, func, *args):
+    """
+    Run a blocking tool function in the worker pool without blocking the event loop.
+    
+    Calls to a tool beyond its TOOL_CONCURRENCY limit wait for one of its
+    running calls to finish.
+    
+    Args:
+        name: Tool name, selecting the concurrency limit
+        func: The tool function
+        *args: Arguments for the function
+    
+    Returns:
+        The function's result
+    
+    Raises:
+        Exception: Whatever the function raises
+    """
+    limit = _tool_limits.get(name)
+    if limit is None:
+        limit = _tool_limits[name] = asyncio.Semaphore(TOOL_CONCURRENCY.get(name, TOOL_WORKERS))
+    async with limit:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(tool_executor, partial(func, *args))
+
 
 @server.list_tools()
 async def list_tools() -> list[types.Tool]:
@@ -68,6 +148,46 @@ async def list_tools() -> list[types.Tool]:
                 }
             )
         )
+        tools.append(
+            types.Tool(
+                name="get_weather_forecasts",
+                description=(
+                    "Get weather forecasts for several travel destinations in one call, e.g. to compare "
+                    "where to go. Returns the same details as get_weather_forecast for each destination, "
+                    "with a status per destination so that one unknown city does not fail the others. "
+                    "Use this tool instead of calling get_weather_forecast repeatedly."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "trips": {
+                            "type": "array",
+                            "description": "Destinations with their travel dates (at most 10).",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "destination": {
+                                        "type": "string",
+                                        "description": "City name (e.g., 'Paris', 'Tokyo, Japan')."
+                                    },
+                                    "travel_dates": {
+                                        "type": "string",
+                                        "description": (
+                                            "Travel date range in format 'YYYY-MM-DD to YYYY-MM-DD', "
+                                            "or a single date in format 'YYYY-MM-DD'."
+                                        )
+                                    }
+                                },
+                                "required": ["destination", "travel_dates"]
+                            },
+                            "minItems": 1,
+                            "maxItems": 10
+                        }
+                    },
+                    "required": ["trips"]
+                }
+            )
+        )
     
     # Add flight search tool if available
     if FLIGHT_TOOL_AVAILABLE:
@@ -164,7 +284,7 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
         
         # Call the tool function with error handling
         try:
-            result = get_weather_forecast(destination, travel_dates)
+            result = await run_tool(name, get_weather_forecast, destination, travel_dates)
             
             # Verify result is JSON-serializable
             try:
@@ -200,6 +320,74 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
                 )
             ]
     
+    # ============================================================================
+    # BATCH WEATHER FORECAST TOOL
+    # ============================================================================
+    elif name == "get_weather_forecasts":
+        # Check if tool is available
+        if not WEATHER_TOOL_AVAILABLE:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "status": "error",
+                        "error_message": "Weather forecast tool is not available. Please check server configuration."
+                    }, indent=2)
+                )
+            ]
+        
+        # Validate required parameters (each trip is checked by the tool)
+        trips = arguments.get("trips")
+        
+        if not isinstance(trips, list) or not trips:
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "status": "error",
+                        "error_message": "Missing required parameter. Please provide 'trips', a list of destinations with travel dates."
+                    }, indent=2)
+                )
+            ]
+        
+        # Call the tool function with error handling
+        try:
+            result = await run_tool(name, get_weather_forecasts, trips)
+            
+            # Verify result is JSON-serializable
+            try:
+                result_json = json.dumps(result, indent=2)
+            except (TypeError, ValueError) as e:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps({
+                            "status": "error",
+                            "error_message": f"Tool returned non-serializable data: {str(e)}"
+                        }, indent=2)
+                    )
+                ]
+            
+            return [
+                types.TextContent(
+                    type="text",
+                    text=result_json
+                )
+            ]
+        
+        except Exception as e:
+            # Catch any unexpected errors from the tool
+            return [
+                types.TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "status": "error",
+                        "error_message": f"Error executing batch weather forecast tool: {str(e)}",
+                        "error_type": type(e).__name__
+                    }, indent=2)
+                )
+            ]
+    
     # ============================================================================
     # FLIGHT SEARCH TOOL
     # ============================================================================
@@ -234,7 +422,7 @@ async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
         
         # Call the tool function with error handling
         try:
-            result = search_flights(origin, destination, departure_date)
+            result = await run_tool(name, search_flights, origin, destination, departure_date)
             
             # Verify result is JSON-serializable
             try:
@@ -308,12 +496,30 @@ async def main():
     
     Runs the server using stdio transport for communication with MCP clients.
     """
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options()
-        )
+    # Report invalid settings now rather than on the first tool call
+    if TOOL_SETTINGS_ERROR is not None:
+        raise SystemExit(f"❌ {TOOL_SETTINGS_ERROR}")
+    if WEATHER_TOOL_AVAILABLE or FLIGHT_TOOL_AVAILABLE:
+        from tools.http_client import get_client
+        try:
+            get_client()
+        except ValueError as e:
+            raise SystemExit(f"❌ {e}")
+    
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    finally:
+        # Calls still waiting upstream have no one left to answer
+        tool_executor.shutdown(wait=False, cancel_futures=True)
+        if WEATHER_TOOL_AVAILABLE:
+            # stdout carries the protocol, so the summary goes to stderr
+            for name, stats in get_cache_stats().items():
+                print(f"📊 Weather cache ({name}): {stats}", file=sys.stderr)
 
 
 if __name__ == "__main__":
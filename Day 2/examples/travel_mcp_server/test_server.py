@@ -1,7 +1,12 @@
 import asyncio
 import json
+import time
+import os
 from io import StringIO
+from unittest import mock
+import server as server_module
 from server import server
+from tools import weather
 
 
 async def test_list_tools():
@@ -131,6 +136,136 @@ async def test_unknown_tool():
         return False
 
 
+async def test_concurrent_calls():
+    """Test that tool calls made at the same time run concurrently."""
+    print("\n" + "=" * 60)
+    print("TEST 4: Concurrent Tool Calls Overlap")
+    print("=" * 60)
+    
+    # Stand-in for a forecast whose upstream call takes half a second
+    def slow_forecast(destination, travel_dates):
+        time.sleep(0.5)
+        return {"status": "success", "destination": destination}
+    
+    cities = ["Paris", "Tokyo", "London", "Sydney"]
+    original = server_module.get_weather_forecast
+    server_module.get_weather_forecast = slow_forecast
+    try:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            server._call_tool_handler(
+                name="get_weather_forecast",
+                arguments={"destination": city, "travel_dates": "2025-06-15"}
+            )
+            for city in cities
+        ))
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+    finally:
+        server_module.get_weather_forecast = original
+    
+    destinations = sorted(json.loads(result[0].text).get("destination") for result in results)
+    if destinations != sorted(cities):
+        print(f"❌ Wrong results: {destinations}")
+        return False
+    if elapsed < 0.5 * len(cities) * 0.75:
+        print(f"✅ {len(cities)} calls of 0.5s each finished in {elapsed:.2f}s")
+        return True
+    print(f"❌ {len(cities)} calls of 0.5s each took {elapsed:.2f}s; they ran one after another")
+    return False
+
+
+async def test_batch_weather_tool():
+    """Test the batch weather tool's de-duplication and per-destination statuses."""
+    print("\n" + "=" * 60)
+    print("TEST 5: Batch Weather Forecasts")
+    print("=" * 60)
+    
+    # Stand-ins for the AccuWeather calls, each taking 0.2 seconds
+    lookups, fetches = [], []
+    
+    def fake_location_key(city_name):
+        lookups.append(city_name)
+        time.sleep(0.2)
+        if city_name.lower() == "atlantis":
+            return {"status": "error", "error_message": "Location 'Atlantis' not found."}
+        return {"status": "success", "location_key": city_name.lower(), "city_name": city_name, "country": "Test"}
+    
+    def fake_forecast(location_key):
+        fetches.append(location_key)
+        time.sleep(0.2)
+        return {"status": "success", "forecast": {"DailyForecasts": []}}
+    
+    trips = [
+        {"destination": "Paris", "travel_dates": "2025-06-15 to 2025-06-22"},
+        {"destination": "Tokyo", "travel_dates": "2025-06-15 to 2025-06-22"},
+        {"destination": "paris", "travel_dates": "2025-09-01"},
+        {"destination": "Atlantis", "travel_dates": "2025-06-15"},
+        {"destination": "Rome"}
+    ]
+    originals = weather.get_location_key, weather.get_forecast
+    weather.get_location_key, weather.get_forecast = fake_location_key, fake_forecast
+    try:
+        start = time.perf_counter()
+        result = await server._call_tool_handler(name="get_weather_forecasts", arguments={"trips": trips})
+        elapsed = time.perf_counter() - start
+        result_data = json.loads(result[0].text)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        return False
+    finally:
+        weather.get_location_key, weather.get_forecast = originals
+    
+    statuses = [entry["status"] for entry in result_data.get("results", [])]
+    print(f"Status: {result_data.get('status')}, per destination: {statuses}")
+    print(f"Location lookups: {len(lookups)}, forecast requests: {len(fetches)}, time: {elapsed:.2f}s")
+    if statuses != ["success", "success", "success", "error", "error"] or result_data.get("status") != "partial":
+        print("❌ Unexpected statuses")
+        return False
+    if len(lookups) != 3 or len(fetches) != 2:
+        print("❌ Repeated destinations were fetched more than once")
+        return False
+    if elapsed >= 0.2 * (len(lookups) + len(fetches)) * 0.75:
+        print("❌ Destinations were fetched one after another")
+        return False
+    print("✅ Batch fetched each destination once, concurrently, with per-destination statuses")
+    return True
+
+async def test_tool_settings():
+    """Test that invalid worker and concurrency settings are reported, naming the variable."""
+    print("\n" + "=" * 60)
+    print("TEST 6: Tool Settings Validation")
+    print("=" * 60)
+    
+    cases = [
+        ("TRAVEL_TOOL_WORKERS", "0"),
+        ("TRAVEL_WEATHER_CONCURRENCY", "abc"),
+        ("TRAVEL_FLIGHTS_CONCURRENCY", "-2"),
+    ]
+    passed = True
+    for name, value in cases:
+        with mock.patch.dict(os.environ, {name: value}):
+            try:
+                server_module.read_tool_settings()
+            except ValueError as e:
+                if name in str(e):
+                    print(f"✅ {name}={value!r} rejected: {e}")
+                    continue
+                print(f"❌ {name}={value!r} rejected without naming the variable: {e}")
+            else:
+                print(f"❌ {name}={value!r} was accepted")
+            passed = False
+    
+    with mock.patch.dict(os.environ, {"TRAVEL_TOOL_WORKERS": "3", "TRAVEL_WEATHER_CONCURRENCY": ""}):
+        workers, concurrency = server_module.read_tool_settings()
+    if workers != 3 or concurrency["get_weather_forecast"] != 4:
+        print(f"❌ Valid settings read as {workers} workers, limits {concurrency}")
+        passed = False
+    return passed
+
+
 async def main():
     """Run all tests."""
     print("\n" + "🧪 " * 20)
@@ -143,6 +278,9 @@ async def main():
     results.append(await test_list_tools())
     results.append(await test_weather_tool())
     results.append(await test_unknown_tool())
+    results.append(await test_concurrent_calls())
+    results.append(await test_batch_weather_tool())
+    results.append(await test_tool_settings())
     
     # Summary
     print("\n" + "=" * 60)
@@ -0,0 +1,180 @@
+"""
+Unit tests for the persistent TTL cache.
+"""
+
+import os
+import tempfile
+import threading
+import time
+import unittest
+from tools.cache import TTLCache, normalize_name
+
+
+class TestNormalizeName(unittest.TestCase):
+    """Test cases for normalize_name."""
+    
+    def test_equivalent_spellings_share_a_key(self):
+        """Test that case, spacing and accent encoding are ignored."""
+        self.assertEqual(normalize_name("  paris ,France"), "paris, france")
+        self.assertEqual(normalize_name("PARIS,   FRANCE"), normalize_name("Paris, France"))
+        self.assertEqual(normalize_name("Z\u00fcrich"), normalize_name("Zu\u0308rich"))
+        self.assertNotEqual(normalize_name("Paris"), normalize_name("Paris, Texas"))
+
+
+class TestTTLCache(unittest.TestCase):
+    """Test cases for TTLCache."""
+    
+    def setUp(self):
+        """Set up a cache backed by a temporary SQLite file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "cache.sqlite3")
+        self.cache = TTLCache("test", ttl=60, path=self.path)
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def test_hits_and_misses_are_counted(self):
+        """Test that lookups update the counters reported by stats."""
+        self.assertIsNone(self.cache.get("paris"))
+        self.cache.set("paris", {"location_key": "623"})
+        self.assertEqual(self.cache.get("paris"), {"location_key": "623"})
+        self.assertEqual(self.cache.get("paris"), {"location_key": "623"})
+        
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertEqual(stats["hit_rate"], 0.667)
+        self.assertEqual(stats["memory_entries"], 1)
+    
+    def test_expired_entries_are_misses(self):
+        """Test that an entry is not returned past its TTL, in memory or on disk."""
+        self.cache.set("paris", "old", ttl=0)
+        self.assertIsNone(self.cache.get("paris"))
+        self.assertIsNone(TTLCache("test", ttl=60, path=self.path).get("paris"))
+        self.assertEqual(self.cache.misses, 1)
+    
+    def test_least_recently_used_entry_is_evicted_from_memory(self):
+        """Test that memory holds at most maxsize entries, keeping the recently used ones."""
+        cache = TTLCache("test", ttl=60, maxsize=2, path=":memory:")
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertEqual((cache.get("a"), cache.get("b"), cache.get("c")), (1, None, 3))
+    
+    def test_evicted_entries_are_reloaded_from_disk(self):
+        """Test that entries evicted from memory are still served from SQLite."""
+        cache = TTLCache("test", ttl=60, maxsize=1, path=self.path)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.misses, 0)
+    
+    def test_entries_survive_a_restart(self):
+        """Test that a new cache on the same file sees stored entries, per namespace."""
+        self.cache.set("paris", {"location_key": "623"})
+        self.cache.set("rome", "short", ttl=0)
+        
+        reopened = TTLCache("test", ttl=60, path=self.path)
+        self.assertEqual(reopened.get("paris"), {"location_key": "623"})
+        self.assertIsNone(reopened.get("rome"))
+        self.assertIsNone(TTLCache("other", ttl=60, path=self.path).get("paris"))
+    
+    def test_clear_removes_entries_everywhere(self):
+        """Test that clear empties memory and this namespace on disk."""
+        self.cache.set("paris", 1)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("paris"))
+        self.assertIsNone(TTLCache("test", ttl=60, path=self.path).get("paris"))
+    
+    def test_disk_holds_at_most_max_disk_entries(self):
+        """Test that new keys past the cap evict expired, then least recently stored, entries."""
+        cache = TTLCache("test", ttl=60, maxsize=1, path=self.path, max_disk_entries=3)
+        cache.set("dead", 0, ttl=0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("dead", 0, ttl=0)  # Updating an existing key evicts nothing
+        cache.set("c", 3)
+        cache.set("a", 10)
+        
+        reopened = TTLCache("test", ttl=60, maxsize=1, path=self.path, max_disk_entries=3)
+        self.assertEqual([reopened.get(key) for key in ("a", "b", "c")], [10, 2, 3])
+        reopened.set("d", 4)
+        self.assertEqual([reopened.get(key) for key in ("a", "b", "c", "d")], [10, None, 3, 4])
+    
+    def test_unusable_file_falls_back_to_memory(self):
+        """Test that a cache whose file cannot be opened keeps working in memory."""
+        cache = TTLCache("test", ttl=60, path=os.path.join(self.temp_dir.name, "missing", "cache.sqlite3"))
+        cache.set("paris", 1)
+        self.assertEqual(cache.get("paris"), 1)
+        self.assertEqual(cache.path, ":memory:")
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Test cases for get_stale and refresh."""
+    
+    def setUp(self):
+        """Set up a cache holding one entry past its TTL but within its stale TTL."""
+        self.cache = TTLCache("test", ttl=60, stale_ttl=600, path=":memory:")
+        self.cache.set("paris", "old", ttl=0)
+    
+    def wait_for_refreshes(self):
+        """Wait until no background refresh is running."""
+        deadline = time.monotonic() + 5
+        while self.cache._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(self.cache._refreshing)
+    
+    def test_stale_entry_is_served_only_by_get_stale(self):
+        """Test that a stale entry is returned as not fresh, and get ignores it."""
+        self.assertEqual(self.cache.get_stale("paris"), ("old", False))
+        self.assertIsNone(self.cache.get("paris"))
+        self.assertEqual(self.cache.get_stale("rome"), (None, False))
+        
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["stale_hits"], stats["misses"]), (0, 1, 2))
+    
+    def test_entries_past_the_stale_ttl_are_dropped(self):
+        """Test that an entry is not served once its stale TTL is over too."""
+        cache = TTLCache("test", ttl=60, stale_ttl=0, path=":memory:")
+        cache.set("paris", "old", ttl=0)
+        self.assertEqual(cache.get_stale("paris"), (None, False))
+    
+    def test_one_refresh_per_key_at_a_time(self):
+        """Test that a refresh requested while one is running is not started."""
+        release = threading.Event()
+        fetches = []
+        
+        def fetch():
+            fetches.append(1)
+            release.wait(5)
+            return "new", None
+        
+        self.assertTrue(self.cache.refresh("paris", fetch))
+        self.assertFalse(self.cache.refresh("paris", fetch))
+        self.assertEqual(self.cache.get_stale("paris"), ("old", False))
+        release.set()
+        self.wait_for_refreshes()
+        
+        self.assertEqual(len(fetches), 1)
+        self.assertEqual(self.cache.get_stale("paris"), ("new", True))
+    
+    def test_failed_refresh_keeps_the_stale_entry(self):
+        """Test that a refresh returning None or raising leaves the entry in place."""
+        self.cache.refresh("paris", lambda: None)
+        self.wait_for_refreshes()
+        self.assertEqual(self.cache.get_stale("paris"), ("old", False))
+        
+        def failing():
+            raise RuntimeError("upstream down")
+        
+        self.assertTrue(self.cache.refresh("paris", failing))
+        self.wait_for_refreshes()
+        self.assertEqual(self.cache.get_stale("paris"), ("old", False))
+        self.assertTrue(self.cache.refresh("paris", lambda: ("new", 60)))
+        self.wait_for_refreshes()
+        self.assertEqual(self.cache.get("paris"), "new")
+
+
+if __name__ == '__main__':
+    unittest.main()
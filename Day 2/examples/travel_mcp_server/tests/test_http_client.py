@@ -0,0 +1,100 @@
+"""
+Unit tests for the shared pooled HTTP client.
+"""
+
+import os
+import unittest
+from unittest import mock
+from tools import http_client
+from tools.http_client import HTTPClient
+
+
+class TestHTTPClient(unittest.TestCase):
+    """Test cases for HTTPClient."""
+    
+    def test_pool_settings_reach_the_adapter(self):
+        """Test that pool sizes and blocking configure the mounted adapters."""
+        client = HTTPClient(pool_hosts=3, pool_per_host=7, pool_block=True)
+        for url in ("http://example.com", "https://example.com"):
+            adapter = client.session.get_adapter(url)
+            self.assertEqual((adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block),
+                             (3, 7, True))
+        self.assertEqual(client.session.headers["Connection"], "keep-alive")
+        client.close()
+    
+    def test_keep_alive_can_be_turned_off(self):
+        """Test that without keep-alive every request asks to close its connection."""
+        client = HTTPClient(keep_alive=False)
+        self.assertEqual(client.session.headers["Connection"], "close")
+        client.close()
+    
+    def test_invalid_settings_are_rejected(self):
+        """Test that pool sizes below one and non-positive timeouts raise ValueError."""
+        for settings in ({"pool_hosts": 0}, {"pool_per_host": 0}, {"connect_timeout": 0},
+                         {"read_timeout": -1}):
+            with self.subTest(settings=settings), self.assertRaises(ValueError):
+                HTTPClient(**settings)
+    
+    def test_get_uses_split_timeouts(self):
+        """Test that requests carry the (connect, read) timeouts unless overridden."""
+        client = HTTPClient(connect_timeout=2, read_timeout=8)
+        with mock.patch.object(client.session, "get") as get:
+            client.get("https://example.com/api", params={"q": "Paris"})
+            get.assert_called_once_with("https://example.com/api", params={"q": "Paris"}, timeout=(2, 8))
+            client.get("https://example.com/api", timeout=1)
+            self.assertEqual(get.call_args.kwargs["timeout"], 1)
+        client.close()
+
+
+class TestFromEnv(unittest.TestCase):
+    """Test cases for HTTPClient.from_env and the shared client."""
+    
+    def from_env(self, **variables) -> HTTPClient:
+        """Create a client with only the given TRAVEL_HTTP_* variables set."""
+        environ = {name: value for name, value in os.environ.items() if not name.startswith("TRAVEL_HTTP_")}
+        environ.update(variables)
+        with mock.patch.dict(os.environ, environ, clear=True):
+            client = HTTPClient.from_env()
+        self.addCleanup(client.close)
+        return client
+    
+    def test_defaults(self):
+        """Test that unset or empty variables keep the defaults."""
+        client = self.from_env(TRAVEL_HTTP_READ_TIMEOUT="")
+        self.assertEqual((client.pool_hosts, client.pool_per_host), (10, 10))
+        self.assertEqual((client.pool_block, client.keep_alive), (False, True))
+        self.assertEqual(client.timeout, (3.05, 10.0))
+    
+    def test_variables_are_parsed(self):
+        """Test that every variable is read, with flags in any common spelling."""
+        client = self.from_env(TRAVEL_HTTP_POOL_HOSTS="2", TRAVEL_HTTP_POOL_PER_HOST=" 4 ",
+                               TRAVEL_HTTP_POOL_BLOCK="yes", TRAVEL_HTTP_KEEP_ALIVE="Off",
+                               TRAVEL_HTTP_CONNECT_TIMEOUT="1.5", TRAVEL_HTTP_READ_TIMEOUT="20")
+        self.assertEqual((client.pool_hosts, client.pool_per_host), (2, 4))
+        self.assertEqual((client.pool_block, client.keep_alive), (True, False))
+        self.assertEqual(client.timeout, (1.5, 20.0))
+    
+    def test_invalid_values_name_the_variable(self):
+        """Test that a malformed or non-positive value raises ValueError saying which variable."""
+        for name, value in (("TRAVEL_HTTP_POOL_HOSTS", "abc"), ("TRAVEL_HTTP_POOL_PER_HOST", "2.5"),
+                            ("TRAVEL_HTTP_POOL_PER_HOST", "0"), ("TRAVEL_HTTP_CONNECT_TIMEOUT", "-1"),
+                            ("TRAVEL_HTTP_READ_TIMEOUT", "nan"), ("TRAVEL_HTTP_KEEP_ALIVE", "maybe")):
+            with self.subTest(name=name, value=value):
+                with self.assertRaisesRegex(ValueError, name):
+                    self.from_env(**{name: value})
+    
+    def test_configure_replaces_the_shared_client(self):
+        """Test that configure installs a new client and closes the previous one."""
+        with mock.patch.object(http_client, "_client", None):
+            first = http_client.configure(pool_per_host=2)
+            self.assertIs(http_client.get_client(), first)
+            with mock.patch.object(first, "close") as close:
+                second = http_client.configure(read_timeout=5)
+                close.assert_called_once_with()
+            self.assertIs(http_client.get_client(), second)
+            self.assertEqual(second.timeout, (http_client.DEFAULT_CONNECT_TIMEOUT, 5))
+            second.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
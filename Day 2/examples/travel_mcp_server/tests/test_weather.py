@@ -0,0 +1,244 @@
+"""
+Unit tests for the weather tool's cached AccuWeather lookups.
+"""
+
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+import requests
+from tools import weather
+from tools.cache import TTLCache
+
+
+class FakeResponse:
+    """Response with a status code, a JSON body and headers."""
+    
+    def __init__(self, status_code=200, body=None, headers=None):
+        self.status_code = status_code
+        self._body = body
+        self.headers = headers or {}
+    
+    def json(self):
+        return self._body
+
+
+class FakeClient:
+    """HTTP client answering with queued responses (or raising queued exceptions)."""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+        # Set to an Event to hold calls until it is set
+        self.gate = None
+    
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        if self.gate is not None:
+            self.gate.wait(5)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+FORECAST = {"DailyForecasts": [{"Date": "2025-06-15T07:00:00+02:00"}]}
+
+PARIS = [{"Key": "623", "LocalizedName": "Paris", "Country": {"LocalizedName": "France"},
+          "AdministrativeArea": {"LocalizedName": "Ile-de-France"}}]
+
+
+class WeatherTestCase(unittest.TestCase):
+    """Base for tests that run the weather tool against a fake client and empty caches."""
+    
+    def setUp(self):
+        """Replace the API key, the HTTP client and the caches."""
+        self.client = FakeClient()
+        patches = [
+            mock.patch.object(weather, "ACCUWEATHER_API_KEY", "test-key"),
+            mock.patch.object(weather, "get_client", lambda: self.client),
+            mock.patch.object(weather, "LOCATION_CACHE",
+                              TTLCache("location_keys", ttl=weather.LOCATION_KEY_TTL, path=":memory:")),
+            mock.patch.object(weather, "FORECAST_CACHE",
+                              TTLCache("forecasts", ttl=weather.FORECAST_TTL,
+                                       stale_ttl=weather.FORECAST_STALE_TTL, path=":memory:")),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+    
+    def respond(self, *responses):
+        """Queue responses for the next API calls."""
+        self.client.responses.extend(responses)
+
+
+class TestLocationLookup(WeatherTestCase):
+    """Test cases for get_location_key and its cache."""
+    
+    def test_equivalent_names_share_one_api_call(self):
+        """Test that a normalized repeat of a city is served from the cache."""
+        self.respond(FakeResponse(body=PARIS))
+        first = weather.get_location_key("Paris, France")
+        second = weather.get_location_key("  paris ,FRANCE ")
+        
+        self.assertEqual(first["location_key"], "623")
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.client.calls), 1)
+        self.assertEqual(self.client.calls[0][1]["q"], "Paris, France")
+        self.assertEqual(weather.get_cache_stats()["location_keys"]["hits"], 1)
+    
+    def test_errors_are_not_cached(self):
+        """Test that failed lookups are retried on the next call."""
+        self.respond(FakeResponse(503), requests.exceptions.Timeout(), FakeResponse(body=PARIS))
+        self.assertEqual(weather.get_location_key("Paris")["status"], "error")
+        self.assertEqual(weather.get_location_key("Paris")["status"], "error")
+        self.assertEqual(weather.get_location_key("Paris")["status"], "success")
+        self.assertEqual(len(self.client.calls), 3)
+    
+    def test_unknown_city_is_cached_briefly(self):
+        """Test that a city AccuWeather does not know is remembered for a day, not a month."""
+        self.respond(FakeResponse(body=[]))
+        with mock.patch.object(weather.LOCATION_CACHE, "set", wraps=weather.LOCATION_CACHE.set) as cache_set:
+            self.assertEqual(weather.get_location_key("Atlantis")["status"], "error")
+        self.assertEqual(cache_set.call_args.kwargs["ttl"], weather.LOCATION_NOT_FOUND_TTL)
+        self.assertEqual(weather.get_location_key("atlantis")["status"], "error")
+        self.assertEqual(len(self.client.calls), 1)
+
+
+class TestForecastCache(WeatherTestCase):
+    """Test cases for get_forecast's stale-while-revalidate cache."""
+    
+    def wait_for_refreshes(self):
+        """Wait until no background refresh is running."""
+        deadline = time.monotonic() + 5
+        while weather.FORECAST_CACHE._refreshing and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(weather.FORECAST_CACHE._refreshing)
+    
+    def cached_ttl(self, headers):
+        """TTL get_forecast caches a forecast with, given its response headers."""
+        self.respond(FakeResponse(body=FORECAST, headers=headers))
+        with mock.patch.object(weather.FORECAST_CACHE, "set") as cache_set:
+            result = weather.get_forecast("623")
+        self.assertNotIn("max_age", result)
+        return cache_set.call_args.args[2]
+    
+    def test_fresh_forecast_makes_no_call(self):
+        """Test that a cached forecast within its TTL is served without the network."""
+        self.respond(FakeResponse(body=FORECAST))
+        first = weather.get_forecast("623")
+        self.assertEqual(weather.get_forecast("623"), first)
+        self.assertEqual(first["forecast"], FORECAST)
+        self.assertEqual(len(self.client.calls), 1)
+    
+    def test_stale_forecast_is_served_while_one_refresh_runs(self):
+        """Test that an expired forecast is returned at once and refreshed once in the background."""
+        weather.FORECAST_CACHE.set("623", {"status": "success", "forecast": {"old": True}}, ttl=0)
+        self.client.gate = threading.Event()
+        self.respond(FakeResponse(body=FORECAST))
+        
+        self.assertEqual(weather.get_forecast("623")["forecast"], {"old": True})
+        self.assertEqual(weather.get_forecast("623")["forecast"], {"old": True})
+        self.client.gate.set()
+        self.wait_for_refreshes()
+        
+        self.assertEqual(len(self.client.calls), 1)
+        self.assertEqual(weather.get_forecast("623")["forecast"], FORECAST)
+        self.assertEqual(weather.get_cache_stats()["forecasts"]["stale_hits"], 2)
+    
+    def test_failed_refresh_keeps_the_stale_forecast(self):
+        """Test that an upstream error during a refresh does not replace the cached forecast."""
+        weather.FORECAST_CACHE.set("623", {"status": "success", "forecast": {"old": True}}, ttl=0)
+        self.respond(FakeResponse(503))
+        self.assertEqual(weather.get_forecast("623")["forecast"], {"old": True})
+        self.wait_for_refreshes()
+        
+        self.assertEqual(weather.FORECAST_CACHE.get_stale("623")[0]["forecast"], {"old": True})
+        self.assertEqual(len(self.client.calls), 1)
+    
+    def test_errors_are_not_cached(self):
+        """Test that a failed fetch is retried on the next call."""
+        self.respond(FakeResponse(503), requests.exceptions.ConnectionError(), FakeResponse(body=FORECAST))
+        self.assertEqual(weather.get_forecast("623")["status"], "error")
+        self.assertEqual(weather.get_forecast("623")["status"], "error")
+        self.assertEqual(weather.get_forecast("623")["status"], "success")
+        self.assertEqual(len(self.client.calls), 3)
+    
+    def test_ttl_follows_cache_headers_within_bounds(self):
+        """Test that max-age or Expires sets the TTL, clamped between the bounds."""
+        self.assertEqual(self.cached_ttl({"Cache-Control": "public, max-age=1800"}), 1800)
+        self.assertEqual(self.cached_ttl({"Cache-Control": "max-age=60"}), weather.FORECAST_MIN_TTL)
+        self.assertEqual(self.cached_ttl({"Cache-Control": "max-age=999999"}), weather.FORECAST_MAX_TTL)
+        self.assertEqual(self.cached_ttl({}), weather.FORECAST_TTL)
+        self.assertEqual(self.cached_ttl({"Expires": "not a date"}), weather.FORECAST_TTL)
+        
+        expires = format_datetime(datetime.now(timezone.utc) + timedelta(hours=2), usegmt=True)
+        self.assertAlmostEqual(self.cached_ttl({"Expires": expires}), 7200, delta=5)
+        past = format_datetime(datetime.now(timezone.utc) - timedelta(hours=1), usegmt=True)
+        self.assertEqual(self.cached_ttl({"Expires": past}), weather.FORECAST_MIN_TTL)
+        # max-age takes precedence over Expires
+        self.assertEqual(self.cached_ttl({"Cache-Control": "max-age=900", "Expires": expires}), 900)
+
+
+class CountingClient:
+    """HTTP client answering every request after a delay, counting those in flight."""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.most_in_flight = 0
+        self.calls = 0
+    
+    def get(self, url, params=None):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        time.sleep(0.05)
+        with self.lock:
+            self.in_flight -= 1
+        if "/locations/" in url:
+            name = params["q"]
+            return FakeResponse(body=[{"Key": name.lower(), "LocalizedName": name,
+                                       "Country": {"LocalizedName": "Test"}}])
+        return FakeResponse(body=FORECAST)
+
+
+class TestUpstreamConcurrency(WeatherTestCase):
+    """Test cases for the cap on AccuWeather requests in flight."""
+    
+    def setUp(self):
+        """Use a client that counts concurrent requests, under a cap of 2."""
+        super().setUp()
+        self.client = CountingClient()
+        limit = weather.UPSTREAM_CONCURRENCY
+        weather.set_upstream_concurrency(2)
+        self.addCleanup(weather.set_upstream_concurrency, limit)
+    
+    def test_batches_and_single_calls_share_the_cap(self):
+        """Test that concurrent batches and single forecasts never exceed the cap together."""
+        cities = ["Paris", "Tokyo", "Rome", "Oslo", "Lima", "Cairo", "Quito", "Perth"]
+        calls = [lambda group=cities[i::2]: weather.get_weather_forecasts(
+                     [{"destination": city, "travel_dates": "2025-06-15"} for city in group])
+                 for i in range(2)]
+        calls += [lambda city=city: weather.get_weather_forecast(city, "2025-06-15")
+                  for city in ("Nice", "Bern", "Riga")]
+        threads = [threading.Thread(target=call) for call in calls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        
+        self.assertEqual(self.client.calls, 2 * (len(cities) + 3))
+        self.assertEqual(self.client.most_in_flight, 2)
+    
+    def test_limit_must_be_positive(self):
+        """Test that a cap below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            weather.set_upstream_concurrency(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
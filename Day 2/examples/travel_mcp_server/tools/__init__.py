@@ -1,8 +1,9 @@
-from .weather import get_weather_forecast
+from .weather import get_weather_forecast, get_weather_forecasts
 from .flight_details import search_flights
 
 __all__ = [
     'get_weather_forecast',
+    'get_weather_forecasts',
     'search_flights',
     # 'get_destination_info',
     # 'search_attractions',
@@ -0,0 +1,332 @@
+"""
+Persistent TTL cache for slow or rate-limited API lookups.
+
+Entries live in a small in-memory LRU for fast repeat hits and in a
+SQLite file, so they survive server restarts. Each entry expires after
+its TTL, optionally staying usable for a while longer as stale data that
+is refreshed in the background. The cache counts hits and misses so its
+effect on API usage can be checked.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+
+# Default on-disk location, next to the .env file (override with TRAVEL_CACHE_PATH)
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent / 'cache.sqlite3'
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a place name for use as a cache key.
+    
+    Case, accents written in composed or decomposed form, extra spaces and
+    spacing around commas are ignored, so "  paris ,France" and
+    "Paris, France" share an entry.
+    
+    Args:
+        name: Place name as given by the user
+    
+    Returns:
+        Normalized name
+    """
+    name = unicodedata.normalize("NFKC", name).casefold()
+    name = " ".join(name.split())
+    return re.sub(r"\s*,\s*", ", ", name).strip(", ")
+
+
+class TTLCache:
+    """
+    LRU cache with per-entry expiry, backed by a SQLite table.
+    
+    Lookups check memory first and fall back to SQLite; values found on
+    disk are promoted to memory. Memory holds at most ``maxsize`` entries,
+    evicting the least recently used; SQLite holds at most ``max_disk_entries``,
+    evicting the least recently stored. Several caches can share one file
+    under different namespaces. The cache is safe to use from several
+    threads.
+    
+    With a ``stale_ttl``, an expired entry is kept that much longer for
+    stale-while-revalidate: get_stale serves it right away, and the caller
+    starts refresh to replace it in the background.
+    """
+    
+    def __init__(self, namespace: str, ttl: float, maxsize: int = 1024,
+                 path: Optional[str] = None, max_disk_entries: int = 100_000,
+                 stale_ttl: float = 0):
+        """
+        Initialize the cache.
+        
+        Args:
+            namespace: Name separating this cache's entries from others in the same file
+            ttl: Default lifetime of an entry, in seconds
+            maxsize: Most entries kept in memory
+            path: SQLite file, or None for TRAVEL_CACHE_PATH or DEFAULT_CACHE_PATH;
+                ":memory:" keeps nothing on disk
+            max_disk_entries: Most entries kept in the file for this namespace
+            stale_ttl: How long past its TTL an entry can still be served stale
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self.path = str(path or os.getenv('TRAVEL_CACHE_PATH') or DEFAULT_CACHE_PATH)
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self._refreshing: set = set()
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        # Rows of this namespace on disk, counted on the first write
+        self._disk_entries: Optional[int] = None
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a live entry.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            The cached value, or None if there is none or it expired
+        """
+        value, fresh = self._lookup(key)
+        return value if fresh else None
+    
+    def get_stale(self, key: str) -> Tuple[Optional[Any], bool]:
+        """
+        Look up an entry, accepting one past its TTL but within ``stale_ttl``.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Tuple of (cached value or None, whether it is still fresh)
+        """
+        return self._lookup(key, stale=True)
+    
+    def refresh(self, key: str, fetch: Callable[[], Optional[Tuple[Any, Optional[float]]]]) -> bool:
+        """
+        Replace an entry in a background thread, unless a refresh is running.
+        
+        Args:
+            key: Cache key
+            fetch: Returns the new ``(value, ttl)``, ttl being None for the
+                default, or None to keep the current entry (e.g. on errors)
+        
+        Returns:
+            Whether a refresh was started
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+        
+        def run():
+            try:
+                fetched = fetch()
+                if fetched is not None:
+                    self.set(key, fetched[0], ttl=fetched[1])
+            except Exception:
+                # The stale entry stays; the next lookup tries again
+                pass
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=run, name=f"refresh-{self.namespace}", daemon=True).start()
+        return True
+    
+    def _lookup(self, key: str, stale: bool = False) -> Tuple[Optional[Any], bool]:
+        """Find an entry and count the lookup, returning (value, fresh)."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                entry = self._load(key)
+                if entry is not None:
+                    self._remember(key, entry)
+            else:
+                self._memory.move_to_end(key)
+            
+            if entry is not None and entry[1] > now:
+                self.hits += 1
+                return entry[0], True
+            if entry is not None and entry[1] + self.stale_ttl > now:
+                if stale:
+                    self.stale_hits += 1
+                    return entry[0], False
+            elif entry is not None:
+                self._forget(key)
+            self.misses += 1
+            return None, False
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """
+        Store an entry in memory and on disk.
+        
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Lifetime in seconds, instead of the cache's default
+        """
+        now = time.time()
+        entry = (value, now + (self.ttl if ttl is None else ttl))
+        with self._lock:
+            self._remember(key, entry)
+            self._store(key, json.dumps(value), entry[1], now)
+    
+    def clear(self):
+        """Remove every entry of this namespace, in memory and on disk."""
+        with self._lock:
+            self._memory.clear()
+            self._write("DELETE FROM cache WHERE namespace = ?", (self.namespace,))
+            self._disk_entries = None
+    
+    def stats(self) -> dict:
+        """
+        Report how well the cache is doing.
+        
+        Returns:
+            Dictionary with hits, stale hits, misses, hit_rate (counting
+            stale hits) and entries in memory
+        """
+        served = self.hits + self.stale_hits
+        lookups = served + self.misses
+        return {
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+    
+    def _remember(self, key: str, entry: tuple):
+        """Put an entry in memory, evicting the least recently used (lock held)."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+    
+    def _forget(self, key: str):
+        """Drop an expired entry from memory and disk (lock held)."""
+        self._memory.pop(key, None)
+        deleted = self._write("DELETE FROM cache WHERE namespace = ? AND key = ?", (self.namespace, key))
+        if deleted and self._disk_entries is not None:
+            self._disk_entries -= deleted
+    
+    def _load(self, key: str) -> Optional[tuple]:
+        """Read an entry from disk (lock held)."""
+        db = self._connect()
+        if db is None:
+            return None
+        try:
+            row = db.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (self.namespace, key)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        return (json.loads(row[0]), row[1]) if row is not None else None
+    
+    def _store(self, key: str, value: str, expires_at: float, now: float):
+        """
+        Write an entry to disk in one transaction (lock held).
+        
+        Only when the namespace grows past ``max_disk_entries`` are entries
+        past their stale TTL purged and then the least recently stored
+        evicted, so a typical write is a single indexed update or insert.
+        Errors are handled as in _write.
+        """
+        db = self._connect()
+        if db is None:
+            return
+        try:
+            if self._disk_entries is None:
+                self._disk_entries = db.execute(
+                    "SELECT COUNT(*) FROM cache WHERE namespace = ?", (self.namespace,)
+                ).fetchone()[0]
+            updated = db.execute(
+                "UPDATE cache SET value = ?, expires_at = ?, stored_at = ? WHERE namespace = ? AND key = ?",
+                (value, expires_at, now, self.namespace, key)
+            ).rowcount
+            if not updated:
+                db.execute(
+                    "INSERT INTO cache (namespace, key, value, expires_at, stored_at) VALUES (?, ?, ?, ?, ?)",
+                    (self.namespace, key, value, expires_at, now)
+                )
+                entries = self._disk_entries + 1
+                if entries > self.max_disk_entries:
+                    entries -= db.execute("DELETE FROM cache WHERE namespace = ? AND expires_at <= ?",
+                                          (self.namespace, now - self.stale_ttl)).rowcount
+                if entries > self.max_disk_entries:
+                    entries -= db.execute(
+                        "DELETE FROM cache WHERE namespace = ? AND key IN (SELECT key FROM cache "
+                        "WHERE namespace = ? ORDER BY stored_at LIMIT ?)",
+                        (self.namespace, self.namespace, entries - self.max_disk_entries)
+                    ).rowcount
+            db.commit()
+        except sqlite3.Error:
+            db.rollback()
+            # Recount once the file is usable again
+            self._disk_entries = None
+            return
+        if not updated:
+            self._disk_entries = entries
+    
+    def _write(self, sql: str, params: tuple) -> int:
+        """
+        Run and commit a statement (lock held).
+        
+        The disk is only a second tier: if it fails, for example because
+        the file is locked or full, the entry stays in memory only.
+        
+        Returns:
+            Number of rows changed, 0 if the statement failed
+        """
+        db = self._connect()
+        if db is None:
+            return 0
+        try:
+            changed = db.execute(sql, params).rowcount
+            db.commit()
+        except sqlite3.Error:
+            db.rollback()
+            return 0
+        return changed
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """
+        Open the SQLite file on first use (lock held).
+        
+        Returns:
+            The connection, or None if the cache is memory-only or the file
+            cannot be opened, in which case the cache keeps working in memory
+        """
+        if self._db is None and self.path != ":memory:":
+            try:
+                db = sqlite3.connect(self.path, check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS cache ("
+                    "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+                    "expires_at REAL NOT NULL, stored_at REAL NOT NULL, "
+                    "PRIMARY KEY (namespace, key))"
+                )
+                # Finds the least recently stored entries to evict without a scan
+                db.execute("CREATE INDEX IF NOT EXISTS cache_stored_at ON cache (namespace, stored_at)")
+                db.commit()
+            except sqlite3.Error:
+                self.path = ":memory:"
+                return None
+            self._db = db
+        return self._db
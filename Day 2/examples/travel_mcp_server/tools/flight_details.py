@@ -10,6 +10,10 @@ import requests
 from datetime import datetime, timedelta
 from pathlib import Path
 from dotenv import load_dotenv
+try:
+    from .http_client import get_client
+except ImportError:  # Run as a script: python tools/flight_details.py
+    from http_client import get_client
 
 
 # Load environment variables
@@ -237,7 +241,7 @@ def search_flights(origin: str, destination: str, departure_date: str) -> dict:
                 "limit": 10
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = get_client().get(url, params=params)
             
             if response.status_code == 401:
                 return {
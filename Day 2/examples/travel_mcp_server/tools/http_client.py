@@ -0,0 +1,209 @@
+"""
+Shared HTTP client for the tools' upstream API calls.
+
+Every call to ``requests.get`` opens a new connection, paying a TCP (and,
+for HTTPS, a TLS) handshake before the request is even sent. The tools
+instead send their requests through one ``requests.Session`` whose
+connection pool keeps connections to each API host open between calls.
+
+The pool is configured from the environment (or with configure()):
+
+- TRAVEL_HTTP_POOL_HOSTS: how many hosts keep a pool of their own (10)
+- TRAVEL_HTTP_POOL_PER_HOST: connections kept open per host (10)
+- TRAVEL_HTTP_POOL_BLOCK: "1" to make calls wait for a free connection
+  instead of opening extra, unpooled ones when a host's are all busy (0)
+- TRAVEL_HTTP_KEEP_ALIVE: "0" to close every connection after its
+  request, as unpooled calls do (1)
+- TRAVEL_HTTP_CONNECT_TIMEOUT: seconds to wait for a connection (3.05)
+- TRAVEL_HTTP_READ_TIMEOUT: seconds to wait for the server to answer (10)
+"""
+
+import os
+import threading
+from typing import Optional, Union, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_POOL_HOSTS = 10
+DEFAULT_POOL_PER_HOST = 10
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 10.0
+
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """
+    Read a boolean setting such as "1", "0", "true" or "no".
+    
+    Raises:
+        ValueError: If the variable is set to something else
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    if value.strip().lower() in _TRUE:
+        return True
+    if value.strip().lower() in _FALSE:
+        return False
+    raise ValueError(f"Invalid {name}={value!r}: expected one of {', '.join(_TRUE + _FALSE)}")
+
+
+def env_number(name: str, default, convert=float):
+    """
+    Read a positive number setting.
+    
+    Raises:
+        ValueError: If the variable is set to something else
+    """
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        number = convert(value.strip())
+    except ValueError:
+        number = None
+    if number is None or not number > 0:
+        kind = "whole number" if convert is int else "number"
+        raise ValueError(f"Invalid {name}={value!r}: expected a positive {kind}")
+    return number
+
+
+class HTTPClient:
+    """
+    Connection-pooled HTTP client with split connect and read timeouts.
+    
+    One client is meant to be shared by all tools, including from several
+    threads: the pool hands each concurrent request its own connection.
+    Before reusing a connection the pool checks that the server has not
+    closed it while idle, and opens a new one if it has.
+    """
+    
+    def __init__(self, pool_hosts: int = DEFAULT_POOL_HOSTS,
+                 pool_per_host: int = DEFAULT_POOL_PER_HOST,
+                 pool_block: bool = False, keep_alive: bool = True,
+                 connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+                 read_timeout: float = DEFAULT_READ_TIMEOUT):
+        """
+        Initialize the client.
+        
+        Args:
+            pool_hosts: How many hosts keep a connection pool of their own
+            pool_per_host: Most idle connections kept open per host
+            pool_block: Wait for a free connection rather than opening an
+                extra, unpooled one when all of a host's are busy
+            keep_alive: Keep connections open between requests
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait between bytes of the response
+        
+        Raises:
+            ValueError: If a pool size or timeout is not positive
+        """
+        if pool_hosts < 1 or pool_per_host < 1:
+            raise ValueError("Pool sizes must be at least 1")
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("Timeouts must be positive")
+        self.pool_hosts = pool_hosts
+        self.pool_per_host = pool_per_host
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = (connect_timeout, read_timeout)
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_per_host,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+    
+    def get(self, url: str, params: Optional[dict] = None,
+            timeout: Union[float, Tuple[float, float], None] = None) -> requests.Response:
+        """
+        Send a GET request over a pooled connection.
+        
+        Args:
+            url: URL to fetch
+            params: Query string parameters
+            timeout: ``(connect, read)`` seconds, or one value for both,
+                instead of the client's
+        
+        Returns:
+            The response, with its body read
+        
+        Raises:
+            requests.exceptions.Timeout: If connecting or reading timed out
+            requests.exceptions.ConnectionError: If the host cannot be reached
+        """
+        return self.session.get(url, params=params, timeout=timeout or self.timeout)
+    
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+    
+    @classmethod
+    def from_env(cls) -> "HTTPClient":
+        """
+        Create a client configured from TRAVEL_HTTP_* environment variables.
+        
+        Returns:
+            New client, with defaults for unset variables
+        
+        Raises:
+            ValueError: If a variable is set to an invalid value, naming it
+        """
+        return cls(
+            pool_hosts=env_number("TRAVEL_HTTP_POOL_HOSTS", DEFAULT_POOL_HOSTS, int),
+            pool_per_host=env_number("TRAVEL_HTTP_POOL_PER_HOST", DEFAULT_POOL_PER_HOST, int),
+            pool_block=env_flag("TRAVEL_HTTP_POOL_BLOCK", False),
+            keep_alive=env_flag("TRAVEL_HTTP_KEEP_ALIVE", True),
+            connect_timeout=env_number("TRAVEL_HTTP_CONNECT_TIMEOUT", DEFAULT_CONNECT_TIMEOUT),
+            read_timeout=env_number("TRAVEL_HTTP_READ_TIMEOUT", DEFAULT_READ_TIMEOUT),
+        )
+
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    """
+    Get the shared client, creating it from the environment on first use.
+    
+    Returns:
+        The client used by all tools
+    
+    Raises:
+        ValueError: If a TRAVEL_HTTP_* variable is invalid (see HTTPClient.from_env)
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient.from_env()
+        return _client
+
+
+def configure(**settings) -> HTTPClient:
+    """
+    Replace the shared client with one using the given settings.
+    
+    Args:
+        **settings: HTTPClient arguments; the rest keep their defaults
+    
+    Returns:
+        The new shared client
+    """
+    global _client
+    client = HTTPClient(**settings)
+    with _client_lock:
+        previous, _client = _client, client
+    if previous is not None:
+        previous.close()
+    return client
@@ -1,8 +1,19 @@
 import os
+import re
+import threading
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
 from pathlib import Path
 from dotenv import load_dotenv
+try:
+    from .cache import TTLCache, normalize_name
+    from .http_client import get_client
+except ImportError:  # Run as a script: python tools/weather.py
+    from cache import TTLCache, normalize_name
+    from http_client import get_client
 
 
 # Load environment variables from .env file
@@ -16,17 +27,77 @@ ACCUWEATHER_API_KEY = os.getenv('ACCUWEATHER_API_KEY')
 # AccuWeather API base URL
 ACCUWEATHER_BASE_URL = "http://dataservice.accuweather.com"
 
+# City to location key mappings almost never change, so they are cached
+# for a month (names AccuWeather does not know, for a day) and survive
+# restarts; every hit saves a call from the daily API quota
+LOCATION_KEY_TTL = 30 * 24 * 3600
+LOCATION_NOT_FOUND_TTL = 24 * 3600
+LOCATION_CACHE = TTLCache("location_keys", ttl=LOCATION_KEY_TTL)
+
+# Forecasts are cached for as long as AccuWeather's Cache-Control or
+# Expires header says (within these bounds, or an hour without one). For
+# a few hours past that they are still served at once, while a background
+# refresh fetches the new forecast for the next caller.
+FORECAST_TTL = 3600
+FORECAST_MIN_TTL = 5 * 60
+FORECAST_MAX_TTL = 12 * 3600
+FORECAST_STALE_TTL = 6 * 3600
+FORECAST_CACHE = TTLCache("forecasts", ttl=FORECAST_TTL, stale_ttl=FORECAST_STALE_TTL)
+
+# Most AccuWeather requests in flight at once, across single and batch
+# forecasts alike (the server sets it from TRAVEL_WEATHER_CONCURRENCY)
+UPSTREAM_CONCURRENCY = 4
+_upstream_limit = threading.BoundedSemaphore(UPSTREAM_CONCURRENCY)
+
+# Batch forecasts: most destinations per request (each distinct one may
+# cost two API calls), fanned out over one pool shared by all batches
+BATCH_MAX_DESTINATIONS = 10
+BATCH_WORKERS = 5
+_batch_pool = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="forecasts")
+
+
+def set_upstream_concurrency(limit: int):
+    """
+    Set how many AccuWeather requests may be in flight at once.
+    
+    Args:
+        limit: Most concurrent requests; requests already in flight finish
+            under the previous limit
+    
+    Raises:
+        ValueError: If limit is less than 1
+    """
+    global UPSTREAM_CONCURRENCY, _upstream_limit
+    if limit < 1:
+        raise ValueError("Upstream concurrency must be at least 1")
+    UPSTREAM_CONCURRENCY = limit
+    _upstream_limit = threading.BoundedSemaphore(limit)
+
+
+def _upstream_get(url: str, params: dict):
+    """Send an AccuWeather request, waiting while UPSTREAM_CONCURRENCY others are in flight."""
+    with _upstream_limit:
+        return get_client().get(url, params=params)
+
 
 def get_location_key(city_name: str) -> dict:
     """
     Get AccuWeather location key for a city.
     
+    Results are cached by normalized city name (see LOCATION_CACHE), so
+    repeat lookups make no API call.
+    
     Args:
         city_name: Name of the city to search for
     
     Returns:
         Dictionary with status and either location data or error message
     """
+    cache_key = normalize_name(city_name)
+    cached = LOCATION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     if not ACCUWEATHER_API_KEY:
         return {
             "status": "error",
@@ -40,7 +111,7 @@ def get_location_key(city_name: str) -> dict:
             "q": city_name
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _upstream_get(url, params)
         
         # Check for API errors
         if response.status_code == 401:
@@ -62,20 +133,24 @@ def get_location_key(city_name: str) -> dict:
         locations = response.json()
         
         if not locations or len(locations) == 0:
-            return {
+            result = {
                 "status": "error",
                 "error_message": f"Location '{city_name}' not found. Please check the city name and try again with a more specific name (e.g., 'Paris, France')."
             }
+            LOCATION_CACHE.set(cache_key, result, ttl=LOCATION_NOT_FOUND_TTL)
+            return result
         
         # Return the first (most relevant) location
         location = locations[0]
-        return {
+        result = {
             "status": "success",
             "location_key": location["Key"],
             "city_name": location["LocalizedName"],
             "country": location["Country"]["LocalizedName"],
             "administrative_area": location.get("AdministrativeArea", {}).get("LocalizedName", "")
         }
+        LOCATION_CACHE.set(cache_key, result)
+        return result
         
     except requests.exceptions.Timeout:
         return {
@@ -98,12 +173,72 @@ def get_forecast(location_key: str) -> dict:
     """
     Get 5-day weather forecast from AccuWeather.
     
+    Forecasts are cached by location key (see FORECAST_CACHE). A forecast
+    past its TTL is still returned immediately while it is refreshed in
+    the background, so only the first request for a location waits for
+    the network.
+    
     Args:
         location_key: AccuWeather location key
     
     Returns:
         Dictionary with status and either forecast data or error message
     """
+    cached, fresh = FORECAST_CACHE.get_stale(location_key)
+    if cached is not None:
+        if not fresh:
+            FORECAST_CACHE.refresh(location_key, lambda: _cacheable(fetch_forecast(location_key)))
+        return cached
+    
+    result = fetch_forecast(location_key)
+    cacheable = _cacheable(result)
+    if cacheable is not None:
+        FORECAST_CACHE.set(location_key, *cacheable)
+    return result
+
+
+def _cacheable(result: dict):
+    """Split a fetched forecast into the (result, TTL) to cache, or None for errors."""
+    if result["status"] != "success":
+        return None
+    max_age = result.pop("max_age", None)
+    ttl = FORECAST_TTL if max_age is None else min(max(max_age, FORECAST_MIN_TTL), FORECAST_MAX_TTL)
+    return result, ttl
+
+
+def _max_age(headers) -> Optional[float]:
+    """
+    Get how long a response may be cached, from its HTTP headers.
+    
+    Args:
+        headers: Response headers
+    
+    Returns:
+        Seconds from Cache-Control max-age or Expires, or None if neither is usable
+    """
+    match = re.search(r"max-age=(\d+)", headers.get("Cache-Control", ""))
+    if match:
+        return float(match.group(1))
+    try:
+        expires = parsedate_to_datetime(headers["Expires"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if expires.tzinfo is None:
+        expires = expires.replace(tzinfo=timezone.utc)
+    return (expires - datetime.now(timezone.utc)).total_seconds()
+
+
+def fetch_forecast(location_key: str) -> dict:
+    """
+    Fetch the 5-day weather forecast from AccuWeather, bypassing the cache.
+    
+    Args:
+        location_key: AccuWeather location key
+    
+    Returns:
+        Dictionary with status and either forecast data (and the max_age
+        AccuWeather allows caching it for, if it says) or error message
+    """
     if not ACCUWEATHER_API_KEY:
         return {
             "status": "error",
@@ -118,7 +253,7 @@ def get_forecast(location_key: str) -> dict:
             "metric": "true"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _upstream_get(url, params)
         
         if response.status_code == 401:
             return {
@@ -139,7 +274,8 @@ def get_forecast(location_key: str) -> dict:
         forecast_data = response.json()
         return {
             "status": "success",
-            "forecast": forecast_data
+            "forecast": forecast_data,
+            "max_age": _max_age(response.headers)
         }
         
     except requests.exceptions.Timeout:
@@ -159,6 +295,19 @@ def get_forecast(location_key: str) -> dict:
         }
 
 
+def get_cache_stats() -> dict:
+    """
+    Get hit and miss counters of the weather tool's caches.
+    
+    Returns:
+        Dictionary of cache statistics by cache name
+    """
+    return {
+        "location_keys": LOCATION_CACHE.stats(),
+        "forecasts": FORECAST_CACHE.stats()
+    }
+
+
 def generate_packing_suggestions(temp_min: float, temp_max: float, conditions: str) -> list:
     """
     Generate packing suggestions based on weather conditions.
@@ -244,19 +393,31 @@ def get_weather_forecast(destination: str, travel_dates: str) -> dict:
     if location_result["status"] == "error":
         return location_result
     
-    location_key = location_result["location_key"]
-    city_name = location_result["city_name"]
-    country = location_result["country"]
-    
     # Step 2: Get weather forecast
-    forecast_result = get_forecast(location_key)
+    forecast_result = get_forecast(location_result["location_key"])
     
     if forecast_result["status"] == "error":
         return forecast_result
     
-    forecast_data = forecast_result["forecast"]
-    
     # Step 3: Process forecast data
+    return summarize_forecast(location_result, forecast_result["forecast"], travel_dates)
+
+
+def summarize_forecast(location: dict, forecast_data: dict, travel_dates: str) -> dict:
+    """
+    Build the weather tool's response from a location and its raw forecast.
+    
+    Args:
+        location: Successful result of get_location_key
+        forecast_data: AccuWeather daily forecast, as returned by get_forecast
+        travel_dates: Travel dates to report
+    
+    Returns:
+        Dictionary as described in get_weather_forecast, with status "success"
+    """
+    city_name = location["city_name"]
+    country = location["country"]
+    
     daily_forecasts = []
     all_temps_min = []
     all_temps_max = []
@@ -322,6 +483,86 @@ def get_weather_forecast(destination: str, travel_dates: str) -> dict:
     }
 
 
+def get_weather_forecasts(trips: list) -> dict:
+    """
+    Get weather forecasts for several destinations at once, e.g. to compare them.
+    
+    Location keys, then forecasts, are fetched concurrently (within
+    UPSTREAM_CONCURRENCY, shared with single forecasts), each only once:
+    a city listed several times (with any dates or spelling differences
+    that normalize_name ignores) is looked up once, and names resolving to
+    the same location share one forecast. A destination that fails gets an
+    error entry without affecting the others.
+    
+    Args:
+        trips: List of {"destination": ..., "travel_dates": ...} dictionaries,
+            as taken by get_weather_forecast
+    
+    Returns:
+        Dictionary containing:
+        - status: "success" if every destination succeeded, "partial" if
+          some did, "error" if none did or the request itself is invalid
+        - succeeded, failed: Number of destinations of each outcome
+        - results: One get_weather_forecast result per trip, in order, with
+          "query" holding the trip as requested
+        - error_message: Only present if the request itself is invalid
+    """
+    if not isinstance(trips, list) or not trips:
+        return {
+            "status": "error",
+            "error_message": "Please provide a non-empty list of trips, each with 'destination' and 'travel_dates'."
+        }
+    if len(trips) > BATCH_MAX_DESTINATIONS:
+        return {
+            "status": "error",
+            "error_message": f"Too many destinations: {len(trips)} (at most {BATCH_MAX_DESTINATIONS} per request)."
+        }
+    
+    queries = []
+    for trip in trips:
+        trip = trip if isinstance(trip, dict) else {}
+        queries.append((str(trip.get("destination") or "").strip(), str(trip.get("travel_dates") or "").strip()))
+    # Distinct cities, each looked up under the first spelling given
+    names = {}
+    for destination, dates in queries:
+        if destination and dates:
+            names.setdefault(normalize_name(destination), destination)
+    
+    # Step 1: Location keys, one lookup per distinct city
+    locations = dict(zip(names, _batch_pool.map(get_location_key, names.values())))
+    
+    # Step 2: Forecasts, one request per distinct location
+    keys = list(dict.fromkeys(location["location_key"] for location in locations.values()
+                              if location["status"] == "success"))
+    forecasts = dict(zip(keys, _batch_pool.map(get_forecast, keys)))
+    
+    # Step 3: One response per trip
+    results = []
+    for destination, dates in queries:
+        if not destination or not dates:
+            result = {
+                "status": "error",
+                "error_message": "Missing required parameters. Please provide both 'destination' and 'travel_dates'."
+            }
+        else:
+            location = locations[normalize_name(destination)]
+            forecast = forecasts[location["location_key"]] if location["status"] == "success" else location
+            if forecast["status"] == "error":
+                result = dict(forecast)
+            else:
+                result = summarize_forecast(location, forecast["forecast"], dates)
+        result["query"] = {"destination": destination, "travel_dates": dates}
+        results.append(result)
+    
+    succeeded = sum(result["status"] == "success" for result in results)
+    return {
+        "status": "success" if succeeded == len(results) else "partial" if succeeded else "error",
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "results": results
+    }
+
+
 # Example usage for testing
 if __name__ == "__main__":
     print("=" * 70)
@@ -364,4 +605,10 @@ if __name__ == "__main__":
     else:
         print(f"⚠️  Expected error but got success")
     
+    print("\n" + "-" * 70)
+    print("Test 3: Repeat destination (served from the location cache)")
+    print("-" * 70)
+    get_weather_forecast("paris", "2025-06-15 to 2025-06-22")
+    print(f"   Cache stats: {get_cache_stats()}")
+    
     print("\n" + "=" * 70)